@@ -0,0 +1,55 @@
+"""Lower a synthetic design with hundreds of implementations with and without worker processes.
+
+Run with `python benchmarks/ir2vhdl_parallel_bench.py [jobs]`.
+"""
+
+import os
+import sys
+import time
+
+from elasticai.creator.ir2vhdl import Code, Implementation, Ir2Vhdl, vhdl_node
+
+
+def linear(impl: Implementation) -> Code:
+    lines = [f"entity {impl.name} is"]
+    for n in impl.nodes.values():
+        for i in range(n.input_shape.size()):
+            lines.append(f"  signal {n.name}_{i} : std_logic_vector(7 downto 0);")
+    lines.append(f"end entity {impl.name};")
+    return impl.name, lines
+
+
+def design(num_implementations: int, num_nodes: int) -> list[Implementation]:
+    return [
+        Implementation(
+            name=f"linear_{i}",
+            type="linear",
+            attributes={},
+            nodes=(
+                vhdl_node(
+                    name=f"n{j}",
+                    type="linear",
+                    implementation="linear",
+                    input_shape=(1, 64),
+                    output_shape=(1, 64),
+                )
+                for j in range(num_nodes)
+            ),
+        )
+        for i in range(num_implementations)
+    ]
+
+
+def main() -> None:
+    jobs = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    lower = Ir2Vhdl()
+    lower.register(linear)
+    impls = design(400, 50)
+    for j in (1, jobs):
+        start = time.perf_counter()
+        code = list(lower(impls, jobs=j))
+        print(f"jobs={j}: {time.perf_counter() - start:.2f}s for {len(code)} files")
+
+
+if __name__ == "__main__":
+    main()
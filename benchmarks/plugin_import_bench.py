@@ -0,0 +1,100 @@
+"""Compare loading many ir2vhdl plugins eagerly and lazily when only a few of their types are lowered.
+
+Each generated plugin module defines many type handlers, so importing it
+takes noticeable time. Both variants run in a fresh interpreter.
+
+Run with `python benchmarks/plugin_import_bench.py`.
+"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+NUM_PLUGINS = 40
+HANDLERS_PER_PLUGIN = 200
+
+META = """[[plugins]]
+name = "{name}"
+target_platform = "bench"
+target_runtime = "vhdl"
+version = "0.1"
+api_version = "0.1"
+generated = [{generated}]
+static_files = []
+"""
+
+HANDLER = '''
+@type_handler
+def {name}(impl: Implementation) -> Code:
+    """Handler {name}."""
+    lines = [f"-- {{impl.name}}"]
+    for key, value in impl.attributes.items():
+        lines.append(f"-- {{key}}: {{value}}")
+    return impl.name, lines
+'''
+
+RUN = """
+import time
+start = time.perf_counter()
+from elasticai.creator import plugin as _pl
+from elasticai.creator.ir2vhdl import Implementation, Ir2Vhdl, PluginLoader
+
+lower = Ir2Vhdl()
+packages = [f"bench_plugin_{{i}}" for i in range({num_plugins})]
+for package in packages:
+    if {eager}:
+        for spec in _pl.read_plugin_dicts_from_package(package):
+            for symbol in _pl.import_symbols(package, spec["generated"]):
+                symbol.load_into(lower)
+    else:
+        PluginLoader(lower).load_from_package(package)
+impls = [
+    Implementation(name=f"i{{i}}", type=f"p{{i}}_h0", attributes={{}})
+    for i in range(3)
+]
+list(lower(impls))
+print(time.perf_counter() - start)
+"""
+
+
+def write_plugins(root: Path) -> None:
+    for i in range(NUM_PLUGINS):
+        package = root / f"bench_plugin_{i}"
+        package.mkdir()
+        names = [f"p{i}_h{j}" for j in range(HANDLERS_PER_PLUGIN)]
+        (package / "meta.toml").write_text(
+            META.format(name=package.name, generated=", ".join(f'"{n}"' for n in names))
+        )
+        (package / "__init__.py").write_text(
+            "from elasticai.creator.ir2vhdl import Code, Implementation, type_handler\n"
+            + "".join(HANDLER.format(name=n) for n in names)
+        )
+
+
+def run(root: Path, eager: bool) -> float:
+    code = RUN.format(num_plugins=NUM_PLUGINS, eager=eager)
+    env_path = f"{root}:{Path(__file__).parents[1]}"
+    result = subprocess.run(
+        [sys.executable, "-B", "-c", code],
+        env={"PYTHONPATH": env_path},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_plugins(root)
+        for label, eager in (("eager", True), ("lazy", False)):
+            t = min(run(root, eager) for _ in range(3))
+            print(
+                f"{label:>5}: {t * 1000:.0f} ms for {NUM_PLUGINS} plugins, 3 types lowered"
+            )
+
+
+if __name__ == "__main__":
+    main()
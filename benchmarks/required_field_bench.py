@@ -0,0 +1,34 @@
+"""Compare reading `VhdlNode.input_shape` through a cached and an uncached field.
+
+Run with `python benchmarks/required_field_bench.py`.
+"""
+
+import timeit
+
+from elasticai.creator.ir import RequiredField
+from elasticai.creator.ir.helpers import Shape, ShapeTuple
+from elasticai.creator.ir2vhdl import VhdlNode
+
+
+class UncachedVhdlNode(VhdlNode):
+    input_shape: RequiredField[ShapeTuple, Shape] = RequiredField(
+        set_convert=lambda x: x.to_tuple(), get_convert=Shape.from_tuple
+    )
+
+
+def main() -> None:
+    data = dict(
+        name="conv",
+        type="conv",
+        implementation="conv",
+        input_shape=(3, 32),
+        output_shape=(8, 30),
+    )
+    for label, cls in (("uncached", UncachedVhdlNode), ("cached", VhdlNode)):
+        n = cls(dict(data))
+        t = min(timeit.repeat(lambda: n.input_shape.width, number=100_000, repeat=5))
+        print(f"{label:>8}: {t * 10:.3f} us per read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Time the ASAP/ALAP scheduling of a layered graph with tens of thousands of nodes.
+
+Run with `python benchmarks/scheduler_bench.py`.
+"""
+
+import random
+import timeit
+
+from elasticai.creator.ir import Graph, edge, node
+from elasticai.creator.ir.scheduling import Scheduler
+
+
+def layered_graph(num_nodes: int, width: int) -> Graph:
+    rng = random.Random(0)
+    g: Graph = Graph(
+        nodes=(node(f"n{i}", rng.choice(("add", "mul")), {}) for i in range(num_nodes))
+    )
+    g.add_edges(
+        edge(f"n{i - width - rng.randrange(width)}", f"n{i}")
+        for i in range(2 * width, num_nodes)
+        for _ in range(2)
+    )
+    return g
+
+
+def main() -> None:
+    scheduler = Scheduler(default_latency=1)
+    scheduler.register("mul", lambda n: 3)
+    for num_nodes in (10_000, 50_000):
+        g = layered_graph(num_nodes, width=50)
+        g.topological_order()
+        t = min(timeit.repeat(lambda: scheduler(g), number=1, repeat=5))
+        print(f"{num_nodes:>6} nodes: {t * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Compare `PortMap.from_dict` with the signal parsing before the compiled alternation.
+
+The previous implementation is loaded from the git history
+(`PREVIOUS_REVISION`), so the benchmark runs the exact code that was
+replaced. Every port map uses its own signal names, as in a design with
+many instances. Run with `python benchmarks/signal_parsing_bench.py`
+from within the git checkout.
+"""
+
+import subprocess
+import timeit
+import types
+from pathlib import Path
+
+from elasticai.creator.ir2vhdl import PortMap
+
+PREVIOUS_REVISION = "321620a~1"
+
+
+def load_previous_ir2vhdl() -> types.ModuleType:
+    source = subprocess.run(
+        ["git", "show", f"{PREVIOUS_REVISION}:elasticai/creator/ir2vhdl.py"],
+        cwd=Path(__file__).parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    module = types.ModuleType("previous_ir2vhdl")
+    exec(compile(source, "previous_ir2vhdl.py", "exec"), module.__dict__)
+    return module
+
+
+def port_maps(num_instances: int) -> list[dict[str, str]]:
+    return [
+        {
+            "clk": "signal clk : std_logic := '0';",
+            "enable": f"signal enable_{i} : std_logic := '0';",
+            "d_in": f"signal d_in_{i} : std_logic_vector({8 + i % 8} - 1 downto 0) := (others => '0');",
+            "d_out": f"signal d_out_{i} : std_logic_vector({8 + i % 8} - 1 downto 0) := (others => '0');",
+        }
+        for i in range(num_instances)
+    ]
+
+
+def main() -> None:
+    previous_port_map = load_previous_ir2vhdl().PortMap
+    maps = port_maps(5_000)
+    for m in maps[:10]:
+        assert list(previous_port_map.from_dict(m).as_dict().items()) == list(
+            PortMap.from_dict(m).as_dict().items()
+        )
+
+    for label, port_map in (("previous", previous_port_map), ("current", PortMap)):
+        t = min(
+            timeit.repeat(
+                lambda: [port_map.from_dict(m) for m in maps], number=1, repeat=5
+            )
+        )
+        print(f"{label:>8}: {t * 1000:.1f} ms for {len(maps)} port maps")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compare the two pass template expansion with the compiled templates of `TemplateExpander`.
+
+Every variable of the templates is filled with a single line value, the
+first variable is additionally expanded to several lines in a second run.
+
+Run with `python benchmarks/template_expansion_bench.py`.
+"""
+
+import timeit
+
+from elasticai.creator.file_generation.template import (
+    InProjectTemplate,
+    TemplateExpander,
+    _expand_multiline_template,
+    _expand_template,
+    _extract_template_variables,
+    _split_single_and_multiline_parameters,
+)
+
+TEMPLATES = (
+    ("elasticai.creator.nn.fixed_point.linear", "linear.tpl.vhd"),
+    ("elasticai.creator.nn.fixed_point.lstm.design", "lstm_cell.tpl.vhd"),
+)
+
+
+def two_pass(template: InProjectTemplate) -> list[str]:
+    _extract_template_variables(template.content)
+    _extract_template_variables(template.content)
+    single, multi = _split_single_and_multiline_parameters(template.parameters)
+    lines = _expand_template(template.content, **single)
+    return list(_expand_multiline_template(lines, **multi))
+
+
+def compiled(template: InProjectTemplate) -> list[str]:
+    return TemplateExpander(template).lines()
+
+
+def main() -> None:
+    for package, file_name in TEMPLATES:
+        template = InProjectTemplate(package, file_name, {})
+        variables = sorted(_extract_template_variables(template.content))
+        single_line = {name: "16" for name in variables}
+        multi_line = single_line | {variables[0]: [f"value_{i}" for i in range(8)]}
+        for label, parameters in (("single", single_line), ("multi", multi_line)):
+            template.parameters = dict(parameters)
+            assert two_pass(template) == compiled(template)
+            times = [
+                min(timeit.repeat(lambda: fn(template), number=200, repeat=5)) / 200
+                for fn in (two_pass, compiled)
+            ]
+            print(
+                f"{file_name:<18} {label:<6}: two pass {times[0] * 1e6:6.0f} us,"
+                f" compiled {times[1] * 1e6:6.0f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,116 @@
-from collections.abc import Iterator
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from importlib import resources
+from importlib.resources.abc import Traversable
 from pathlib import Path, PurePath
-from typing import ContextManager
+from threading import Lock
+from typing import ContextManager, NamedTuple
 
 PathType = str | PurePath
 Package = resources.Package
 
 
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class ResourceCache:
+    """Process wide cache for the text of package resources, e.g., the files read by `InProjectTemplate`.
+
+    The names of the files in a package are indexed when the package is
+    accessed for the first time. The lines of up to `maxsize` files are
+    kept, the least recently used file is evicted first. Resources are
+    expected not to change while the process is running, call `clear`
+    otherwise.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self._maxsize = maxsize
+        self._names: dict[str, dict[str, Traversable]] = {}
+        self._lines: OrderedDict[tuple[str, str], tuple[str, ...]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    def find(self, package: Package, file_name: str) -> Traversable:
+        names = self._index(package)
+        if file_name not in names:
+            raise FileNotFoundError(
+                f"The file '{file_name}' in package '{package}' does not exist."
+            )
+        return names[file_name]
+
+    def read_lines(self, package: Package, file_name: str) -> tuple[str, ...]:
+        key = (_package_name(package), file_name)
+        with self._lock:
+            lines = self._lines.get(key)
+            if lines is not None:
+                self._hits += 1
+                self._lines.move_to_end(key)
+                return lines
+            self._misses += 1
+        with self.find(package, file_name).open("r") as opened_file:
+            lines = tuple(line.rstrip("\n") for line in opened_file)
+        with self._lock:
+            self._lines[key] = lines
+            while len(self._lines) > self._maxsize:
+                self._lines.popitem(last=False)
+        return lines
+
+    def warm(self, package: Package, file_names: Iterable[str] | None = None) -> None:
+        """Read `file_names`, by default all files of `package` except python sources, before they are needed."""
+        if file_names is None:
+            file_names = [
+                name
+                for name, r in self._index(package).items()
+                if r.is_file() and not name.endswith(".py")
+            ]
+        for name in file_names:
+            self.read_lines(package, name)
+
+    def _index(self, package: Package) -> dict[str, Traversable]:
+        package = _package_name(package)
+        with self._lock:
+            names = self._names.get(package)
+        if names is None:
+            names = {r.name: r for r in resources.files(package).iterdir()}
+            with self._lock:
+                self._names[package] = names
+        return names
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._lines), self._maxsize)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._names.clear()
+            self._lines.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+resource_cache = ResourceCache()
+"""The cache used by `get_file_from_package` and `read_text`."""
+
+
+def _package_name(package: Package) -> str:
+    return package if isinstance(package, str) else package.__name__
+
+
 def get_file_from_package(package: Package, file_name: str) -> ContextManager[Path]:
     """
     This is a context manager, because the returned file might be extracted from a zip file and the context manager
     will take care of removing the resulting temporary files on __exit__
     """
-    for resource in resources.files(package).iterdir():
-        if resource.name == file_name:
-            return resources.as_file(resource)
-    raise FileNotFoundError(
-        f"The file '{file_name}' in package '{package}' does not exist."
-    )
+    return resources.as_file(resource_cache.find(package, file_name))
 
 
 def read_text(package: Package, file_name: str) -> Iterator[str]:
-    with get_file_from_package(package, file_name) as file:
-        with open(file, "r") as opened_file:
-            yield from map(lambda line: line.rstrip("\n"), opened_file)
+    yield from resource_cache.read_lines(package, file_name)
 
 
 def _read_bytes(package: Package, file_name: str) -> Iterator[bytes]:
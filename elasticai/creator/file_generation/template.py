@@ -1,6 +1,7 @@
 import re
 from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import repeat
 from string import Template as StringTemplate
 from typing import Protocol, cast
@@ -27,6 +28,83 @@ class InProjectTemplate(Template):
         self.content = list(read_text(self.package, self.file_name))
 
 
+class CompiledTemplate:
+    """Template content parsed once into literal segments and placeholders.
+
+    Each line is stored as alternating literals and placeholder names,
+    starting and ending with a literal. Rendering gives the same result
+    as expanding the single line parameters with `string.Template` and
+    afterward the multi line parameters, but in a single pass.
+
+    The original two pass expansion is used for
+    * templates with `$$` or a `$` that does not start a placeholder
+    * templates with a `$name` directly followed by another placeholder
+    * single line values that contain `$`
+    """
+
+    def __init__(self, content: Iterable[str]) -> None:
+        self.content = tuple(content)
+        self.variables = frozenset(_extract_template_variables(list(self.content)))
+        self._lines: list[tuple[str, ...]] = []
+        self._raw: list[tuple[str, ...]] = []
+        self._is_plain = True
+        for line in self.content:
+            parts: list[str] = []
+            raw: list[str] = []
+            start = 0
+            for m in StringTemplate.pattern.finditer(line):
+                name = m.group("named") or m.group("braced")
+                if name is None or (
+                    m.group("named") is not None and line.startswith("$", m.end())
+                ):
+                    self._is_plain = False
+                if name is None:
+                    continue
+                parts.extend((line[start : m.start()], name))
+                raw.append(m.group())
+                start = m.end()
+            parts.append(line[start:])
+            self._lines.append(tuple(parts))
+            self._raw.append(tuple(raw))
+
+    def render(
+        self,
+        single_line: Mapping[str, str],
+        multi_line: Mapping[str, Iterable[str]],
+    ) -> Iterator[str]:
+        if not self._is_plain or any("$" in v for v in single_line.values()):
+            lines = _expand_template(self.content, **single_line)
+            yield from _expand_multiline_template(lines, **multi_line)
+            return
+        for line, parts, raw in zip(self.content, self._lines, self._raw):
+            if len(parts) == 1:
+                yield line
+                continue
+            filled = [
+                single_line.get(part, raw[i // 2]) if i % 2 else part
+                for i, part in enumerate(parts)
+            ]
+            text = "".join(filled)
+            key = next(
+                (k for k in multi_line if f"${k}" in text or f"${{{k}}}" in text),
+                None,
+            )
+            if key is None:
+                yield text
+                continue
+            slots = [i for i in range(1, len(parts), 2) if parts[i] == key]
+            for value in multi_line[key]:
+                for i in slots:
+                    filled[i] = value
+                yield "".join(filled)
+
+
+@lru_cache(maxsize=256)
+def compile_template(content: tuple[str, ...]) -> CompiledTemplate:
+    """Compile `content` or return the cached result for equal content."""
+    return CompiledTemplate(content)
+
+
 class TemplateExpander:
     def __init__(self, template: Template) -> None:
         super().__init__()
@@ -38,17 +116,18 @@ class TemplateExpander:
         single_line_params, multi_line_params = _split_single_and_multiline_parameters(
             self._template.parameters
         )
-        lines = _expand_template(self._template.content, **single_line_params)
-        lines = _expand_multiline_template(lines, **multi_line_params)
-        return list(lines)
+        return list(self._compiled().render(single_line_params, multi_line_params))
 
     def unfilled_variables(self) -> set[str]:
-        template_variables = _extract_template_variables(self._template.content)
+        template_variables = set(self._compiled().variables)
         variables_to_fill = set(self._template.parameters.keys())
         return template_variables - variables_to_fill
 
+    def _compiled(self) -> CompiledTemplate:
+        return compile_template(tuple(self._template.content))
+
     def _assert_all_variables_to_fill_exists(self) -> None:
-        template_variables = _extract_template_variables(self._template.content)
+        template_variables = self._compiled().variables
         variables_to_fill = set(self._template.parameters.keys())
         not_existing_variables = variables_to_fill - template_variables
         if len(not_existing_variables) > 0:
@@ -1,5 +1,6 @@
 __all__ = [
     "RequiredField",
+    "CachedRequiredField",
     "SimpleRequiredField",
     "IrData",
     "IrDataMeta",
@@ -10,10 +11,12 @@ __all__ = [
     "LoweringPass",
     "Lowerable",
     "Graph",
+    "ArrayAttribute",
 ]
+from .array_attribute import ArrayAttribute
 from .core import Edge, Node, edge, node
 from .graph import Graph
 from .ir_data import IrData
 from .ir_data_meta import IrDataMeta
 from .lowering import Lowerable, LoweringPass
-from .required_field import RequiredField, SimpleRequiredField
+from .required_field import CachedRequiredField, RequiredField, SimpleRequiredField
@@ -0,0 +1,89 @@
+import hashlib
+from typing import Any
+
+import numpy as np
+
+
+class ArrayAttribute:
+    """Immutable numeric array to store, e.g., weights in the data of nodes and graphs.
+
+    The values stay in a single read-only numpy buffer. Copying the data
+    of a node or an `Implementation` shares that buffer instead of
+    creating a python object for every value. Handlers read the values
+    through `array` or `np.asarray(attribute)`.
+
+    Two array attributes are equal if they have the same dtype, shape
+    and values. In contrast to numpy arrays they can be compared with
+    `==` and hashed, so they can be used wherever tuples were used before.
+    """
+
+    __slots__ = ("_array", "_hash")
+
+    def __init__(self, values: Any, dtype: Any = None) -> None:
+        array = np.array(values, dtype=dtype, copy=True, order="C")
+        if array.dtype.kind not in "biuf":
+            raise TypeError(f"expected numeric values, found dtype {array.dtype}")
+        array.flags.writeable = False
+        self._array = array
+        self._hash: int | None = None
+
+    @classmethod
+    def wrap(cls, array: np.ndarray) -> "ArrayAttribute":
+        """Use the buffer of `array` without copying it.
+
+        The caller must not write to `array` afterward, e.g., because it
+        is a read-only view into a memory mapped file.
+        """
+        attribute = cls.__new__(cls)
+        view = np.ascontiguousarray(array).view()
+        view.flags.writeable = False
+        attribute._array = view
+        attribute._hash = None
+        return attribute
+
+    @property
+    def array(self) -> np.ndarray:
+        return self._array
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._array.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._array.dtype
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        if dtype is None or np.dtype(dtype) == self._array.dtype:
+            return self._array
+        return self._array.astype(dtype)
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def tolist(self) -> Any:
+        return self._array.tolist()
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, ArrayAttribute):
+            return NotImplemented
+        return (
+            self.dtype == other.dtype
+            and self.shape == other.shape
+            and hash(self) == hash(other)
+            and bool(np.array_equal(self._array, other._array))
+        )
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            digest = hashlib.blake2b(self._array.data, digest_size=8).digest()
+            self._hash = hash((self.dtype.str, self.shape, digest))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"ArrayAttribute(shape={self.shape}, dtype={self.dtype})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return ArrayAttribute, (self._array,)
@@ -1,6 +1,13 @@
 from typing import TypeAlias
 
+from .array_attribute import ArrayAttribute
+
 SizeT: TypeAlias = tuple[int] | tuple[int, int] | tuple[int, int, int]
 Attribute: TypeAlias = (
-    int | float | str | tuple["Attribute", ...] | dict[str, "Attribute"]
+    int
+    | float
+    | str
+    | tuple["Attribute", ...]
+    | dict[str, "Attribute"]
+    | ArrayAttribute
 )
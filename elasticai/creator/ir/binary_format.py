@@ -0,0 +1,523 @@
+"""Compact binary format for graphs in their dictionary representation.
+
+The format stores the data produced by, e.g., `ir2vhdl.Implementation.asdict`
+in a single file that is meant to be opened through `mmap`. Opening a
+file only reads the fixed size header. Nodes, edges and attributes are decoded
+on access, so a process can look up the few nodes it needs without
+decoding the whole graph.
+
+The file consists of
+
+* a header with the position of each of the following sections
+* a table of interned strings, every string in the graph is stored once
+* the encoded values, i.e., the data dictionaries of nodes and edges and the graph attributes
+* a node table `(name, type, data offset)` in insertion order and the node indices sorted by name
+* an edge table `(src, sink, data offset)`
+* numeric arrays, stored contiguously and 8 byte aligned
+
+Tuples of ints or floats (possibly nested, but rectangular) with at least
+`MIN_ARRAY_SIZE` elements are stored as numeric arrays. They are decoded
+to tuples again by default or returned as read-only numpy views into the
+mapped file, when passing `zero_copy_arrays=True`. `ArrayAttribute`s are
+stored in the same section with their own dtype and are always decoded to
+`ArrayAttribute`s, either holding a copy or, with `zero_copy_arrays=True`,
+wrapping the view into the mapped file.
+"""
+
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any, BinaryIO, NamedTuple
+
+import numpy as np
+
+from .array_attribute import ArrayAttribute
+
+MAGIC = b"EAIRBIN\x00"
+VERSION = 1
+MIN_ARRAY_SIZE = 8
+
+(
+    _INT,
+    _FLOAT,
+    _STR,
+    _TUPLE,
+    _DICT,
+    _ARRAY,
+    _BOOL,
+    _NONE,
+    _BIGINT,
+    _LIST,
+    _ARRAY_ATTRIBUTE,
+) = range(11)
+_DTYPES = (np.dtype("<i8"), np.dtype("<f8"))
+
+_TAG = struct.Struct("<B")
+_TAG_I64 = struct.Struct("<Bq")
+_TAG_F64 = struct.Struct("<Bd")
+_TAG_U32 = struct.Struct("<BI")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_ARRAY_HEAD = struct.Struct("<BBBQ")
+_ARRAY_ATTRIBUTE_HEAD = struct.Struct("<BIBQ")
+
+_NODE_DTYPE = np.dtype([("name", "<u4"), ("type", "<u4"), ("data", "<u8")])
+_EDGE_DTYPE = np.dtype([("src", "<u4"), ("sink", "<u4"), ("data", "<u8")])
+
+
+class _Header(NamedTuple):
+    magic: bytes
+    version: int
+    name: int
+    type: int
+    attributes: int
+    num_strings: int
+    string_offsets_pos: int
+    strings_pos: int
+    values_pos: int
+    num_nodes: int
+    nodes_pos: int
+    node_order_pos: int
+    num_edges: int
+    edges_pos: int
+    arrays_pos: int
+
+
+_HEADER = struct.Struct("<8sIII" + "Q" * 11)
+
+
+class BinaryFormatError(Exception):
+    pass
+
+
+def dump(data: Mapping[str, Any], file: str | os.PathLike | BinaryIO) -> None:
+    """Write a graph dictionary with the keys `name`, `type`, `attributes`, `nodes` and `edges`.
+
+    `nodes` and `edges` are sequences of data dictionaries, nodes need
+    the keys `name` and `type`, edges need `src` and `sink`.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "wb") as f:
+            _dump(data, f)
+    else:
+        _dump(data, file)
+
+
+def load(file: str | os.PathLike, zero_copy_arrays: bool = False) -> "MappedGraphData":
+    """Map the file into memory. Close the result or use it as a context manager."""
+    with open(file, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return MappedGraphData(buffer, zero_copy_arrays=zero_copy_arrays)
+
+
+def _dump(data: Mapping[str, Any], f: BinaryIO) -> None:
+    encoder = _Encoder()
+    nodes = np.zeros(len(data["nodes"]), dtype=_NODE_DTYPE)
+    for i, n in enumerate(data["nodes"]):
+        nodes[i] = (encoder.string(n["name"]), encoder.string(n["type"]), encoder(n))
+    edges = np.zeros(len(data["edges"]), dtype=_EDGE_DTYPE)
+    for i, e in enumerate(data["edges"]):
+        edges[i] = (encoder.string(e["src"]), encoder.string(e["sink"]), encoder(e))
+    name, type = encoder.string(data["name"]), encoder.string(data["type"])
+    attributes = encoder(data["attributes"])
+    node_names = [encoder.strings[sid] for sid in nodes["name"].tolist()]
+    node_order = np.array(
+        sorted(range(len(node_names)), key=node_names.__getitem__), dtype="<u4"
+    )
+    encoded = [s.encode() for s in encoder.strings]
+    string_offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(s) for s in encoded], out=string_offsets[1:])
+
+    sections = (
+        string_offsets.tobytes(),
+        b"".join(encoded),
+        bytes(encoder.values),
+        nodes.tobytes(),
+        node_order.tobytes(),
+        edges.tobytes(),
+        bytes(encoder.arrays),
+    )
+    positions = []
+    position = _HEADER.size
+    for section in sections:
+        position = _align(position)
+        positions.append(position)
+        position += len(section)
+    header = _Header(
+        magic=MAGIC,
+        version=VERSION,
+        name=name,
+        type=type,
+        attributes=attributes,
+        num_strings=len(encoded),
+        string_offsets_pos=positions[0],
+        strings_pos=positions[1],
+        values_pos=positions[2],
+        num_nodes=len(nodes),
+        nodes_pos=positions[3],
+        node_order_pos=positions[4],
+        num_edges=len(edges),
+        edges_pos=positions[5],
+        arrays_pos=positions[6],
+    )
+    f.write(_HEADER.pack(*header))
+    written = _HEADER.size
+    for position, section in zip(positions, sections):
+        f.write(b"\x00" * (position - written))
+        f.write(section)
+        written = position + len(section)
+
+
+def _align(position: int) -> int:
+    return (position + 7) & ~7
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+        self.values = bytearray()
+        self.arrays = bytearray()
+
+    def string(self, s: str) -> int:
+        try:
+            return self._string_ids[s]
+        except KeyError:
+            sid = len(self.strings)
+            self._string_ids[s] = sid
+            self.strings.append(s)
+            return sid
+
+    def __call__(self, value: Any) -> int:
+        offset = len(self.values)
+        self._write(value)
+        return offset
+
+    def _write(self, value: Any) -> None:
+        values = self.values
+        t = type(value)
+        if t is bool:
+            values += _TAG_U32.pack(_BOOL, int(value))
+        elif t is int:
+            if -(2**63) <= value < 2**63:
+                values += _TAG_I64.pack(_INT, value)
+            else:
+                values += _TAG_U32.pack(_BIGINT, self.string(str(value)))
+        elif t is float:
+            values += _TAG_F64.pack(_FLOAT, value)
+        elif t is str:
+            values += _TAG_U32.pack(_STR, self.string(value))
+        elif value is None:
+            values += _TAG.pack(_NONE)
+        elif t is tuple:
+            array = _as_numeric_array(value)
+            if array is None:
+                self._write_sequence(_TUPLE, value)
+            else:
+                self._write_array(array)
+        elif t is list:
+            self._write_sequence(_LIST, value)
+        elif t is ArrayAttribute:
+            self._write_array_attribute(value)
+        elif isinstance(value, Mapping):
+            values += _TAG_U32.pack(_DICT, len(value))
+            for k, v in value.items():
+                if not isinstance(k, str):
+                    raise TypeError(f"dictionary keys have to be strings, found {k!r}")
+                values += _U32.pack(self.string(k))
+                self._write(v)
+        else:
+            raise TypeError(f"cannot serialize value of type {t.__qualname__}")
+
+    def _write_sequence(self, tag: int, value: tuple | list) -> None:
+        self.values += _TAG_U32.pack(tag, len(value))
+        for v in value:
+            self._write(v)
+
+    def _write_array(self, array: np.ndarray) -> None:
+        self.arrays += b"\x00" * (_align(len(self.arrays)) - len(self.arrays))
+        dtype_code = _DTYPES.index(array.dtype)
+        self.values += _ARRAY_HEAD.pack(
+            _ARRAY, dtype_code, array.ndim, len(self.arrays)
+        )
+        for dim in array.shape:
+            self.values += _U64.pack(dim)
+        self.arrays += array.tobytes()
+
+    def _write_array_attribute(self, value: ArrayAttribute) -> None:
+        self.arrays += b"\x00" * (_align(len(self.arrays)) - len(self.arrays))
+        array = value.array
+        self.values += _ARRAY_ATTRIBUTE_HEAD.pack(
+            _ARRAY_ATTRIBUTE,
+            self.string(array.dtype.newbyteorder("<").str),
+            array.ndim,
+            len(self.arrays),
+        )
+        for dim in array.shape:
+            self.values += _U64.pack(dim)
+        self.arrays += array.astype(array.dtype.newbyteorder("<"), copy=False).tobytes()
+
+
+def _as_numeric_array(value: tuple) -> np.ndarray | None:
+    layout = _numeric_layout(value)
+    if layout is None:
+        return None
+    shape, leaf_type = layout
+    if int(np.prod(shape)) < MIN_ARRAY_SIZE:
+        return None
+    dtype = _DTYPES[0] if leaf_type is int else _DTYPES[1]
+    try:
+        return np.array(value, dtype=dtype)
+    except OverflowError:
+        return None
+
+
+def _numeric_layout(value: tuple) -> tuple[tuple[int, ...], type] | None:
+    """Shape and leaf type if `value` is a rectangular nested tuple of either only ints or only floats."""
+    if len(value) == 0:
+        return None
+    first = value[0]
+    if type(first) is tuple:
+        inner = _numeric_layout(first)
+        if inner is None:
+            return None
+        for v in value[1:]:
+            if type(v) is not tuple or _numeric_layout(v) != inner:
+                return None
+        return (len(value),) + inner[0], inner[1]
+    leaf_type = type(first)
+    if leaf_type is not int and leaf_type is not float:
+        return None
+    for v in value:
+        if type(v) is not leaf_type:
+            return None
+    return (len(value),), leaf_type
+
+
+class MappedGraphData:
+    """Read-only view of a file written by `dump`.
+
+    Values are decoded on access. Decoded nodes and edges are plain
+    dictionaries, so they can be passed to the constructor of the
+    corresponding `IrData` classes, e.g., `VhdlNode(mapped.nodes["conv0"])`.
+    """
+
+    def __init__(self, buffer: mmap.mmap | bytes, zero_copy_arrays: bool = False):
+        self._buffer = buffer
+        self._zero_copy_arrays = zero_copy_arrays
+        if len(buffer) < _HEADER.size:
+            raise BinaryFormatError("file is too small to contain a header")
+        self._header = _Header(*_HEADER.unpack_from(buffer, 0))
+        if self._header.magic != MAGIC:
+            raise BinaryFormatError("not an elasticai.creator ir file")
+        if self._header.version != VERSION:
+            raise BinaryFormatError(
+                f"unsupported format version {self._header.version}"
+            )
+        h = self._header
+        self._string_offsets = np.frombuffer(
+            buffer, dtype="<u8", count=h.num_strings + 1, offset=h.string_offsets_pos
+        )
+        self._strings: list[str | None] = [None] * h.num_strings
+        self._string_ids: dict[str, int] | None = None
+        self._nodes = np.frombuffer(
+            buffer, dtype=_NODE_DTYPE, count=h.num_nodes, offset=h.nodes_pos
+        )
+        self._node_order = np.frombuffer(
+            buffer, dtype="<u4", count=h.num_nodes, offset=h.node_order_pos
+        )
+        self._edges = np.frombuffer(
+            buffer, dtype=_EDGE_DTYPE, count=h.num_edges, offset=h.edges_pos
+        )
+
+    def __enter__(self) -> "MappedGraphData":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the mapping.
+
+        If zero copy arrays are still referenced, the mapping is released
+        as soon as the last of them is garbage collected.
+        """
+        del self._string_offsets, self._nodes, self._node_order, self._edges
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+            except BufferError:
+                pass
+
+    @property
+    def name(self) -> str:
+        return self._string(self._header.name)
+
+    @property
+    def type(self) -> str:
+        return self._string(self._header.type)
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        return self._value(self._header.attributes)
+
+    @property
+    def nodes(self) -> Mapping[str, dict[str, Any]]:
+        """Node data by name, iterated in insertion order."""
+        return _MappedNodes(self)
+
+    def edges(self) -> Iterator[dict[str, Any]]:
+        for offset in self._edges["data"].tolist():
+            yield self._value(offset)
+
+    def node_names_of_type(self, type: str) -> tuple[str, ...]:
+        """Find nodes by type without decoding their data."""
+        sid = self._string_id(type)
+        if sid is None:
+            return tuple()
+        names = self._nodes["name"][self._nodes["type"] == sid]
+        return tuple(self._string(n) for n in names.tolist())
+
+    def asdict(self) -> dict[str, Any]:
+        return {
+            "nodes": list(self.nodes.values()),
+            "edges": list(self.edges()),
+            "name": self.name,
+            "type": self.type,
+            "attributes": self.attributes,
+        }
+
+    def _find_node(self, name: str) -> int | None:
+        names = _SortedNodeNames(self)
+        k = bisect_left(names, name)
+        if k < len(names) and names[k] == name:
+            return int(self._node_order[k])
+        return None
+
+    def _string(self, sid: int) -> str:
+        s = self._strings[sid]
+        if s is None:
+            start, end = self._string_offsets[sid : sid + 2].tolist()
+            position = self._header.strings_pos
+            s = bytes(self._buffer[position + start : position + end]).decode()
+            self._strings[sid] = s
+        return s
+
+    def _string_id(self, s: str) -> int | None:
+        if self._string_ids is None:
+            self._string_ids = {
+                self._string(i): i for i in range(self._header.num_strings)
+            }
+        return self._string_ids.get(s)
+
+    def _value(self, offset: int) -> Any:
+        value, _ = self._read(self._header.values_pos + offset)
+        return value
+
+    def _read(self, position: int) -> tuple[Any, int]:
+        buffer = self._buffer
+        tag = buffer[position]
+        if tag == _INT:
+            return _TAG_I64.unpack_from(buffer, position)[1], position + _TAG_I64.size
+        if tag == _FLOAT:
+            return _TAG_F64.unpack_from(buffer, position)[1], position + _TAG_F64.size
+        if tag == _NONE:
+            return None, position + _TAG.size
+        if tag == _ARRAY:
+            return self._read_array(position)
+        if tag == _ARRAY_ATTRIBUTE:
+            return self._read_array_attribute(position)
+        argument = _TAG_U32.unpack_from(buffer, position)[1]
+        position += _TAG_U32.size
+        if tag == _STR:
+            return self._string(argument), position
+        if tag == _BOOL:
+            return bool(argument), position
+        if tag == _BIGINT:
+            return int(self._string(argument)), position
+        if tag == _TUPLE or tag == _LIST:
+            items = []
+            for _ in range(argument):
+                item, position = self._read(position)
+                items.append(item)
+            return (tuple(items) if tag == _TUPLE else items), position
+        if tag == _DICT:
+            d = {}
+            for _ in range(argument):
+                key = self._string(_U32.unpack_from(buffer, position)[0])
+                d[key], position = self._read(position + _U32.size)
+            return d, position
+        raise BinaryFormatError(f"unknown value tag {tag} at position {position}")
+
+    def _read_array(self, position: int) -> tuple[Any, int]:
+        _, dtype_code, ndim, offset = _ARRAY_HEAD.unpack_from(self._buffer, position)
+        position += _ARRAY_HEAD.size
+        shape = struct.unpack_from(f"<{ndim}Q", self._buffer, position)
+        position += ndim * _U64.size
+        array = np.frombuffer(
+            self._buffer,
+            dtype=_DTYPES[dtype_code],
+            count=int(np.prod(shape)),
+            offset=self._header.arrays_pos + offset,
+        ).reshape(shape)
+        if self._zero_copy_arrays:
+            return array, position
+        return _to_tuple(array.tolist()), position
+
+    def _read_array_attribute(self, position: int) -> tuple[ArrayAttribute, int]:
+        _, dtype_id, ndim, offset = _ARRAY_ATTRIBUTE_HEAD.unpack_from(
+            self._buffer, position
+        )
+        position += _ARRAY_ATTRIBUTE_HEAD.size
+        shape = struct.unpack_from(f"<{ndim}Q", self._buffer, position)
+        position += ndim * _U64.size
+        array = np.frombuffer(
+            self._buffer,
+            dtype=np.dtype(self._string(dtype_id)),
+            count=int(np.prod(shape)),
+            offset=self._header.arrays_pos + offset,
+        ).reshape(shape)
+        if self._zero_copy_arrays:
+            return ArrayAttribute.wrap(array), position
+        return ArrayAttribute(array), position
+
+
+def _to_tuple(values: list) -> tuple:
+    if len(values) > 0 and isinstance(values[0], list):
+        return tuple(map(_to_tuple, values))
+    return tuple(values)
+
+
+class _SortedNodeNames(Sequence[str]):
+    def __init__(self, data: MappedGraphData) -> None:
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._data._node_order)
+
+    def __getitem__(self, k):  # type: ignore[override]
+        data = self._data
+        return data._string(int(data._nodes["name"][data._node_order[k]]))
+
+
+class _MappedNodes(Mapping[str, dict[str, Any]]):
+    def __init__(self, data: MappedGraphData) -> None:
+        self._data = data
+
+    def __getitem__(self, name: str) -> dict[str, Any]:
+        i = self._data._find_node(name)
+        if i is None:
+            raise KeyError(name)
+        return self._data._value(int(self._data._nodes["data"][i]))
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._data._find_node(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for sid in self._data._nodes["name"].tolist():
+            yield self._data._string(sid)
+
+    def __len__(self) -> int:
+        return len(self._data._nodes)
@@ -0,0 +1,127 @@
+"""Liveness analysis and buffer sharing for the outputs of graph nodes.
+
+Each node writes its result to a buffer that has to stay alive until the
+last successor of the node has read it. Buffers with non-overlapping
+lifetimes can share the same memory block, e.g., a block RAM.
+
+The hardware layers run as a pipeline, i.e., a layer may still read its
+input while later layers already process the next data. `overlap` is the
+number of later steps that can run at the same time as a step. By default
+all steps may overlap, so no buffers are shared. Only software executors
+that run the steps strictly one after another, like `ir.interpreter`,
+pass `overlap=0`.
+
+```python
+assignment = allocate_buffers(graph, overlap=0)
+```
+
+NOTE: The generated VHDL does not use the assignment, each layer of a
+  `Sequential` owns its output RAM.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import reduce
+from operator import mul
+
+from .core import Edge, Node
+from .graph import Graph
+
+
+def output_size(n: Node) -> int:
+    """Number of values in the `output_shape` of `n`."""
+    return reduce(mul, n.data["output_shape"], 1)  # type: ignore[arg-type]
+
+
+@dataclass(frozen=True)
+class Lifetime:
+    """A buffer is written at step `start` and read for the last time at step `end`, both inclusive."""
+
+    start: int
+    end: int
+
+
+@dataclass
+class BufferAssignment:
+    lifetimes: dict[str, Lifetime] = field(default_factory=dict)
+    sizes: dict[str, int] = field(default_factory=dict)
+    blocks: dict[str, int] = field(default_factory=dict)
+    """memory block by node name"""
+    block_sizes: list[int] = field(default_factory=list)
+
+    @property
+    def total_size(self) -> int:
+        return sum(self.block_sizes)
+
+    @property
+    def unshared_size(self) -> int:
+        """Memory needed if each node had its own buffer."""
+        return sum(self.sizes.values())
+
+
+def compute_lifetimes(
+    graph: Graph[Node, Edge], overlap: int | None = None
+) -> dict[str, Lifetime]:
+    """Lifetimes of the output buffers, nodes are started in topological order.
+
+    A buffer stays alive for `overlap` steps after its last consumer
+    started, as the consumer may still read it meanwhile. With the default
+    `overlap=None` all buffers stay alive until the last step. Outputs of
+    nodes without successors always stay alive until the last step.
+    """
+    order = graph.topological_order()
+    step = {name: i for i, name in enumerate(order)}
+    last = len(order) - 1
+    lifetimes = {}
+    for name in order:
+        end = max((step[s] for s in graph.successors(name)), default=last)
+        end = last if overlap is None else min(last, end + overlap)
+        lifetimes[name] = Lifetime(step[name], end)
+    return lifetimes
+
+
+def allocate_buffers(
+    graph: Graph[Node, Edge],
+    size: Callable[[Node], int] = output_size,
+    overlap: int | None = None,
+) -> BufferAssignment:
+    """Assign each output buffer to a memory block that is shared with other buffers whenever their lifetimes do not overlap.
+
+    Buffers are assigned greedily in the order they are written. A buffer
+    reuses the smallest free block that is large enough, otherwise the
+    largest free block grows to the required size. A new block is added
+    only if no block is free.
+    """
+    nodes = graph.nodes
+    assignment = BufferAssignment(lifetimes=compute_lifetimes(graph, overlap))
+    busy: list[tuple[int, int]] = []  # (end, block)
+    free: set[int] = set()
+    for name, lifetime in assignment.lifetimes.items():
+        still_busy = []
+        for end, block in busy:
+            if end < lifetime.start:
+                free.add(block)
+            else:
+                still_busy.append((end, block))
+        busy = still_busy
+        needed = size(nodes[name])
+        block = _choose_block(free, assignment.block_sizes, needed)
+        if block is None:
+            block = len(assignment.block_sizes)
+            assignment.block_sizes.append(needed)
+        else:
+            free.discard(block)
+            assignment.block_sizes[block] = max(assignment.block_sizes[block], needed)
+        assignment.sizes[name] = needed
+        assignment.blocks[name] = block
+        busy.append((lifetime.end, block))
+    return assignment
+
+
+def _choose_block(free: set[int], block_sizes: list[int], needed: int) -> int | None:
+    if len(free) == 0:
+        return None
+    large_enough = [b for b in free if block_sizes[b] >= needed]
+    if large_enough:
+        return min(large_enough, key=lambda b: (block_sizes[b], b))
+    return max(free, key=lambda b: (block_sizes[b], -b))
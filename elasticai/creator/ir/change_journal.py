@@ -0,0 +1,79 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ChangeJournal:
+    """Records which nodes and edges of a graph were added, removed or modified.
+
+    The journal stores the net effect of all recorded changes, e.g.,
+    adding and then removing a node leaves no trace, while removing
+    a node and adding a node with the same name again counts as a
+    modification.
+
+    Incremental passes can use the journal to process only the parts
+    of a graph that changed since the journal was started, see
+    `ir.Graph.take_changes` and `ir.LoweringPass.lower_changed`.
+    """
+
+    added_nodes: set[str] = field(default_factory=set)
+    removed_nodes: set[str] = field(default_factory=set)
+    modified_nodes: set[str] = field(default_factory=set)
+    added_edges: set[tuple[str, str]] = field(default_factory=set)
+    removed_edges: set[tuple[str, str]] = field(default_factory=set)
+    modified_edges: set[tuple[str, str]] = field(default_factory=set)
+
+    def node_added(self, name: str) -> None:
+        _record_added(name, self.added_nodes, self.removed_nodes, self.modified_nodes)
+
+    def node_removed(self, name: str) -> None:
+        _record_removed(name, self.added_nodes, self.removed_nodes, self.modified_nodes)
+
+    def node_modified(self, name: str) -> None:
+        if name not in self.added_nodes:
+            self.modified_nodes.add(name)
+
+    def edge_added(self, key: tuple[str, str]) -> None:
+        _record_added(key, self.added_edges, self.removed_edges, self.modified_edges)
+
+    def edge_removed(self, key: tuple[str, str]) -> None:
+        _record_removed(key, self.added_edges, self.removed_edges, self.modified_edges)
+
+    def edge_modified(self, key: tuple[str, str]) -> None:
+        if key not in self.added_edges:
+            self.modified_edges.add(key)
+
+    def is_empty(self) -> bool:
+        return not (
+            self.added_nodes
+            or self.removed_nodes
+            or self.modified_nodes
+            or self.added_edges
+            or self.removed_edges
+            or self.modified_edges
+        )
+
+    def affected_nodes(self) -> set[str]:
+        """Names of all nodes that still exist and were either changed themselves
+        or are connected to a changed edge."""
+        affected = self.added_nodes | self.modified_nodes
+        for edges in (self.added_edges, self.removed_edges, self.modified_edges):
+            for src, sink in edges:
+                affected.add(src)
+                affected.add(sink)
+        return affected - self.removed_nodes
+
+
+def _record_added(key, added: set, removed: set, modified: set) -> None:
+    if key in removed:
+        removed.discard(key)
+        modified.add(key)
+    else:
+        added.add(key)
+
+
+def _record_removed(key, added: set, removed: set, modified: set) -> None:
+    modified.discard(key)
+    if key in added:
+        added.discard(key)
+    else:
+        removed.add(key)
@@ -0,0 +1,254 @@
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Generic, TypeVar
+
+import numpy as np
+
+_T = TypeVar("_T", int, str)
+
+
+class _Csr:
+    """Compressed sparse row adjacency.
+
+    The neighbours of the node with id `i` are
+    `indices[indptr[i]:indptr[i + 1]]`.
+    """
+
+    __slots__ = ("indptr", "indices")
+
+    def __init__(self, indptr: array, indices: array) -> None:
+        self.indptr = indptr
+        self.indices = indices
+
+    @classmethod
+    def build(
+        cls, num_nodes: int, rows: np.ndarray, cols: np.ndarray, col_rank: np.ndarray
+    ) -> "_Csr":
+        order = np.lexsort((col_rank[cols], rows))
+        counts = np.bincount(rows, minlength=num_nodes)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(
+            array("q", indptr.tobytes()),
+            array("q", cols[order].astype(np.int64).tobytes()),
+        )
+
+    def neighbours(self, i: int) -> array:
+        return self.indices[self.indptr[i] : self.indptr[i + 1]]
+
+    def add_isolated_node(self) -> None:
+        self.indptr.append(self.indptr[-1])
+
+    def copy(self) -> "_Csr":
+        return _Csr(array("q", self.indptr), self.indices)
+
+
+class CsrGraphDelegate(Generic[_T]):
+    """Drop-in replacement for `GraphDelegate` optimized for large graphs
+    that are built once and read many times.
+
+    Node names are interned to consecutive integer ids. Edges are kept
+    as two flat integer columns and compiled into compressed sparse row (CSR)
+    arrays for both directions on the first read after a modification.
+    The neighbours inside each row are sorted by node name, so
+    `get_successors` and `get_predecessors` do not have to sort
+    on every call.
+
+    The iteration order guarantees are the same as for `GraphDelegate`:
+    nodes are iterated in insertion order, neighbours in sorted order.
+
+    IMPORTANT: Adding edges invalidates the compiled arrays. Interleaving
+      single edge insertions with reads will rebuild the arrays on every
+      read. Prefer `add_edges_from` or `from_dict` to build the graph in bulk.
+      Removals are cheap: removed nodes and edges are filtered out while
+      reading and are only dropped from the arrays once they accumulate.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[_T, int] = dict()
+        self._names: list[_T] = []
+        self._src: array = array("q")
+        self._dst: array = array("q")
+        self._removed_nodes: set[int] = set()
+        self._removed_edges: set[tuple[int, int]] = set()
+        self._successors: _Csr | None = None
+        self._predecessors: _Csr | None = None
+        self._csr_shared = False
+
+    @staticmethod
+    def from_dict(d: dict[_T, Iterable[_T]]) -> "CsrGraphDelegate[_T]":
+        g: CsrGraphDelegate[_T] = CsrGraphDelegate()
+        g.add_edges_from(
+            (node, s) for node, successors in d.items() for s in successors
+        )
+        return g
+
+    def as_dict(self) -> dict[_T, set[_T]]:
+        return {n: set(self.get_successors(n)) for n in self.iter_nodes()}
+
+    def copy(self) -> "CsrGraphDelegate[_T]":
+        """Copy the graph, sharing the compiled arrays until one of the copies changes."""
+        g: CsrGraphDelegate[_T] = CsrGraphDelegate()
+        g._ids = self._ids.copy()
+        g._names = self._names.copy()
+        g._src = array("q", self._src)
+        g._dst = array("q", self._dst)
+        g._removed_nodes = self._removed_nodes.copy()
+        g._removed_edges = self._removed_edges.copy()
+        g._successors = self._successors
+        g._predecessors = self._predecessors
+        g._csr_shared = self._csr_shared = True
+        return g
+
+    def add_edge(self, _from: _T, _to: _T):
+        return self.add_edges_from(((_from, _to),))
+
+    def add_edges_from(self, edges: Iterable[tuple[_T, _T]]):
+        intern = self._intern
+        removed_edges = self._removed_edges
+        for _from, _to in edges:
+            src, dst = intern(_from), intern(_to)
+            self._src.append(src)
+            self._dst.append(dst)
+            if removed_edges:
+                removed_edges.discard((src, dst))
+        self._invalidate()
+        return self
+
+    def add_node(self, node: _T):
+        self._intern(node)
+        return self
+
+    def remove_edge(self, _from: _T, _to: _T):
+        self._removed_edges.add((self._ids[_from], self._ids[_to]))
+        self._compact_if_necessary()
+        return self
+
+    def remove_node(self, node: _T):
+        """Remove `node` together with all of its incident edges."""
+        self._removed_nodes.add(self._ids.pop(node))
+        self._compact_if_necessary()
+        return self
+
+    def iter_nodes(self) -> Iterator[_T]:
+        """Iterator over nodes in a fixed but unspecified order."""
+        removed = self._removed_nodes
+        for i, n in enumerate(self._names):
+            if i not in removed:
+                yield n
+
+    def get_edges(self) -> Iterator[tuple[_T, _T]]:
+        """Iterator over edges in a fixed but unspecified order."""
+        csr = self._get_successors_csr()
+        names = self._names
+        removed = self._removed_nodes
+        for i, _from in enumerate(names):
+            if i not in removed:
+                for j in self._alive(i, csr.neighbours(i), outgoing=True):
+                    yield _from, names[j]
+
+    def get_successors(self, node: _T) -> Iterator[_T]:
+        """Iterator over node successors in a fixed but unspecified order."""
+        csr = self._get_successors_csr()  # building may renumber the ids
+        i = self._ids[node]
+        neighbours = csr.neighbours(i)
+        return map(self._names.__getitem__, self._alive(i, neighbours, True))
+
+    def get_predecessors(self, node: _T) -> Iterator[_T]:
+        """Iterator over node predecessors in a fixed but unspecified order."""
+        csr = self._get_predecessors_csr()  # building may renumber the ids
+        i = self._ids[node]
+        neighbours = csr.neighbours(i)
+        return map(self._names.__getitem__, self._alive(i, neighbours, False))
+
+    def _alive(self, i: int, neighbours: array, outgoing: bool) -> Iterable[int]:
+        removed_nodes, removed_edges = self._removed_nodes, self._removed_edges
+        if not (removed_nodes or removed_edges):
+            return neighbours
+        if outgoing:
+            return [
+                j
+                for j in neighbours
+                if j not in removed_nodes and (i, j) not in removed_edges
+            ]
+        return [
+            j
+            for j in neighbours
+            if j not in removed_nodes and (j, i) not in removed_edges
+        ]
+
+    def _compact_if_necessary(self) -> None:
+        """Schedule a rebuild once removals make up a significant part of the graph."""
+        num_removed = len(self._removed_nodes) + len(self._removed_edges)
+        if num_removed > max(64, (len(self._names) + len(self._src)) // 8):
+            self._invalidate()
+
+    def _intern(self, node: _T) -> int:
+        try:
+            return self._ids[node]
+        except KeyError:
+            i = len(self._names)
+            self._ids[node] = i
+            self._names.append(node)
+            if self._successors is not None and self._predecessors is not None:
+                if self._csr_shared:
+                    self._successors = self._successors.copy()
+                    self._predecessors = self._predecessors.copy()
+                    self._csr_shared = False
+                self._successors.add_isolated_node()
+                self._predecessors.add_isolated_node()
+            return i
+
+    def _invalidate(self) -> None:
+        self._successors = None
+        self._predecessors = None
+
+    def _get_successors_csr(self) -> _Csr:
+        if self._successors is None:
+            self._build()
+        return self._successors  # type: ignore[return-value]
+
+    def _get_predecessors_csr(self) -> _Csr:
+        if self._predecessors is None:
+            self._build()
+        return self._predecessors  # type: ignore[return-value]
+
+    def _build(self) -> None:
+        num_nodes = len(self._names)
+        src = np.frombuffer(self._src, dtype=np.int64)
+        dst = np.frombuffer(self._dst, dtype=np.int64)
+        if len(src) > 0:
+            keys = np.unique(src * num_nodes + dst)
+            if self._removed_edges:
+                removed = np.fromiter(
+                    (a * num_nodes + b for a, b in self._removed_edges),
+                    dtype=np.int64,
+                    count=len(self._removed_edges),
+                )
+                keys = np.setdiff1d(keys, removed, assume_unique=True)
+            src, dst = np.divmod(keys, num_nodes)
+        self._removed_edges = set()
+        if self._removed_nodes:
+            src, dst = self._compact(src, dst)
+            num_nodes = len(self._names)
+        by_name = sorted(range(num_nodes), key=self._names.__getitem__)
+        rank = np.empty(num_nodes, dtype=np.int64)
+        rank[np.asarray(by_name, dtype=np.int64)] = np.arange(num_nodes)
+        self._csr_shared = False
+        self._successors = _Csr.build(num_nodes, src, dst, rank)
+        self._predecessors = _Csr.build(num_nodes, dst, src, rank)
+        self._src = array("q", src.astype(np.int64).tobytes())
+        self._dst = array("q", dst.astype(np.int64).tobytes())
+
+    def _compact(
+        self, src: np.ndarray, dst: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Drop removed nodes and their edges and assign consecutive ids again."""
+        alive = np.ones(len(self._names), dtype=np.bool_)
+        alive[np.fromiter(self._removed_nodes, dtype=np.int64)] = False
+        keep = alive[src] & alive[dst]
+        new_ids = np.cumsum(alive) - 1
+        self._names = [n for n, a in zip(self._names, alive.tolist()) if a]
+        self._ids = {n: i for i, n in enumerate(self._names)}
+        self._removed_nodes = set()
+        return new_ids[src[keep]], new_ids[dst[keep]]
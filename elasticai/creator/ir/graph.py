@@ -1,38 +1,338 @@
-from collections.abc import Callable, Iterable, Iterator, Mapping
-from typing import Generic, TypeVar
+import copy
+from collections.abc import (
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
+from typing import Any, Generic, TypeAlias, TypeVar
 
+from typing_extensions import Self
+
+from .change_journal import ChangeJournal
 from .core import Edge, Node
+from .csr_graph_delegate import CsrGraphDelegate
 from .graph_delegate import GraphDelegate
+from .graph_iterators import topological_iter
+from .node_table import NodeTable
+from .overlay import Overlay
 
 N = TypeVar("N", bound=Node)
 E = TypeVar("E", bound=Edge)
 
+GraphDelegateFactory: TypeAlias = Callable[
+    [], GraphDelegate[str] | CsrGraphDelegate[str]
+]
+NodeTableFactory: TypeAlias = Callable[[], dict[str, Any] | NodeTable[Any]]
+
 
 class Graph(Generic[N, E]):
+    """A graph of nodes and edges, identified by their names.
+
+    The adjacency structure is kept by a graph delegate. Use
+    `graph_delegate` to choose the backend per graph, e.g.,
+    pass `CsrGraphDelegate` for very large graphs that are built
+    once and traversed many times. Similarly, `node_table` chooses how
+    nodes are stored, pass `NodeTable` to store the data of many
+    nodes in a columnar layout.
+
+    All modifications are recorded in a `ChangeJournal`, see `changes`
+    and `take_changes`. This allows incremental passes to process only
+    the affected nodes instead of rebuilding the whole graph.
+
+    Nodes are indexed by `type`, `implementation` and the keys given in
+    `indexed_attributes` to find them without scanning the graph, see
+    `nodes_by`.
+    """
+
     def __init__(
-        self, nodes: Iterable[N] = tuple(), edges: Iterable[E] = tuple()
+        self,
+        nodes: Iterable[N] = tuple(),
+        edges: Iterable[E] = tuple(),
+        graph_delegate: GraphDelegateFactory = GraphDelegate,
+        node_table: NodeTableFactory = dict,
+        indexed_attributes: Iterable[str] = tuple(),
     ) -> None:
-        self._g: GraphDelegate[str] = GraphDelegate()
-        self._edge_data: dict[tuple[str, str], E] = dict()
-        self._node_data: dict[str, N] = dict()
+        self._g: GraphDelegate[str] | CsrGraphDelegate[str] = graph_delegate()
+        self._edge_data: MutableMapping[tuple[str, str], E] = dict()
+        self._node_data: MutableMapping[str, N] = node_table()
+        self._shares_delegate = False
+        self._shares_nodes = False
+        self._shares_edges = False
+        self._indexes: dict[str, dict[Hashable, MutableMapping[str, None]]] = {
+            key: {} for key in ("type", "implementation", *indexed_attributes)
+        }
+        self._shares_indexes = False
+        self._owned_buckets: set[tuple[str, Hashable]] | None = None
+        self._topological_order: tuple[str, ...] | None = None
+        self._journal = ChangeJournal()
         self.add_edges(edges)
         self.add_nodes(nodes)
+        self._journal = ChangeJournal()
+
+    @property
+    def changes(self) -> ChangeJournal:
+        """All changes since construction or the last call to `take_changes`."""
+        return self._journal
+
+    def take_changes(self) -> ChangeJournal:
+        """Return the current change journal and start a new, empty one."""
+        journal = self._journal
+        self._journal = ChangeJournal()
+        return journal
+
+    def snapshot(self) -> Self:
+        """Create a copy of the graph in constant time.
+
+        The snapshot and the original share their adjacency structure and
+        node/edge data. Modified tables are wrapped in an `Overlay` that
+        records the changes on top of the shared table, so each snapshot
+        only needs memory proportional to its own changes. Node and edge
+        objects are never copied. The `CsrGraphDelegate` is the exception,
+        its edge columns are copied on the first modification. The
+        snapshot starts with an empty change journal.
+
+        IMPORTANT: Nodes and edges are shared between snapshots. Use
+          `replace_node` or `add_edge` instead of modifying their `data`
+          in place.
+        """
+        snap = copy.copy(self)
+        snap._journal = ChangeJournal()
+        for g in (self, snap):
+            g._shares_delegate = g._shares_nodes = g._shares_edges = True
+            g._shares_indexes = True
+        return snap
+
+    def diff(self, other: "Graph[N, E]") -> ChangeJournal:
+        """Compute the changes that turn `other` into this graph.
+
+        Typically used as `candidate.diff(snapshot)`. Nodes and edges that are
+        still shared with `other` are compared by identity only.
+        """
+        journal = ChangeJournal()
+        _diff_tables(
+            self._node_data,
+            other._node_data,
+            journal.added_nodes,
+            journal.removed_nodes,
+            journal.modified_nodes,
+        )
+        _diff_tables(
+            self._edge_data,
+            other._edge_data,
+            journal.added_edges,
+            journal.removed_edges,
+            journal.modified_edges,
+        )
+        return journal
+
+    def add_index(self, key: str) -> None:
+        """Index nodes by the value of `key` in their data, see `nodes_by`."""
+        if key in self._indexes:
+            return
+        self._own_indexes()[key] = {}
+        for n in self._node_data.values():
+            self._index(n, (key,))
+
+    def nodes_by(self, key: str, value: Hashable) -> Mapping[str, N]:
+        """All nodes whose data stores `value` under the indexed `key`.
+
+        Lookups take constant time, apart from the time to build the result.
+        The indexes are updated by all methods that add, remove or replace
+        nodes. Modifying the `data` of a node in place is not tracked, use
+        `replace_node` instead.
+        """
+        try:
+            names = self._indexes[key].get(value, {})
+        except KeyError:
+            raise KeyError(f"nodes are not indexed by '{key}'") from None
+        result: dict[str, N] = {}
+        for name in names:
+            n = self._node_data[name]
+            if n.data.get(key) == value:
+                result[name] = n
+        return result
 
     def add_node(self, n: N) -> None:
-        self._g.add_node(n.name)
-        self._node_data[n.name] = n
+        node_data = self._own_nodes()
+        if n.name in node_data:
+            self._journal.node_modified(n.name)
+            self._unindex(node_data[n.name])
+        else:
+            self._journal.node_added(n.name)
+        self._own_delegate().add_node(n.name)
+        node_data[n.name] = n
+        self._index(n, self._indexes)
+        self._invalidate_caches()
 
     def add_nodes(self, ns: Iterable[N]) -> None:
         for n in ns:
             self.add_node(n)
 
     def add_edges(self, es: Iterable[E]) -> None:
-        for e in es:
-            self.add_edge(e)
+        edge_data = self._own_edges()
+
+        def keys() -> Iterator[tuple[str, str]]:
+            for e in es:
+                key = (e.src, e.sink)
+                self._record_edge(key)
+                edge_data[key] = e
+                yield key
+
+        self._own_delegate().add_edges_from(keys())
+        self._invalidate_caches()
 
     def add_edge(self, e: E) -> None:
-        self._g.add_edge(e.src, e.sink)
-        self._edge_data[(e.src, e.sink)] = e
+        key = (e.src, e.sink)
+        self._record_edge(key)
+        self._own_delegate().add_edge(e.src, e.sink)
+        self._own_edges()[key] = e
+        self._invalidate_caches()
+
+    def remove_edge(self, src: str, sink: str) -> None:
+        del self._own_edges()[(src, sink)]
+        self._own_delegate().remove_edge(src, sink)
+        self._journal.edge_removed((src, sink))
+        self._invalidate_caches()
+
+    def remove_node(self, node: str | N) -> None:
+        """Remove the node and all edges connected to it."""
+        if not isinstance(node, str):
+            node = node.name
+        incident = [(node, s) for s in self._g.get_successors(node)] + [
+            (p, node) for p in self._g.get_predecessors(node) if p != node
+        ]
+        edge_data = self._own_edges()
+        for key in incident:
+            edge_data.pop(key, None)
+            self._journal.edge_removed(key)
+        self._own_delegate().remove_node(node)
+        node_data = self._own_nodes()
+        if node in node_data:
+            self._unindex(node_data[node])
+            del node_data[node]
+        self._journal.node_removed(node)
+        self._invalidate_caches()
+
+    def replace_node(self, n: N) -> None:
+        """Replace the data of an existing node with the same name, keeping all edges."""
+        if n.name not in self._node_data:
+            raise KeyError(f"cannot replace missing node '{n.name}'")
+        node_data = self._own_nodes()
+        self._unindex(node_data[n.name])
+        node_data[n.name] = n
+        self._index(n, self._indexes)
+        self._journal.node_modified(n.name)
+
+    def splice_subgraph(
+        self,
+        remove: Iterable[str],
+        nodes: Iterable[N] = tuple(),
+        edges: Iterable[E] = tuple(),
+    ) -> None:
+        """Replace the nodes named in `remove` by `nodes` and `edges`.
+
+        All edges connected to removed nodes are removed as well. The new
+        `edges` may connect new nodes to each other and to the remaining
+        nodes of the graph, e.g., to reconnect the inputs and outputs of
+        the replaced subgraph.
+        """
+        for name in tuple(remove):
+            self.remove_node(name)
+        self.add_nodes(nodes)
+        self.add_edges(edges)
+
+    def _record_edge(self, key: tuple[str, str]) -> None:
+        if key in self._edge_data:
+            self._journal.edge_modified(key)
+        else:
+            self._journal.edge_added(key)
+
+    def _index(self, n: N, keys: Iterable[str]) -> None:
+        for key in keys:
+            if key in n.data:
+                try:
+                    names = self._writable_bucket(key, n.data[key], create=True)
+                except TypeError:
+                    continue
+                names[n.name] = None  # type: ignore[index]
+
+    def _unindex(self, n: N) -> None:
+        indexes = self._own_indexes()
+        for key in indexes:
+            if key not in n.data:
+                continue
+            value = n.data[key]
+            try:
+                names = self._writable_bucket(key, value, create=False)
+            except TypeError:
+                continue
+            if names is not None:
+                names.pop(n.name, None)
+                if len(names) == 0:
+                    del indexes[key][value]
+
+    def _own_indexes(self) -> dict[str, dict[Hashable, MutableMapping[str, None]]]:
+        """Copy the index dictionaries, the name buckets stay shared until `_writable_bucket` overlays them."""
+        if self._shares_indexes:
+            self._indexes = {key: dict(index) for key, index in self._indexes.items()}
+            self._owned_buckets = set()
+            self._shares_indexes = False
+        return self._indexes
+
+    def _writable_bucket(
+        self, key: str, value: Hashable, create: bool
+    ) -> MutableMapping[str, None] | None:
+        index = self._own_indexes()[key]
+        names = index.get(value)
+        owned = self._owned_buckets
+        if names is None:
+            if not create:
+                return None
+            names = index[value] = {}
+        elif owned is not None and (key, value) not in owned:
+            names = index[value] = Overlay.over(names)
+        else:
+            return names
+        if owned is not None:
+            owned.add((key, value))
+        return names
+
+    def _own_delegate(self) -> GraphDelegate[str] | CsrGraphDelegate[str]:
+        if self._shares_delegate:
+            self._g = self._g.copy()
+            self._shares_delegate = False
+        return self._g
+
+    def _own_nodes(self) -> MutableMapping[str, N]:
+        if self._shares_nodes:
+            self._node_data = Overlay.over(self._node_data)
+            self._shares_nodes = False
+        return self._node_data
+
+    def _own_edges(self) -> MutableMapping[tuple[str, str], E]:
+        if self._shares_edges:
+            self._edge_data = Overlay.over(self._edge_data)
+            self._shares_edges = False
+        return self._edge_data
+
+    def topological_order(self) -> tuple[str, ...]:
+        """Names of all nodes in topological order.
+
+        The order is computed once and cached until the graph is modified.
+        It is deterministic, i.e., two graphs built in the same way
+        will yield the same order.
+        """
+        if self._topological_order is None:
+            self._topological_order = tuple(
+                topological_iter(self._g.iter_nodes(), self._g.get_successors)
+            )
+        return self._topological_order
+
+    def _invalidate_caches(self) -> None:
+        self._topological_order = None
 
     def successors(self, node: str | N) -> Mapping[str, N]:
         if not isinstance(node, str):
@@ -65,8 +365,42 @@ _K = TypeVar("_K")
 _V = TypeVar("_V")
 
 
+def _diff_tables(
+    new: MutableMapping[Any, Any],
+    old: MutableMapping[Any, Any],
+    added: set[Any],
+    removed: set[Any],
+    modified: set[Any],
+) -> None:
+    if new is old:
+        return
+    keys = _changed_keys(new, old)
+    if keys is None:
+        keys = new.keys() | old.keys()
+    for key in keys:
+        if key not in old:
+            if key in new:
+                added.add(key)
+        elif key not in new:
+            removed.add(key)
+        else:
+            old_value, value = old[key], new[key]
+            if old_value is not value and old_value != value:
+                modified.add(key)
+
+
+def _changed_keys(
+    new: MutableMapping[Any, Any], old: MutableMapping[Any, Any]
+) -> set[Any] | None:
+    if isinstance(new, Overlay):
+        return new.changed_keys(old)
+    if isinstance(old, Overlay):
+        return old.changed_keys(new)
+    return None
+
+
 class _ReadOnlyMappingInOrderAsIterable(Mapping[_K, _V]):
-    def __init__(self, iterable: Callable[[], Iterator[_K]], d: dict[_K, _V]):
+    def __init__(self, iterable: Callable[[], Iterator[_K]], d: Mapping[_K, _V]):
         self._iterable = iterable
         self._d = d
 
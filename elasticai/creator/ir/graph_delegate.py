@@ -1,6 +1,8 @@
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, MutableMapping
 from typing import Generic, TypeVar
 
+from .overlay import Overlay
+
 _T = TypeVar("_T", int, str)
 
 
@@ -17,34 +19,90 @@ class GraphDelegate(Generic[_T]):
         """We keep successor and predecessor nodes just to allow for easier implementation.
         Currently, this implementation is not optimized for performance.
         """
-        self.successors: dict[_T, set[_T]] = dict()
-        self.predecessors: dict[_T, set[_T]] = dict()
+        self.successors: MutableMapping[_T, set[_T]] = dict()
+        self.predecessors: MutableMapping[_T, set[_T]] = dict()
+        self._owned: set[_T] | None = None
 
     @staticmethod
     def from_dict(d: dict[_T, Iterable[_T]]):
         g: GraphDelegate[_T] = GraphDelegate()
-        for node, successors in d.items():
-            for s in successors:
-                g.add_edge(node, s)
+        g.add_edges_from(
+            (node, s) for node, successors in d.items() for s in successors
+        )
         return g
 
     def as_dict(self) -> dict[_T, set[_T]]:
-        return self.successors.copy()
+        return dict(self.successors)
+
+    def copy(self) -> "GraphDelegate[_T]":
+        """Copy the graph without copying its tables of neighbour sets.
+
+        Both delegates read the shared tables through an `Overlay` and
+        the sets are shared until one of them modifies the neighbours
+        of a node. Only then the sets of that node are copied.
+        """
+        g: GraphDelegate[_T] = GraphDelegate()
+        successors, predecessors = self.successors, self.predecessors
+        self.successors = Overlay.over(successors)
+        self.predecessors = Overlay.over(predecessors)
+        g.successors = Overlay.over(successors)
+        g.predecessors = Overlay.over(predecessors)
+        g._owned = set()
+        self._owned = set()
+        return g
 
     def add_edge(self, _from: _T, _to: _T):
         self.add_node(_from)
         self.add_node(_to)
+        self._make_writable(_from)
+        self._make_writable(_to)
         self.predecessors[_to].add(_from)
         self.successors[_from].add(_to)
         return self
 
+    def add_edges_from(self, edges: Iterable[tuple[_T, _T]]):
+        for _from, _to in edges:
+            self.add_edge(_from, _to)
+        return self
+
     def add_node(self, node: _T):
         if node not in self.predecessors:
             self.predecessors[node] = set()
         if node not in self.successors:
             self.successors[node] = set()
+            if self._owned is not None:
+                self._owned.add(node)
+        return self
+
+    def remove_edge(self, _from: _T, _to: _T):
+        self._make_writable(_from)
+        self._make_writable(_to)
+        self.successors[_from].discard(_to)
+        self.predecessors[_to].discard(_from)
         return self
 
+    def remove_node(self, node: _T):
+        """Remove `node` together with all of its incident edges."""
+        for s in self.successors.pop(node):
+            if s != node:
+                self._make_writable(s)
+                self.predecessors[s].discard(node)
+        for p in self.predecessors.pop(node):
+            if p != node:
+                self._make_writable(p)
+                self.successors[p].discard(node)
+        if self._owned is not None:
+            self._owned.discard(node)
+        return self
+
+    def _make_writable(self, node: _T) -> None:
+        """Copy the neighbour sets of `node` if they might be shared with another delegate."""
+        owned = self._owned
+        if owned is not None and node not in owned:
+            self.successors[node] = set(self.successors[node])
+            self.predecessors[node] = set(self.predecessors[node])
+            owned.add(node)
+
     def iter_nodes(self) -> Iterator[_T]:
         """Iterator over nodes in a fixed but unspecified order."""
         yield from self.predecessors.keys()
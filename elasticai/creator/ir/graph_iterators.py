@@ -1,3 +1,4 @@
+from collections import deque
 from collections.abc import Callable, Iterable, Iterator
 from typing import Hashable, TypeAlias, TypeVar
 
@@ -22,15 +23,28 @@ def dfs_pre_order(successors: NodeNeighbourFn, start: HashableT) -> Iterator[Has
 def bfs_iter_down(
     successors: NodeNeighbourFn, predecessors: NodeNeighbourFn, start: HashableT
 ) -> Iterator[HashableT]:
+    """Visit nodes reachable from `start` breadth first, yielding a node
+    only after all of its predecessors have been visited.
+
+    The direct successors of `start` are always visited. We keep a counter
+    of unvisited predecessors per node instead of checking all
+    predecessors again, so every edge is inspected only once.
+    """
     visited: set[HashableT] = set()
-    visit_next = sorted(list(successors(start)))
+    unvisited_predecessors: dict[HashableT, int] = dict()
+    visit_next = deque(sorted(successors(start)))
     while len(visit_next) > 0:
-        current = visit_next.pop(0)
+        current = visit_next.popleft()
         if current not in visited:
             visited.add(current)
             yield current
             for child in successors(current):
-                if set(predecessors(child)).issubset(visited):
+                if child in unvisited_predecessors:
+                    unvisited_predecessors[child] -= 1
+                else:
+                    # current is the first visited predecessor of child
+                    unvisited_predecessors[child] = _count(predecessors(child)) - 1
+                if unvisited_predecessors[child] == 0:
                     visit_next.append(child)
 
 
@@ -38,3 +52,37 @@ def bfs_iter_up(
     predecessors: NodeNeighbourFn, successors: NodeNeighbourFn, start: HashableT
 ) -> Iterator[HashableT]:
     return bfs_iter_down(predecessors, successors, start)
+
+
+def topological_iter(
+    nodes: Iterable[HashableT], successors: NodeNeighbourFn
+) -> Iterator[HashableT]:
+    """Iterate over all `nodes` in topological order using Kahn's algorithm.
+
+    Nodes without predecessors are visited in the order of `nodes`,
+    all other nodes in the order they become ready, while
+    their predecessors are visited in the order given by `successors`.
+
+    Raises a `ValueError` if the graph contains a cycle.
+    """
+    nodes = tuple(nodes)
+    in_degree: dict[HashableT, int] = dict.fromkeys(nodes, 0)
+    for n in nodes:
+        for s in successors(n):
+            in_degree[s] += 1
+    ready = deque(n for n in nodes if in_degree[n] == 0)
+    num_visited = 0
+    while len(ready) > 0:
+        current = ready.popleft()
+        num_visited += 1
+        yield current
+        for s in successors(current):
+            in_degree[s] -= 1
+            if in_degree[s] == 0:
+                ready.append(s)
+    if num_visited < len(nodes):
+        raise ValueError("graph contains a cycle, no topological order exists")
+
+
+def _count(items: Iterable) -> int:
+    return sum(1 for _ in items)
@@ -0,0 +1,103 @@
+"""Content hashes for ir data.
+
+The hash only depends on the content, e.g., two `data` dictionaries with
+equal items yield the same hash regardless of the order in which the items
+were inserted. Use `hash_graph` for objects providing `asdict` like
+`ir2vhdl.Implementation` and `function_version` to detect changes of
+the functions that process them.
+"""
+
+import hashlib
+import inspect
+from collections.abc import Callable, Mapping
+from types import CodeType
+from typing import Any, Protocol
+
+import numpy as np
+
+from .array_attribute import ArrayAttribute
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+class HasAsDict(Protocol):
+    def asdict(self) -> dict[str, Any]: ...
+
+
+def content_hash(value: Any) -> str:
+    """Hex digest of `value`, which can be built from mappings with string keys, lists, tuples, sets, scalars, numpy arrays and `ArrayAttribute`s.
+
+    Numpy scalars are hashed by their dtype and value. Other values are
+    hashed by their type and `repr`, so their hash is only stable if
+    their `repr` is.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    _update(h, value)
+    return h.hexdigest()
+
+
+def hash_graph(graph: HasAsDict) -> str:
+    return content_hash(graph.asdict())
+
+
+def function_version(fn: Callable) -> str:
+    """The `version` attribute of `fn` if defined, otherwise a hash of its name and bytecode.
+
+    Set `version` when the function depends on helpers that might change.
+    """
+    fn = inspect.unwrap(fn)
+    version = getattr(fn, "version", None)
+    if version is not None:
+        return str(version)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(
+        f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', '')}".encode()
+    )
+    code = getattr(fn, "__code__", None)
+    if code is not None:
+        _update_with_code(h, code)
+    return h.hexdigest()
+
+
+def _update_with_code(h: Any, code: CodeType) -> None:
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _update_with_code(h, const)
+        else:
+            h.update(repr(const).encode())
+
+
+def _update(h: Any, value: Any) -> None:
+    if isinstance(value, Mapping):
+        h.update(b"{")
+        for key in sorted(value):
+            _update(h, key)
+            _update(h, value[key])
+        h.update(b"}")
+    elif type(value) in (tuple, list):
+        if all(type(v) in _SCALARS for v in value):
+            h.update(repr(value).encode())
+        else:
+            h.update(b"(" if type(value) is tuple else b"[")
+            for v in value:
+                _update(h, v)
+            h.update(b")")
+    elif type(value) in _SCALARS:
+        h.update(repr(value).encode())
+    elif isinstance(value, ArrayAttribute):
+        h.update(b"A")
+        _update(h, value.array)
+    elif isinstance(value, np.ndarray):
+        h.update(f"<{value.dtype.str}{value.shape}>".encode())
+        h.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, np.generic):
+        h.update(f"<{value.dtype.str}>".encode())
+        _update(h, value.item())
+    elif isinstance(value, (set, frozenset)):
+        h.update(b"<set>")
+        for digest in sorted(content_hash(v) for v in value):
+            h.update(digest.encode())
+    else:
+        h.update(f"<{type(value).__qualname__}>{value!r}".encode())
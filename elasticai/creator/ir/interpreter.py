@@ -0,0 +1,200 @@
+"""Reference interpreter to run ir graphs in software, e.g., as golden model for regression tests.
+
+Register a numpy kernel for each node type. A kernel is called as
+`kernel(node, inputs, out)` with the outputs of the predecessors of
+`node` and writes its own output to `out`. All arrays have the
+batch as leading dimension followed by the `output_shape` of the node.
+
+```python
+interpreter = Interpreter()
+
+@interpreter.register("relu")
+def relu(node, inputs, out):
+    np.maximum(inputs[0], 0, out=out)
+
+run = interpreter.compile(implementation)
+outputs = run({"input": x})
+```
+
+Compiling the graph determines the execution order and assigns the
+output of each node to a memory block, shared with other outputs that
+are not alive at the same time (see `ir.buffer_allocation`). The blocks
+are allocated once for each batch size.
+"""
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeAlias
+
+import numpy as np
+
+from elasticai.creator.function_utils import RegisterDescriptor
+
+from .buffer_allocation import allocate_buffers
+from .core import Edge, Node
+from .graph import Graph
+
+Kernel: TypeAlias = Callable[[Node, Sequence[np.ndarray], np.ndarray], None]
+
+
+class InterpreterError(Exception):
+    pass
+
+
+class Interpreter:
+    """Compile graphs into `ExecutionPlan`s using the registered kernels."""
+
+    register: RegisterDescriptor[Node, None] = RegisterDescriptor()
+
+    def __init__(self) -> None:
+        self._kernels: dict[str, Kernel] = {}
+
+    def _register_callback(self, name: str, fn: Kernel) -> None:
+        if name in self._kernels:
+            raise ValueError(f"kernel for {name} already defined")
+        self._kernels[name] = fn
+
+    def compile(
+        self,
+        graph: Graph[Node, Edge],
+        inputs: Iterable[str] | None = None,
+        outputs: Iterable[str] | None = None,
+        dtype: Any = np.float64,
+    ) -> "ExecutionPlan":
+        """Build the plan to run `graph`.
+
+        `inputs` are the nodes whose outputs are provided by the caller,
+        by default all nodes without predecessors. `outputs` are the
+        nodes whose outputs are returned, by default all nodes without
+        successors. All other nodes need a kernel for their type.
+        """
+        order = graph.topological_order()
+        if inputs is None:
+            sinks = {sink for _, sink in graph.edges}
+            inputs = (n for n in order if n not in sinks)
+        if outputs is None:
+            sources = {src for src, _ in graph.edges}
+            outputs = (n for n in order if n not in sources)
+        inputs = tuple(inputs)
+        outputs = frozenset(outputs)
+        is_input = frozenset(inputs)
+        shapes = tuple(_output_shape(graph.nodes[name]) for name in order)
+        assignment = allocate_buffers(graph, overlap=0)
+        index = {name: i for i, name in enumerate(order)}
+        steps = []
+        for name in order:
+            n = graph.nodes[name]
+            kernel: Kernel | None = None
+            if name not in is_input:
+                if n.type not in self._kernels:
+                    raise InterpreterError(
+                        f"no kernel for node {name} of type {n.type}"
+                    )
+                kernel = self._kernels[n.type]
+            steps.append(
+                _Step(
+                    kernel=kernel,
+                    node=n,
+                    inputs=tuple(index[p] for p in graph.predecessors(name)),
+                    output=index[name],
+                )
+            )
+        return ExecutionPlan(
+            names=order,
+            shapes=shapes,
+            blocks=tuple(assignment.blocks[name] for name in order),
+            block_sizes=tuple(assignment.block_sizes),
+            inputs=tuple(index[name] for name in inputs),
+            outputs=tuple(i for i, name in enumerate(order) if name in outputs),
+            steps=tuple(steps),
+            dtype=np.dtype(dtype),
+        )
+
+
+@dataclass(frozen=True)
+class _Step:
+    kernel: Kernel | None
+    """`None` for inputs of the graph"""
+    node: Node
+    inputs: tuple[int, ...]
+    output: int
+
+
+class ExecutionPlan:
+    """Flat sequence of kernel calls created by `Interpreter.compile`.
+
+    Call the plan with a mapping from input node names to arrays of shape
+    `(batch, *output_shape)`. Returns copies of the outputs by node name.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        shapes: Sequence[tuple[int, ...]],
+        blocks: Sequence[int],
+        block_sizes: Sequence[int],
+        inputs: Sequence[int],
+        outputs: Iterable[int],
+        steps: Sequence[_Step],
+        dtype: np.dtype,
+    ) -> None:
+        self._names = names
+        self._shapes = shapes
+        self._blocks = blocks
+        self._block_sizes = block_sizes
+        self._inputs = inputs
+        self._outputs = frozenset(outputs)
+        self._steps = steps
+        self._dtype = dtype
+        self._buffers: dict[int, list[np.ndarray]] = {}
+
+    @property
+    def memory_per_sample(self) -> int:
+        """Number of values stored in the shared blocks for each sample of a batch."""
+        return sum(self._block_sizes)
+
+    def __call__(self, inputs: Mapping[str, np.ndarray]) -> dict[str, np.ndarray]:
+        batch_size = self._batch_size(inputs)
+        buffers = self._buffers_for(batch_size)
+        for i in self._inputs:
+            name = self._names[i]
+            if name not in inputs:
+                raise InterpreterError(f"missing input {name}")
+            if np.shape(inputs[name]) != buffers[i].shape:
+                raise InterpreterError(
+                    f"expected input {name} of shape {buffers[i].shape}, found {np.shape(inputs[name])}"
+                )
+        results = {}
+        for step in self._steps:
+            out = buffers[step.output]
+            if step.kernel is None:
+                np.copyto(out, inputs[step.node.name], casting="same_kind")
+            else:
+                step.kernel(step.node, [buffers[i] for i in step.inputs], out)
+            if step.output in self._outputs:
+                results[self._names[step.output]] = out.copy()
+        return results
+
+    def _batch_size(self, inputs: Mapping[str, np.ndarray]) -> int:
+        sizes = {np.shape(v)[0] for v in inputs.values()}
+        if len(sizes) != 1:
+            raise InterpreterError(f"inputs have different batch sizes {sizes}")
+        return sizes.pop()
+
+    def _buffers_for(self, batch_size: int) -> list[np.ndarray]:
+        if batch_size not in self._buffers:
+            blocks = [
+                np.empty((batch_size, size), dtype=self._dtype)
+                for size in self._block_sizes
+            ]
+            self._buffers[batch_size] = [
+                blocks[block][:, : int(np.prod(shape))].reshape(batch_size, *shape)
+                for block, shape in zip(self._blocks, self._shapes)
+            ]
+        return self._buffers[batch_size]
+
+
+def _output_shape(n: Node) -> tuple[int, ...]:
+    if "output_shape" not in n.data:
+        raise InterpreterError(f"node {n.name} has no output shape")
+    return tuple(n.data["output_shape"])  # type: ignore[arg-type]
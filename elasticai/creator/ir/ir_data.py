@@ -44,6 +44,8 @@ class IrData(metaclass=IrDataMeta, create_init=False):
       still need to refer to one of the provided field types, because they need to be analyzed by the metaclass.
     """
 
+    __slots__ = ("_field_cache",)  # used by `CachedRequiredField`
+
     _fields: dict[str, type]  # only here for type checkers
 
     attributes: AttributesDescriptor = AttributesDescriptor()
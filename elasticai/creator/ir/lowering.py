@@ -1,11 +1,13 @@
 from abc import abstractmethod
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from functools import wraps
 from typing import Generic, ParamSpec, Protocol, TypeVar
 
 from elasticai.creator.function_utils import KeyedFunctionDispatcher as _Registry
 from elasticai.creator.function_utils import RegisterDescriptor
 
+from .change_journal import ChangeJournal
+
 
 class Lowerable(Protocol):
     @property
@@ -42,6 +44,21 @@ class LoweringPass(Generic[Tin, Tout]):
         for arg in args:
             yield from self._fns(arg)
 
+    def lower_changed(
+        self, nodes: Mapping[str, Tin], changes: ChangeJournal
+    ) -> dict[str, tuple[Tout, ...]]:
+        """Lower only the `nodes` affected by `changes` and return the results by node name.
+
+        Typically called as `p.lower_changed(graph.nodes, graph.take_changes())`
+        to update previously lowered results. Results for nodes in
+        `changes.removed_nodes` are outdated and should be discarded by the caller.
+        """
+        return {
+            name: tuple(self._fns(nodes[name]))
+            for name in sorted(changes.affected_nodes())
+            if name in nodes
+        }
+
     def _check_for_redefinition(self, arg):
         if arg in self._fns:
             raise ValueError(f"function for {arg} already defined in lowering pass")
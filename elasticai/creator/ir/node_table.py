@@ -0,0 +1,247 @@
+from array import array
+from collections.abc import Iterator, MutableMapping
+from typing import Any, Generic, TypeVar
+
+from .array_attribute import ArrayAttribute
+from .attribute import Attribute
+from .core import Node
+
+N = TypeVar("N", bound=Node)
+
+_MISSING: Any = object()
+
+
+_INTERNED_SCALARS = (int, float, str, bool, ArrayAttribute)
+
+
+def _structure(value: Any) -> Any:
+    """Types of `value` and of all its elements, `None` if `value` cannot be interned.
+
+    Interned values are looked up by their structure and value, so equal
+    values of different types, e.g., `1` and `1.0`, are kept apart.
+    """
+    t = type(value)
+    if t is tuple:
+        elements = tuple(map(_structure, value))
+        return None if None in elements else elements
+    if t in _INTERNED_SCALARS:
+        return t
+    return None
+
+
+class NodeTable(MutableMapping[str, N], Generic[N]):
+    """Columnar storage for the nodes of very large graphs.
+
+    Instead of one `data` dictionary per node, the table keeps one column
+    per required field of the stored node classes, e.g., `name`, `type`,
+    `implementation` and the shapes of a `VhdlNode`. Columns store ids
+    of interned values, so repeated values like types and shapes are
+    stored once per table. Names are unique, hence they are stored as
+    references without interning. All other attributes go to a side table
+    that only holds entries for nodes that actually have them.
+
+    Reading a node returns a lightweight view, i.e., a new instance of
+    the stored node class whose `data` is a mapping backed by the table.
+    Thus the field descriptors of `IrData` work as usual and writing to
+    the `data` of a view writes to the table.
+
+    Pass `NodeTable` as `node_table` to `ir.Graph` to use it as node store.
+
+    NOTE: Replacing a node reuses its row and rows of removed nodes are
+      reused by nodes added later, so the table only grows with the number
+      of nodes stored at the same time. Views of replaced or removed nodes
+      raise a `KeyError` on access.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[str, int] = {}
+        self._num_rows = 0
+        self._names: list[str] = []
+        self._columns: dict[str, array] = {}
+        self._values: list[Any] = []
+        self._value_ids: dict[Any, int] = {}
+        self._classes: list[type[N]] = []
+        self._class_of_row = array("i")
+        self._generations = array("I")
+        self._free_rows: list[int] = []
+        self._side: dict[int, dict[str, Attribute]] = {}
+
+    def __getitem__(self, name: str) -> N:
+        row = self._rows[name]
+        data = _RowData(self, row, self._generations[row])
+        return self._classes[self._class_of_row[row]](data)  # type: ignore[call-arg]
+
+    def __setitem__(self, name: str, n: N) -> None:
+        data = dict(n.data)
+        row = self._rows.get(name)
+        if row is None:
+            row = self._new_row()
+        else:
+            self._clear_row(row)
+        self._class_of_row[row] = self._class_id(type(n))
+        for key in type(n).required_fields:
+            if key != "name" and key not in self._columns:
+                self._columns[key] = array("i", [-1]) * self._num_rows
+        for key, value in data.items():
+            self._set(row, key, value)
+        self._rows[name] = row
+
+    def __delitem__(self, name: str) -> None:
+        row = self._rows.pop(name)
+        self._clear_row(row)
+        self._free_rows.append(row)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def copy(self) -> "NodeTable[N]":
+        """Copy the table.
+
+        Takes time linear in the number of rows, but the columns are
+        copied as flat arrays instead of node by node.
+        """
+        table: NodeTable[N] = NodeTable()
+        table._rows = dict(self._rows)
+        table._num_rows = self._num_rows
+        table._names = list(self._names)
+        table._columns = {key: column[:] for key, column in self._columns.items()}
+        table._values = list(self._values)
+        table._value_ids = dict(self._value_ids)
+        table._classes = list(self._classes)
+        table._class_of_row = self._class_of_row[:]
+        table._generations = self._generations[:]
+        table._free_rows = list(self._free_rows)
+        table._side = {row: dict(side) for row, side in self._side.items()}
+        return table
+
+    def _class_id(self, cls: type[N]) -> int:
+        try:
+            return self._classes.index(cls)
+        except ValueError:
+            self._classes.append(cls)
+            return len(self._classes) - 1
+
+    def _new_row(self) -> int:
+        if len(self._free_rows) > 0:
+            return self._free_rows.pop()
+        self._class_of_row.append(-1)
+        self._generations.append(0)
+        self._names.append(_MISSING)
+        for column in self._columns.values():
+            column.append(-1)
+        row = self._num_rows
+        self._num_rows += 1
+        return row
+
+    def _clear_row(self, row: int) -> None:
+        """Clear all values of `row` and invalidate its views."""
+        self._names[row] = _MISSING
+        for column in self._columns.values():
+            column[row] = -1
+        self._side.pop(row, None)
+        self._generations[row] += 1
+
+    def _intern(self, value: Attribute) -> int:
+        structure = _structure(value)
+        if structure is None:
+            return -1
+        key = (structure, value)
+        value_id = self._value_ids.get(key)
+        if value_id is None:
+            value_id = len(self._values)
+            self._values.append(value)
+            self._value_ids[key] = value_id
+        return value_id
+
+    def _get(self, row: int, key: str) -> Attribute:
+        if key == "name" and self._names[row] is not _MISSING:
+            return self._names[row]
+        column = self._columns.get(key)
+        if column is not None:
+            value_id = column[row]
+            if value_id >= 0:
+                return self._values[value_id]
+        side = self._side.get(row)
+        if side is not None:
+            return side[key]
+        raise KeyError(key)
+
+    def _set(self, row: int, key: str, value: Attribute) -> None:
+        if key == "name":
+            self._names[row] = value  # type: ignore[assignment]
+            return
+        column = self._columns.get(key)
+        value_id = -1
+        if column is not None:
+            value_id = self._intern(value)
+        if value_id >= 0:
+            column[row] = value_id  # type: ignore[index]
+            self._delete_from_side(row, key)
+        else:
+            if column is not None:
+                column[row] = -1
+            self._side.setdefault(row, {})[key] = value
+
+    def _delete(self, row: int, key: str) -> None:
+        column = self._columns.get(key)
+        if key == "name" and self._names[row] is not _MISSING:
+            self._names[row] = _MISSING
+        elif column is not None and column[row] >= 0:
+            column[row] = -1
+        elif not self._delete_from_side(row, key):
+            raise KeyError(key)
+
+    def _delete_from_side(self, row: int, key: str) -> bool:
+        side = self._side.get(row)
+        if side is None or key not in side:
+            return False
+        del side[key]
+        if len(side) == 0:
+            del self._side[row]
+        return True
+
+    def _keys(self, row: int) -> Iterator[str]:
+        if self._names[row] is not _MISSING:
+            yield "name"
+        for key, column in self._columns.items():
+            if column[row] >= 0:
+                yield key
+        yield from self._side.get(row, ())
+
+
+class _RowData(MutableMapping[str, Attribute]):
+    __slots__ = ("_table", "_row", "_generation")
+
+    def __init__(self, table: NodeTable, row: int, generation: int) -> None:
+        self._table = table
+        self._row = row
+        self._generation = generation
+
+    def _live_row(self) -> int:
+        if self._table._generations[self._row] != self._generation:
+            raise KeyError("node was replaced or removed from its table")
+        return self._row
+
+    def __getitem__(self, key: str) -> Attribute:
+        return self._table._get(self._live_row(), key)
+
+    def __setitem__(self, key: str, value: Attribute) -> None:
+        self._table._set(self._live_row(), key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._table._delete(self._live_row(), key)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._table._keys(self._live_row())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
@@ -0,0 +1,115 @@
+from collections.abc import Iterator, MutableMapping
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class Overlay(MutableMapping[K, V], Generic[K, V]):
+    """Copy-on-write view of a mapping that is shared with other overlays.
+
+    All writes go to a table of changes, the `base` is never modified.
+    Thus copies of graphs can share their tables and only need memory
+    proportional to their own changes. Use `Overlay.over` to create
+    overlays instead of calling the constructor.
+
+    The iteration order is the same as for a `dict` that received the
+    same operations: replaced keys keep their position, keys that are
+    added or removed and added again come last.
+
+    IMPORTANT: The `base` must not be modified after the first overlay
+      was created for it.
+    """
+
+    _MAX_CHANGES_RATIO = 0.5
+
+    def __init__(
+        self,
+        base: MutableMapping[K, V],
+        changes: dict[K, V],
+        hidden: set[K],
+        length: int,
+    ) -> None:
+        self._base = base
+        self._changes = changes
+        self._hidden = hidden
+        self._len = length
+
+    @classmethod
+    def over(cls, table: MutableMapping[K, V]) -> MutableMapping[K, V]:
+        """Create a new overlay on top of `table`.
+
+        For an overlay, the result shares the base of `table` and copies
+        only its changes. If the changes make up a large part of the
+        table, they are merged into a new, independent table instead.
+        """
+        if not isinstance(table, Overlay):
+            return cls(table, {}, set(), len(table))
+        num_changes = len(table._changes) + len(table._hidden)
+        if num_changes > cls._MAX_CHANGES_RATIO * len(table._base):
+            return table._merged()
+        return cls(table._base, dict(table._changes), set(table._hidden), table._len)
+
+    def changed_keys(self, other: MutableMapping[K, V]) -> set[K] | None:
+        """Keys whose values might differ between this overlay and `other`.
+
+        Returns `None` if `other` is neither the base of this overlay nor
+        another overlay sharing that base.
+        """
+        keys = self._hidden | self._changes.keys()
+        if other is self._base:
+            return keys
+        if isinstance(other, Overlay) and other._base is self._base:
+            return keys | other._hidden | other._changes.keys()
+        return None
+
+    def copy(self) -> MutableMapping[K, V]:
+        return Overlay.over(self)
+
+    def _merged(self) -> MutableMapping[K, V]:
+        table: Any = self._base.copy()  # type: ignore[attr-defined]
+        for key in self._hidden:
+            del table[key]
+        for key, value in self._changes.items():
+            table[key] = value
+        return table
+
+    def __getitem__(self, key: K) -> V:
+        changes = self._changes
+        if key in changes:
+            return changes[key]
+        if key in self._hidden:
+            raise KeyError(key)
+        return self._base[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if key not in self:
+            self._len += 1
+        self._changes[key] = value
+
+    def __delitem__(self, key: K) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._changes.pop(key, None)
+        if key in self._base:
+            self._hidden.add(key)
+        self._len -= 1
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._changes or (key not in self._hidden and key in self._base)
+
+    def __iter__(self) -> Iterator[K]:
+        hidden = self._hidden
+        base = self._base
+        for key in base:
+            if key not in hidden:
+                yield key
+        for key in self._changes:
+            if key in hidden or key not in base:
+                yield key
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"Overlay({dict(self)!r})"
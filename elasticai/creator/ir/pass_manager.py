@@ -0,0 +1,223 @@
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from .hashing import HasAsDict, content_hash, function_version, hash_graph
+from .lowering import LoweringPass
+
+T = TypeVar("T", bound=HasAsDict)
+
+AnalysisFn = Callable[[T, Mapping[str, Any]], Any]
+TransformFn = Callable[[T, Mapping[str, Any]], T]
+
+
+@dataclass(frozen=True)
+class _Pass(Generic[T]):
+    name: str
+    fn: Callable[[T, Mapping[str, Any]], Any]
+    version: str
+    """qualified name and version of `fn`, see `ir.hashing.function_version`"""
+    requires: tuple[str, ...]
+    invalidates: tuple[str, ...]
+    is_transform: bool
+
+
+@dataclass
+class PassResults(Generic[T]):
+    implementation: T
+    """the implementation after all transforms"""
+    results: dict[str, Any] = field(default_factory=dict)
+
+
+class PassManager(Generic[T]):
+    """Run a sequence of passes on implementations and cache their results.
+
+    Passes are either analyses or transforms. Both are called as
+    `fn(implementation, results)`, where `results` holds the results of
+    the passes named in `requires`. An analysis returns an arbitrary result,
+    a transform returns the transformed implementation and names the
+    results that it `invalidates`. Invalidated results are computed again
+    if a later pass requires them, otherwise they are dropped from the
+    returned results.
+
+    Each result is cached under the content hash of the implementation
+    it was computed for (see `ir.hashing`), the version of the pass
+    function and the cache keys of the results it required. Running the
+    passes again for an unchanged implementation thus only looks up the
+    cached results, while changing one implementation only executes the
+    passes for that one. Up to `cache_size` results are kept, the least
+    recently used result is evicted first.
+
+    IMPORTANT: Passes have to be deterministic and must not modify their
+      arguments. Results and transformed implementations are shared
+      between runs.
+
+    ```python
+    passes = PassManager()
+
+    @passes.analysis()
+    def buffers(impl, results):
+        ...
+
+    @passes.transform(invalidates=("buffers",))
+    def fuse(impl, results):
+        ...
+        return fused_impl
+
+    passes.add_lowering("vhdl", ir2vhdl, requires=("fuse", "buffers"))
+
+    for r in passes(implementations):
+        write(r.results["vhdl"])
+    ```
+    """
+
+    def __init__(
+        self, hash_fn: Callable[[T], str] = hash_graph, cache_size: int = 1024
+    ) -> None:
+        self._passes: dict[str, _Pass[T]] = {}
+        self._hash = hash_fn
+        self._cache: OrderedDict[str, Any] = OrderedDict()
+        self._cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+    def analysis(
+        self, name: str | None = None, requires: Iterable[str] = tuple()
+    ) -> Callable[[AnalysisFn], AnalysisFn]:
+        """Decorator to add an analysis, named after the function by default."""
+
+        def register(fn: AnalysisFn) -> AnalysisFn:
+            self._add(name or fn.__name__, fn, requires, tuple(), False)
+            return fn
+
+        return register
+
+    def transform(
+        self,
+        name: str | None = None,
+        requires: Iterable[str] = tuple(),
+        invalidates: Iterable[str] = tuple(),
+    ) -> Callable[[TransformFn], TransformFn]:
+        """Decorator to add a transform, named after the function by default."""
+
+        def register(fn: TransformFn) -> TransformFn:
+            self._add(name or fn.__name__, fn, requires, invalidates, True)
+            return fn
+
+        return register
+
+    def add_lowering(
+        self,
+        name: str,
+        lowering: LoweringPass[Any, Any],
+        requires: Iterable[str] = tuple(),
+    ) -> None:
+        """Add an analysis that lowers the implementation, the result is a tuple of all lowered values."""
+
+        def lower(impl: T, results: Mapping[str, Any]) -> tuple[Any, ...]:
+            return tuple(lowering((impl,)))
+
+        self._add(name, lower, requires, tuple(), False)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def __call__(
+        self, implementations: Iterable[T], targets: Iterable[str] | None = None
+    ) -> Iterator[PassResults[T]]:
+        targets = tuple(self._passes if targets is None else targets)
+        for impl in implementations:
+            yield self.run(impl, targets)
+
+    def run(self, impl: T, targets: Iterable[str] | None = None) -> PassResults[T]:
+        """Run `targets` and the passes they require, all passes in the order they were added by default."""
+        schedule = self._schedule(self._passes if targets is None else targets)
+        run = _Run(self, impl)
+        for name in schedule:
+            run.ensure(name)
+        return PassResults(
+            run.impl,
+            {name: run.results[name] for name in schedule if name in run.results},
+        )
+
+    def _add(
+        self,
+        name: str,
+        fn: Callable,
+        requires: Iterable[str],
+        invalidates: Iterable[str],
+        is_transform: bool,
+    ) -> None:
+        if name in self._passes:
+            raise ValueError(f"pass {name} already defined in pass manager")
+        version = f"{getattr(fn, '__qualname__', '')}:{function_version(fn)}"
+        self._passes[name] = _Pass(
+            name, fn, version, tuple(requires), tuple(invalidates), is_transform
+        )
+
+    def _schedule(self, targets: Iterable[str]) -> list[str]:
+        """Targets in the given order, each preceded by its requirements."""
+        schedule: list[str] = []
+        visiting: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in schedule:
+                return
+            if name not in self._passes:
+                raise KeyError(f"unknown pass {name}")
+            if name in visiting:
+                raise ValueError(f"cyclic requirements for pass {name}")
+            visiting.add(name)
+            for r in self._passes[name].requires:
+                visit(r)
+            visiting.discard(name)
+            schedule.append(name)
+
+        for name in targets:
+            visit(name)
+        return schedule
+
+
+class _Run(Generic[T]):
+    def __init__(self, manager: PassManager[T], impl: T) -> None:
+        self._manager = manager
+        self.impl = impl
+        self._impl_hash = manager._hash(impl)
+        self.results: dict[str, Any] = {}
+        self._keys: dict[str, str] = {}
+
+    def ensure(self, name: str) -> None:
+        if name in self.results:
+            return
+        p = self._manager._passes[name]
+        for r in p.requires:
+            self.ensure(r)
+        key = content_hash(
+            (
+                name,
+                p.version,
+                self._impl_hash,
+                tuple(self._keys[r] for r in p.requires),
+            )
+        )
+        manager = self._manager
+        cache = manager._cache
+        if key in cache:
+            manager.hits += 1
+            cache.move_to_end(key)
+            result = cache[key]
+        else:
+            manager.misses += 1
+            result = p.fn(self.impl, {r: self.results[r] for r in p.requires})
+            cache[key] = result
+            while len(cache) > manager._cache_size:
+                cache.popitem(last=False)
+        self.results[name] = result
+        self._keys[name] = key
+        if p.is_transform:
+            self.impl = result
+            self._impl_hash = self._manager._hash(result)
+            for invalidated in p.invalidates:
+                self.results.pop(invalidated, None)
+                self._keys.pop(invalidated, None)
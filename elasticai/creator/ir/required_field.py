@@ -67,6 +67,49 @@ class RequiredField(Generic[StoredT, VisibleT]):
         instance.data[self.name] = self.set_convert(value)
 
 
+class CachedRequiredField(RequiredField[StoredT, VisibleT]):
+    """
+    A `RequiredField` that remembers the converted value per instance.
+    Use it for fields that are read often and are expensive to convert.
+
+    `get_convert` is called again only after the stored value was replaced,
+    either by writing to the field or by writing to the `data` dictionary
+    directly. The cache compares the stored value by identity, so modifying
+    a mutable stored value *in place* is not detected. Additionally, all reads
+    return the same visible object. Hence, this field should only be used
+    if stored and visible values are immutable, e.g., tuples and `Shape`s.
+
+    The converted values are kept in the `_field_cache` slot provided by `IrData`.
+    For owners without that slot the field behaves like a `RequiredField`.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, instance: HasData, owner=None) -> VisibleT:
+        stored = cast(StoredT, instance.data[self.name])
+        try:
+            cache: dict[str, tuple[StoredT, VisibleT]] = instance._field_cache  # type: ignore[attr-defined]
+        except AttributeError:
+            cache = {}
+            try:
+                instance._field_cache = cache  # type: ignore[attr-defined]
+            except AttributeError:
+                return self.get_convert(stored)
+        entry = cache.get(self.name)
+        if entry is not None and entry[0] is stored:
+            return entry[1]
+        value = self.get_convert(stored)
+        cache[self.name] = (stored, value)
+        return value
+
+    def __set__(self, instance: HasData, value: VisibleT) -> None:
+        super().__set__(instance, value)
+        try:
+            instance._field_cache.pop(self.name, None)  # type: ignore[attr-defined]
+        except AttributeError:
+            pass
+
+
 class SimpleRequiredField(RequiredField[StoredT, StoredT]):
     slots = ("get_convert", "set_convert", "name")
 
@@ -0,0 +1,325 @@
+"""Find and replace structural patterns in an `ir.Graph`.
+
+Example: fuse a linear layer with a following batch normalization
+```python
+rewrite = Rewriter()
+
+@rewrite.rule(Pattern(nodes={"lin": "linear", "bn": "batchnorm"}, edges=[("lin", "bn")]))
+def fuse(match: Match) -> Replacement:
+    lin, bn = match.nodes["lin"], match.nodes["bn"]
+    fused = node(lin.name, "linear", fold_batchnorm(lin.attributes, bn.attributes))
+    return Replacement(nodes=[fused], rewire={"lin": lin.name, "bn": lin.name})
+
+rewrite(graph)
+```
+"""
+
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+from .core import Edge, Node
+from .graph import Graph
+
+N = TypeVar("N", bound=Node)
+E = TypeVar("E", bound=Edge)
+
+
+@dataclass(frozen=True)
+class Pattern:
+    """A weakly connected graph of pattern nodes that match graph nodes by `type`.
+
+    A graph node matched by a pattern node with successors in the pattern
+    may not have successors outside of the match, correspondingly for
+    predecessors. Edges between matched nodes have to be pattern edges.
+    Thereby, the matched subgraph can only be connected to the rest
+    of the graph through the inputs and outputs of the pattern, and
+    replacing it is safe.
+    """
+
+    nodes: Mapping[str, str]
+    edges: Collection[tuple[str, str]] = tuple()
+
+    def __post_init__(self) -> None:
+        if len(self.nodes) == 0:
+            raise ValueError("pattern needs at least one node")
+        for src, sink in self.edges:
+            if src not in self.nodes or sink not in self.nodes:
+                raise ValueError(f"pattern edge ({src}, {sink}) refers to unknown node")
+        if len(self._connected_order(next(iter(self.nodes)))) != len(self.nodes):
+            raise ValueError("pattern has to be weakly connected")
+
+    def _connected_order(self, start: str) -> list[tuple[str, str | None, bool]]:
+        """Pattern nodes reachable from `start` as `(node, visited neighbour, is successor of neighbour)`."""
+        order: list[tuple[str, str | None, bool]] = [(start, None, False)]
+        visited = {start}
+        for current, _, _ in order:
+            for src, sink in self.edges:
+                if src == current and sink not in visited:
+                    visited.add(sink)
+                    order.append((sink, current, True))
+                elif sink == current and src not in visited:
+                    visited.add(src)
+                    order.append((src, current, False))
+        return order
+
+
+@dataclass(frozen=True)
+class Match(Generic[N, E]):
+    graph: Graph[N, E]
+    nodes: Mapping[str, N]
+    """graph nodes by pattern node name"""
+
+    def incoming(self, pattern_node: str) -> tuple[E, ...]:
+        """Edges from nodes outside the match to the node matched by `pattern_node`."""
+        name = self.nodes[pattern_node].name
+        matched = self._matched_names()
+        return tuple(
+            self.graph.edges[(p, name)]
+            for p in self.graph.predecessors(name)
+            if p not in matched
+        )
+
+    def outgoing(self, pattern_node: str) -> tuple[E, ...]:
+        """Edges from the node matched by `pattern_node` to nodes outside the match."""
+        name = self.nodes[pattern_node].name
+        matched = self._matched_names()
+        return tuple(
+            self.graph.edges[(name, s)]
+            for s in self.graph.successors(name)
+            if s not in matched
+        )
+
+    def _matched_names(self) -> set[str]:
+        return {n.name for n in self.nodes.values()}
+
+
+@dataclass(frozen=True)
+class Replacement(Generic[N, E]):
+    """Nodes and edges that replace a match.
+
+    `rewire` maps pattern node names to names of new nodes. The edges
+    connecting the matched node to the rest of the graph are moved
+    to the new node. Connect the remaining inputs and outputs of the
+    match yourself by adding `edges`, e.g., based on `Match.incoming`.
+    """
+
+    nodes: Iterable[N] = tuple()
+    edges: Iterable[E] = tuple()
+    rewire: Mapping[str, str] = field(default_factory=dict)
+
+
+RewriteFn = Callable[[Match[N, E]], "Replacement[N, E] | None"]
+
+
+@dataclass(frozen=True)
+class RewriteRule(Generic[N, E]):
+    """Replace matches of `pattern` by the result of `rewrite`.
+
+    `rewrite` can return `None` to keep the match unchanged, e.g., if
+    the attributes of the matched nodes do not allow the rewrite.
+    """
+
+    pattern: Pattern
+    rewrite: RewriteFn[N, E]
+
+
+class Rewriter(Generic[N, E]):
+    """Apply rewrite rules to a graph until none of them matches anymore.
+
+    Rules are tried in the order they were added. Candidates for matches
+    are looked up via the type index of the graph (see `Graph.nodes_by`),
+    so only nodes of the right type are visited.
+    After a rewrite only the nodes close to the replaced subgraph are
+    searched again.
+    """
+
+    def __init__(self, rules: Iterable[RewriteRule[N, E]] = tuple()) -> None:
+        self._rules: list[RewriteRule[N, E]] = list(rules)
+
+    @property
+    def rules(self) -> tuple[RewriteRule[N, E], ...]:
+        return tuple(self._rules)
+
+    def add_rule(self, rule: RewriteRule[N, E]) -> None:
+        self._rules.append(rule)
+
+    def rule(self, pattern: Pattern) -> Callable[[RewriteFn], RewriteFn]:
+        """Decorator to add a rule for `pattern`."""
+
+        def register(fn: RewriteFn) -> RewriteFn:
+            self.add_rule(RewriteRule(pattern, fn))
+            return fn
+
+        return register
+
+    def __call__(self, graph: Graph[N, E], max_rewrites: int | None = None) -> int:
+        """Rewrite `graph` in place and return the number of applied rewrites.
+
+        Raises a `RuntimeError` if the graph still changes after `max_rewrites`,
+        e.g., because two rules keep undoing each other.
+        """
+        return _Run(self._rules, graph).run(max_rewrites)
+
+
+class _Run(Generic[N, E]):
+    def __init__(self, rules: list[RewriteRule[N, E]], graph: Graph[N, E]) -> None:
+        self._graph = graph
+        self._matchers = [_Matcher(rule, graph) for rule in rules]
+        self._radius = max((len(r.pattern.nodes) - 1 for r in rules), default=0)
+        self._worklists: list[dict[str, None]] = [
+            dict.fromkeys(graph.nodes_by("type", m.anchor_type)) for m in self._matchers
+        ]
+
+    def run(self, max_rewrites: int | None) -> int:
+        rewrites = 0
+        while (found := self._next_rewrite()) is not None:
+            if max_rewrites is not None and rewrites >= max_rewrites:
+                raise RuntimeError(
+                    f"graph did not reach a fixed point after {max_rewrites} rewrites"
+                )
+            self._apply(*found)
+            rewrites += 1
+        return rewrites
+
+    def _next_rewrite(self) -> tuple[Match[N, E], Replacement[N, E]] | None:
+        for matcher, worklist in zip(self._matchers, self._worklists):
+            while worklist:
+                candidate = next(iter(worklist))
+                del worklist[candidate]
+                for match in matcher.matches(candidate):
+                    replacement = matcher.rule.rewrite(match)
+                    if replacement is not None:
+                        return match, replacement
+        return None
+
+    def _apply(self, match: Match[N, E], replacement: Replacement[N, E]) -> None:
+        graph = self._graph
+        new_nodes = tuple(replacement.nodes)
+        edges = list(replacement.edges)
+        boundary: set[str] = set()
+        for pattern_node in match.nodes:
+            target = replacement.rewire.get(pattern_node)
+            for e in match.incoming(pattern_node):
+                boundary.add(e.src)
+                if target is not None:
+                    edges.append(_with_data(e, sink=target))
+            for e in match.outgoing(pattern_node):
+                boundary.add(e.sink)
+                if target is not None:
+                    edges.append(_with_data(e, src=target))
+        removed = [n.name for n in match.nodes.values()]
+        graph.splice_subgraph(remove=removed, nodes=new_nodes, edges=edges)
+        changed = boundary | {n.name for n in new_nodes}
+        self._schedule(self._neighbourhood(changed))
+
+    def _neighbourhood(self, names: set[str]) -> set[str]:
+        graph = self._graph
+        reached = {n for n in names if n in graph.nodes}
+        frontier = reached
+        for _ in range(self._radius):
+            next_frontier = set()
+            for name in frontier:
+                next_frontier.update(graph.successors(name))
+                next_frontier.update(graph.predecessors(name))
+            frontier = next_frontier - reached
+            reached |= frontier
+        return reached
+
+    def _schedule(self, names: set[str]) -> None:
+        nodes = self._graph.nodes
+        for matcher, worklist in zip(self._matchers, self._worklists):
+            for name in names:
+                n = nodes.get(name)
+                if n is not None and n.type == matcher.anchor_type:
+                    worklist[name] = None
+
+
+class _Matcher(Generic[N, E]):
+    def __init__(self, rule: RewriteRule[N, E], graph: Graph[N, E]) -> None:
+        self.rule = rule
+        self._graph = graph
+        pattern = rule.pattern
+        anchor = min(
+            pattern.nodes, key=lambda p: len(graph.nodes_by("type", pattern.nodes[p]))
+        )
+        self.anchor_type = pattern.nodes[anchor]
+        self._order = pattern._connected_order(anchor)
+        self._edges = set(pattern.edges)
+        self._has_successors = {src for src, _ in pattern.edges}
+        self._has_predecessors = {sink for _, sink in pattern.edges}
+
+    def matches(self, anchor: str) -> Iterator[Match[N, E]]:
+        if anchor not in self._graph.nodes:
+            return
+        for assignment in self._extend({}, anchor):
+            if self._is_isolated(assignment):
+                nodes = self._graph.nodes
+                yield Match(
+                    self._graph, {p: nodes[name] for p, name in assignment.items()}
+                )
+
+    def _extend(
+        self, assignment: dict[str, str], candidate: str
+    ) -> Iterator[dict[str, str]]:
+        pattern_node = self._order[len(assignment)][0]
+        if not self._fits(assignment, pattern_node, candidate):
+            return
+        assignment[pattern_node] = candidate
+        if len(assignment) == len(self._order):
+            yield dict(assignment)
+        else:
+            _, neighbour, is_successor = self._order[len(assignment)]
+            matched = assignment[neighbour]  # type: ignore[index]
+            if is_successor:
+                candidates = tuple(self._graph.successors(matched))
+            else:
+                candidates = tuple(self._graph.predecessors(matched))
+            for c in candidates:
+                yield from self._extend(assignment, c)
+        del assignment[pattern_node]
+
+    def _fits(
+        self, assignment: dict[str, str], pattern_node: str, candidate: str
+    ) -> bool:
+        graph = self._graph
+        n = graph.nodes.get(candidate)
+        if n is None or n.type != self.rule.pattern.nodes[pattern_node]:
+            return False
+        if candidate in assignment.values():
+            return False
+        graph_edges = graph.edges
+        for other, name in assignment.items():
+            if (pattern_node, other) in self._edges and (
+                candidate,
+                name,
+            ) not in graph_edges:
+                return False
+            if (other, pattern_node) in self._edges and (
+                name,
+                candidate,
+            ) not in graph_edges:
+                return False
+        return True
+
+    def _is_isolated(self, assignment: dict[str, str]) -> bool:
+        graph = self._graph
+        inverse = {name: p for p, name in assignment.items()}
+        for p, name in assignment.items():
+            for s in graph.successors(name):
+                if s in inverse:
+                    if (p, inverse[s]) not in self._edges:
+                        return False
+                elif p in self._has_successors:
+                    return False
+            for s in graph.predecessors(name):
+                if s in inverse:
+                    if (inverse[s], p) not in self._edges:
+                        return False
+                elif p in self._has_predecessors:
+                    return False
+        return True
+
+
+def _with_data(e: E, **data: str) -> E:
+    return type(e)(dict(e.data) | data)  # type: ignore[call-arg]
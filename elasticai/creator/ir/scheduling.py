@@ -0,0 +1,135 @@
+"""Static ASAP/ALAP scheduling of ir graphs.
+
+Each node takes a number of clock cycles, its latency, to produce its
+output after all of its predecessors have produced theirs. Register
+latency models for node types with `Scheduler.register`, or from plugins
+via `ir.scheduling_plugins.latency_model`.
+
+```python
+scheduler = Scheduler()
+
+@scheduler.register("linear")
+def linear(node: Node) -> int:
+    return node.data["in_features"] + 2
+
+schedule = scheduler(graph)
+print(schedule.report())
+```
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from elasticai.creator.function_utils import RegisterDescriptor
+
+from .core import Edge, Node
+from .graph import Graph
+
+LatencyModel = Callable[[Node], int]
+
+
+@dataclass(frozen=True)
+class Schedule:
+    """Start cycles of all nodes, with `asap` the earliest and `alap` the latest start that does not increase `total_latency`."""
+
+    latency: dict[str, int] = field(default_factory=dict)
+    asap: dict[str, int] = field(default_factory=dict)
+    alap: dict[str, int] = field(default_factory=dict)
+    total_latency: int = 0
+    critical_path: tuple[str, ...] = tuple()
+    """nodes from an input to an output without slack"""
+
+    def slack(self, node: str) -> int:
+        """Cycles that the start of `node` can be delayed without increasing the total latency."""
+        return self.alap[node] - self.asap[node]
+
+    @property
+    def slacks(self) -> dict[str, int]:
+        return {name: self.alap[name] - start for name, start in self.asap.items()}
+
+    def report(self) -> str:
+        lines = [
+            f"total latency: {self.total_latency} cycles",
+            "critical path:",
+        ]
+        width = max((len(name) for name in self.critical_path), default=0)
+        for name in self.critical_path:
+            lines.append(
+                f"  {name:<{width}}  start {self.asap[name]:>6}  latency {self.latency[name]:>6}"
+            )
+        return "\n".join(lines)
+
+
+class Scheduler:
+    """Compute the `Schedule` of a graph from the latencies of its nodes.
+
+    Nodes of types without a registered latency model take
+    `default_latency` cycles.
+    """
+
+    register: RegisterDescriptor[Node, int] = RegisterDescriptor()
+
+    def __init__(self, default_latency: int = 0) -> None:
+        self._models: dict[str, LatencyModel] = {}
+        self._default_latency = default_latency
+
+    def _register_callback(self, name: str, fn: LatencyModel) -> None:
+        if name in self._models:
+            raise ValueError(f"latency model for {name} already defined")
+        self._models[name] = fn
+
+    def __call__(self, graph: Graph[Node, Edge]) -> Schedule:
+        order = graph.topological_order()
+        index = {name: i for i, name in enumerate(order)}
+        latency = [self._default_latency] * len(order)
+        for node_type, model in self._models.items():
+            for name, n in graph.nodes_by("type", node_type).items():
+                latency[index[name]] = model(n)
+        successors: list[list[int]] = [[] for _ in order]
+        for src, sink in graph.edges:
+            successors[index[src]].append(index[sink])
+
+        asap = [0] * len(order)
+        total = 0
+        for i, succs in enumerate(successors):
+            finish = asap[i] + latency[i]
+            total = max(total, finish)
+            for s in succs:
+                if asap[s] < finish:
+                    asap[s] = finish
+
+        alap = [0] * len(order)
+        for i in range(len(order) - 1, -1, -1):
+            alap[i] = min([alap[s] for s in successors[i]], default=total) - latency[i]
+
+        return Schedule(
+            latency=dict(zip(order, latency)),
+            asap=dict(zip(order, asap)),
+            alap=dict(zip(order, alap)),
+            total_latency=total,
+            critical_path=tuple(
+                order[i] for i in _critical_path(asap, alap, latency, successors)
+            ),
+        )
+
+
+def _critical_path(
+    asap: list[int], alap: list[int], latency: list[int], successors: list[list[int]]
+) -> list[int]:
+    """Follow critical successors from the first critical input, each node finishing exactly when the next one starts."""
+    current = next(
+        (i for i, (s, a) in enumerate(zip(asap, alap)) if s == 0 and a == 0), None
+    )
+    path = []
+    while current is not None:
+        path.append(current)
+        finish = asap[current] + latency[current]
+        current = next(
+            (
+                s
+                for s in successors[current]
+                if asap[s] == alap[s] and asap[s] == finish
+            ),
+            None,
+        )
+    return path
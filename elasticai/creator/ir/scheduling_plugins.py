@@ -0,0 +1,84 @@
+"""Load latency models for the `Scheduler` from ir2vhdl plugins.
+
+Plugins define latency models with the `latency_model` decorator and
+list them in the `latency_models` field of their `meta.toml` file:
+
+[source,toml]
+----
+[[plugins]]
+name = "my_plugin"
+target_platform = "elastic-node-v5"
+target_runtime = "vhdl"
+version = "0.1"
+api_version = "0.1"
+generated = ["linear"]
+static_files = []
+latency_models = ["linear_latency"]
+----
+
+```python
+@latency_model("linear")
+def linear_latency(node: Node) -> int:
+    return node.data["in_features"] + 2
+
+scheduler = Scheduler()
+SchedulerPluginLoader(scheduler).load_from_package("my_plugin")
+```
+"""
+
+from collections.abc import Iterator
+from functools import update_wrapper
+from typing import Any
+
+import elasticai.creator.function_utils as F
+import elasticai.creator.plugin as _pl
+from elasticai.creator.ir2vhdl import PluginSpec
+from elasticai.creator.plugin import PluginLoader as _Loader
+from elasticai.creator.plugin import PluginSymbol as _PluginSymbol
+
+from .core import Node
+from .scheduling import LatencyModel, Scheduler
+
+
+class _LatencyModel(_PluginSymbol[Scheduler]):
+    """Only loaded into a `Scheduler`, plugins list latency models in `latency_models`."""
+
+    def __init__(self, name: str, fn: LatencyModel):
+        self._name = name
+        self._fn = fn
+        update_wrapper(self, fn)
+
+    def load_into(self, receiver: Any) -> None:
+        if isinstance(receiver, Scheduler):
+            receiver.register(self._name, self._fn)
+
+    def __call__(self, node: Node) -> int:
+        return self._fn(node)
+
+
+def _latency_model(name: str, fn: LatencyModel) -> _LatencyModel:
+    return _LatencyModel(name, fn)
+
+
+latency_model = F.FunctionDecorator(_latency_model)
+"""Define the latency of the nodes of a type in clock cycles, see `ir.scheduling`."""
+
+
+class SchedulerPluginLoader(_Loader[Scheduler]):
+    """Load the latency models of ir2vhdl plugins into a `Scheduler`."""
+
+    def __init__(self, scheduler: Scheduler):
+        fetcher = (
+            _pl.SymbolFetcherBuilder(PluginSpec)
+            .add_fn(self.__get_latency_models)
+            .build()
+        )
+        super().__init__(fetch=fetcher, plugin_receiver=scheduler)
+
+    @staticmethod
+    def __get_latency_models(plugin: PluginSpec) -> Iterator[_PluginSymbol[Scheduler]]:
+        if plugin.target_runtime == "vhdl":
+            names = plugin.latency_models + plugin.generated
+            for symbol in _pl.import_symbols(plugin.package, names):
+                if isinstance(symbol, _LatencyModel):
+                    yield symbol
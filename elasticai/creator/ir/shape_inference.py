@@ -0,0 +1,222 @@
+"""Static shape inference for ir graphs.
+
+Nodes store their shapes as tuples under the keys `input_shape` and
+`output_shape`, like `ir2vhdl.VhdlNode`. Filters, e.g., convolutions,
+pooling and linear layers, store their `FilterParameters` as a dictionary
+(see `FilterParameters.as_dict`) under the key `filter_parameters`.
+
+`ShapeInference` propagates the shapes from the inputs of the graph to
+all other nodes and fills `input_size`, `output_size` and `num_steps` of
+the filter parameters. Thus, it is not necessary to run an inference
+with the original model to learn these sizes.
+
+Shapes are handled as `(depth, width)`, i.e., `(channels, spatial size)`.
+Shapes with a single value are read as `(1, width)`, the width and height
+of three-dimensional shapes are flattened.
+"""
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any, TypeAlias
+
+import numpy as np
+
+from elasticai.creator.function_utils import RegisterDescriptor
+
+from .core import Edge, Node
+from .graph import Graph
+from .helpers import ShapeTuple
+
+ShapeRule: TypeAlias = Callable[[np.ndarray, Sequence[Node]], np.ndarray]
+"""Compute the output shapes of nodes of the same type.
+
+Called with an integer array of shape `(num_nodes, 2)` holding the
+input shapes as `(depth, width)` rows and the corresponding nodes.
+Returns the output shapes in the same layout. The nodes are copies
+that replace the original nodes afterward, so rules can write additional
+results to their `data`.
+"""
+
+_FILTER = "filter_parameters"
+
+
+class ShapeInferenceError(Exception):
+    pass
+
+
+class ShapeInference:
+    """Infer the shapes of all nodes of a graph, level by level.
+
+    Nodes of the same topological level are grouped by type and each group
+    is handled by a single call of its `ShapeRule`. Register rules for
+    node types with `register`. Nodes without a rule are handled by
+    the rule for filters if they define `filter_parameters`, all other
+    nodes keep their input shape.
+
+    A node with several predecessors requires all of them to produce the
+    same shape unless a rule was registered for its type, in that case the
+    rule receives the output shape of the first predecessor.
+    """
+
+    register: RegisterDescriptor[np.ndarray, np.ndarray] = RegisterDescriptor()
+
+    def __init__(self) -> None:
+        self._rules: dict[str, ShapeRule] = {}
+
+    def _register_callback(self, name: str, fn: ShapeRule) -> None:
+        if name in self._rules:
+            raise ValueError(f"shape rule for {name} already defined")
+        self._rules[name] = fn
+
+    def __call__(
+        self,
+        graph: Graph[Node, Edge],
+        input_shapes: Mapping[str, ShapeTuple] | None = None,
+    ) -> None:
+        """Write the inferred shapes to the nodes of `graph`.
+
+        Nodes without predecessors take their shape from `input_shapes`
+        or from their own `input_shape` otherwise. Updated nodes replace
+        the old ones via `Graph.replace_node`, so the changes are recorded
+        by the graph and snapshots of the graph are not affected.
+        """
+        input_shapes = dict(input_shapes or {})
+        outputs: dict[str, tuple[int, int]] = {}
+        for level in _levels(graph):
+            groups: dict[str, list[Node]] = {}
+            for name in level:
+                n = _copy(graph.nodes[name])
+                groups.setdefault(self._rule_key(n), []).append(n)
+            for key, nodes in groups.items():
+                inputs = np.array(
+                    [
+                        self._input_shape(graph, n, outputs, input_shapes, key)
+                        for n in nodes
+                    ],
+                    dtype=np.int64,
+                ).reshape(-1, 2)
+                results = self._rule(key)(inputs, nodes)
+                for n, i, o in zip(nodes, inputs.tolist(), results.tolist()):
+                    outputs[n.name] = (o[0], o[1])
+                    graph.replace_node(_with_shapes(n, i, o))
+
+    def _rule_key(self, n: Node) -> str:
+        if n.type in self._rules:
+            return n.type
+        if _FILTER in n.data:
+            return _FILTER
+        return ""
+
+    def _rule(self, key: str) -> ShapeRule:
+        if key == _FILTER:
+            return filter_rule
+        if key == "":
+            return _keep_shape
+        return self._rules[key]
+
+    @staticmethod
+    def _input_shape(
+        graph: Graph[Node, Edge],
+        n: Node,
+        outputs: Mapping[str, tuple[int, int]],
+        input_shapes: Mapping[str, ShapeTuple],
+        key: str,
+    ) -> tuple[int, int]:
+        predecessors = tuple(graph.predecessors(n.name))
+        if len(predecessors) == 0:
+            if n.name in input_shapes:
+                return _as_2d(input_shapes[n.name])
+            if "input_shape" in n.data:
+                return _as_2d(n.data["input_shape"])
+            raise ShapeInferenceError(f"missing input shape for node {n.name}")
+        shapes = {outputs[p] for p in predecessors}
+        if len(shapes) > 1 and key in ("", _FILTER):
+            raise ShapeInferenceError(
+                f"predecessors of {n.name} produce different shapes {shapes}"
+            )
+        return outputs[predecessors[0]]
+
+
+def filter_rule(inputs: np.ndarray, nodes: Sequence[Node]) -> np.ndarray:
+    """Output shapes for filters, also writes `input_size`, `output_size` and `num_steps` to the filter parameters."""
+    params = np.array(
+        [
+            [
+                p["kernel_size"],
+                p["in_channels"],
+                p["out_channels"],
+                p["stride"],
+            ]
+            for p in (n.data[_FILTER] for n in nodes)
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 4)
+    kernel_size, in_channels, out_channels, stride = params.T
+    depth, width = inputs.T
+    is_flat = kernel_size == -1
+    expected_channels = np.where(is_flat, depth * width, depth)
+    input_size = np.where(is_flat, in_channels, width)
+    effective_kernel_size = np.where(is_flat, input_size, kernel_size)
+    num_steps = (input_size - effective_kernel_size) // stride + 1
+    _check(
+        nodes,
+        expected_channels == in_channels,
+        "expected {} input channels",
+        in_channels,
+    )
+    _check(
+        nodes, num_steps >= 1, "input of width {} is too small for kernel", input_size
+    )
+    for n, i, s in zip(nodes, input_size.tolist(), num_steps.tolist()):
+        n.data[_FILTER] = n.data[_FILTER] | {
+            "input_size": i,
+            "output_size": s,
+            "num_steps": s,
+        }
+    return np.stack((out_channels, num_steps), axis=1)
+
+
+def _keep_shape(inputs: np.ndarray, nodes: Sequence[Node]) -> np.ndarray:
+    return inputs
+
+
+def _check(
+    nodes: Sequence[Node], ok: np.ndarray, message: str, values: np.ndarray
+) -> None:
+    if not ok.all():
+        i = int(np.argmin(ok))
+        raise ShapeInferenceError(
+            f"node {nodes[i].name}: " + message.format(values[i].item())
+        )
+
+
+def _as_2d(shape: Iterable[int]) -> tuple[int, int]:
+    values = tuple(shape)
+    if len(values) == 1:
+        return 1, values[0]
+    if len(values) == 2:
+        return values[0], values[1]
+    if len(values) == 3:
+        return values[0], values[1] * values[2]
+    raise ShapeInferenceError(f"unsupported shape {values}")
+
+
+def _copy(n: Node) -> Any:
+    return type(n)(dict(n.data))  # type: ignore[call-arg]
+
+
+def _with_shapes(n: Node, input_shape: list[int], output_shape: list[int]) -> Node:
+    n.data["input_shape"] = tuple(input_shape)
+    n.data["output_shape"] = tuple(output_shape)
+    return n
+
+
+def _levels(graph: Graph[Node, Edge]) -> list[list[str]]:
+    level_of: dict[str, int] = {}
+    levels: list[list[str]] = []
+    for name in graph.topological_order():
+        level = 1 + max((level_of[p] for p in graph.predecessors(name)), default=-1)
+        level_of[name] = level
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(name)
+    return levels
@@ -1,17 +1,41 @@
+import atexit
+import hashlib
 import importlib.resources as res
+import io
+import json
+import os
 import re
+import shutil
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable, Sequence
-from dataclasses import dataclass
-from typing import Any, Iterator, TypeAlias, TypeVar
+from collections.abc import Callable, Iterable, Mapping, MutableSet, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain
+from pathlib import Path
+from typing import Any, ClassVar, Iterator, TextIO, TypeAlias, TypeVar
+
+from typing_extensions import Self
 
 import elasticai.creator.function_utils as F
 import elasticai.creator.plugin as _pl
 from elasticai.creator.function_utils import KeyedFunctionDispatcher
+from elasticai.creator.ir import (
+    CachedRequiredField,
+    Graph,
+    Lowerable,
+    LoweringPass,
+    RequiredField,
+    binary_format,
+)
 from elasticai.creator.ir import Edge as _Edge
-from elasticai.creator.ir import Graph, Lowerable, LoweringPass, RequiredField
 from elasticai.creator.ir import Node as _Node
+from elasticai.creator.ir.change_journal import ChangeJournal
+from elasticai.creator.ir.graph import GraphDelegateFactory, NodeTableFactory
+from elasticai.creator.ir.graph_delegate import GraphDelegate
 from elasticai.creator.ir.graph_iterators import bfs_iter_up
+from elasticai.creator.ir.hashing import content_hash, function_version, hash_graph
 from elasticai.creator.ir.helpers import Shape, ShapeTuple
 from elasticai.creator.plugin import PluginLoader as _Loader
 from elasticai.creator.plugin import PluginSpec as _PluginSpec
@@ -20,11 +44,22 @@ from elasticai.creator.plugin import PluginSymbol as _PluginSymbol
 
 @dataclass
 class PluginSpec(_PluginSpec):
+    """Fields of the `meta.toml` file of an ir2vhdl plugin.
+
+    `generated` lists the type handlers of the plugin. A handler is
+    assumed to lower the type named like its symbol, unless `types` maps
+    the symbol name to the handled type, e.g., `types = {conv_handler = "conv"}`.
+    Latency models for the `Scheduler` are listed in `latency_models`,
+    see `ir.scheduling_plugins`.
+    """
+
     generated: tuple[str, ...]
     static_files: tuple[str, ...]
+    types: dict[str, str] = field(default_factory=dict)
+    latency_models: tuple[str, ...] = tuple()
 
 
-class ShapeField(RequiredField[ShapeTuple, Shape]):
+class ShapeField(CachedRequiredField[ShapeTuple, Shape]):
     def __init__(self):
         super().__init__(
             set_convert=lambda x: x.to_tuple(), get_convert=Shape.from_tuple
@@ -109,8 +144,10 @@ class Implementation(Graph[N, E], Lowerable):
         attributes: dict[str, Any],
         nodes=tuple(),
         edges=tuple(),
+        graph_delegate: GraphDelegateFactory = GraphDelegate,
+        node_table: NodeTableFactory = dict,
     ) -> None:
-        super().__init__(nodes, edges)
+        super().__init__(nodes, edges, graph_delegate, node_table)
         self._name = name
         self._type = type
         self.attributes = attributes
@@ -123,6 +160,12 @@ class Implementation(Graph[N, E], Lowerable):
     def name(self) -> str:
         return self._name
 
+    def snapshot(self) -> Self:
+        """See `ir.Graph.snapshot`. The `attributes` dict is copied shallowly."""
+        snap = super().snapshot()
+        snap.attributes = dict(self.attributes)
+        return snap
+
     def asdict(self) -> dict[str, Any]:
         return {
             "nodes": [n.data for n in self.nodes.values()],
@@ -142,6 +185,19 @@ class Implementation(Graph[N, E], Lowerable):
             edges=map(Edge, data["edges"]),
         )
 
+    def save(self, file: str | os.PathLike) -> None:
+        """Write the implementation in the binary format of `ir.binary_format`."""
+        binary_format.dump(self.asdict(), file)
+
+    @classmethod
+    def load(cls, file: str | os.PathLike) -> "Implementation":
+        """Read a file written by `save`.
+
+        Use `ir.binary_format.load` directly to decode only some of the nodes.
+        """
+        with binary_format.load(file) as data:
+            return cls.fromdict(data.asdict())
+
     def iterate_bfs_up_from(self, node: str) -> Iterator[N]:
         nodes = self.nodes
         for name in bfs_iter_up(self._g.get_predecessors, self._g.get_successors, node):
@@ -151,23 +207,543 @@ class Implementation(Graph[N, E], Lowerable):
 Code: TypeAlias = tuple[str, Sequence[str]]
 
 
+class CodeWriter:
+    """Writes the lines of a vhdl file to a buffered text stream as they are produced.
+
+    Streaming type handlers receive a `CodeWriter` instead of returning
+    their `Code`, e.g.,
+
+    ```python
+    @lowering.register_streaming
+    def network(impl: Implementation, out: CodeWriter) -> None:
+        out.write_lines(entity_header(impl))
+        for instance in instances:
+            out.write_lines(instance.define_signals())
+        ...
+    ```
+
+    Only the buffer of the stream is kept in memory, not the whole file.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def write_line(self, line: str) -> None:
+        self._stream.write(line)
+        self._stream.write("\n")
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        write = self._stream.write
+        for line in lines:
+            write(line)
+            write("\n")
+
+
+StreamingTypeHandlerFn: TypeAlias = Callable[[Implementation, CodeWriter], None]
+
+
 class Ir2Vhdl(LoweringPass[Implementation, Code]):
+    register_streaming: F.RegisterDescriptor[Implementation, None] = (
+        F.RegisterDescriptor()
+    )
+    """Register a `StreamingTypeHandlerFn`, it writes the file `<implementation name>.vhd`."""
+
     def __init__(self):
         super().__init__()
         self.__static_files: dict[str, Callable[[], str]] = {}
+        self.__streaming: dict[str, StreamingTypeHandlerFn] = {}
+        self.__handlers: dict[str, Callable] = {}
+        self.__lazy: dict[str, Callable[[], None]] = {}
+        self.__plugin_packages: list[str] = []
+        self.__registrations: list[tuple[str, Callable, str]] = []
+        self.__loading_plugins = False
 
     def register_static(self, name: str, fn: Callable[[], str]) -> None:
         self.__static_files[name] = fn
 
-    def __call__(self, args: Iterable[Implementation]) -> Iterator[Code]:
-        for name, content in super().__call__(args):
+    def _register_callback(self, name: str, fn: Callable) -> None:
+        super()._register_callback(name, fn)
+        self.__record(name, fn, "single")
+
+    def _register_iterable_callback(self, name: str, fn: Callable) -> None:
+        super()._register_iterable_callback(name, fn)
+        self.__record(name, fn, "iterable")
+
+    def _register_streaming_callback(
+        self, name: str, fn: StreamingTypeHandlerFn
+    ) -> None:
+        def collect(impl: Implementation) -> Code:
+            buffer = io.StringIO()
+            fn(impl, CodeWriter(buffer))
+            return impl.name, buffer.getvalue().splitlines()
+
+        super()._register_callback(name, collect)
+        self.__streaming[name] = fn
+        self.__record(name, fn, "streaming")
+
+    def __record(self, name: str, fn: Callable, kind: str) -> None:
+        self.__handlers[name] = fn
+        if not self.__loading_plugins:
+            self.__registrations.append((name, fn, kind))
+
+    def _register_lazy(self, names: Iterable[str], load: Callable[[], None]) -> None:
+        """Defer `load` until an implementation of one of the types `names` is lowered.
+
+        Used by the `PluginLoader` to import plugin modules only when needed.
+        `load` is called at most once and should register all `names`.
+        """
+        for name in names:
+            self.__lazy[name] = load
+
+    def _load_type(self, type: str) -> None:
+        """Run the deferred loading for `type`.
+
+        Types registered under a name that differs from their plugin
+        symbol are not known in advance. If `type` is still missing after
+        running the loader listed for it, or no loader is listed, all
+        remaining plugin modules are loaded.
+        """
+        if type in self._fns:
+            return
+        load = self.__lazy.get(type)
+        if load is not None:
+            self.__run_lazy(load)
+            if type in self._fns:
+                return
+        for load in list(dict.fromkeys(self.__lazy.values())):
+            self.__run_lazy(load)
+
+    def __run_lazy(self, load: Callable[[], None]) -> None:
+        self.__lazy = {k: v for k, v in self.__lazy.items() if v is not load}
+        previous = self.__loading_plugins
+        self.__loading_plugins = True
+        try:
+            load()
+        finally:
+            self.__loading_plugins = previous
+
+    def __loading_types(
+        self, args: Iterable[Implementation]
+    ) -> Iterator[Implementation]:
+        for impl in args:
+            self._load_type(impl.type)
+            yield impl
+
+    def lower_changed(
+        self, nodes: Mapping[str, Implementation], changes: ChangeJournal
+    ) -> dict[str, tuple[Code, ...]]:
+        for name in changes.affected_nodes():
+            if name in nodes:
+                self._load_type(nodes[name].type)
+        return super().lower_changed(nodes, changes)
+
+    @contextmanager
+    def _loading_plugins_from(self, package: str) -> Iterator[None]:
+        """Used by the `PluginLoader`, so worker processes can load the same plugins."""
+        self.__loading_plugins = True
+        try:
+            yield
+        finally:
+            self.__loading_plugins = False
+        self.__plugin_packages.append(package)
+
+    def __call__(
+        self, args: Iterable[Implementation], jobs: int | None = None
+    ) -> Iterator[Code]:
+        """Lower `args` and yield the code for each of them followed by the static files.
+
+        Pass `jobs` to lower the implementations in that many worker processes.
+        The results are still yielded in the order of `args`. Each worker
+        creates its own `Ir2Vhdl`, loads the same plugin packages and
+        repeats all other registrations. Hence, the implementations and the
+        functions that were registered directly have to be picklable, e.g.,
+        functions defined at module level.
+        """
+        if jobs is None or jobs <= 1:
+            lowered: Iterable[Code] = super().__call__(self.__loading_types(args))
+        else:
+            lowered = self.__lower_in_processes(args, jobs)
+        for name, content in lowered:
             yield f"{name}.vhd", content
         for name, fn in self.__static_files.items():
             yield name, fn()
 
+    def write(
+        self,
+        args: Iterable[Implementation],
+        destination: str | os.PathLike,
+        buffer_size: int = 2**16,
+        link_static_files: bool = False,
+    ) -> list[Path]:
+        """Lower `args` and write the files to the directory `destination`, followed by the static files.
+
+        Streaming type handlers write to a `CodeWriter` bound to their
+        file, so the memory needed to generate a file is bounded by
+        `buffer_size` instead of the size of the file. The content returned
+        by other handlers is written line by line as well, e.g., handlers can
+        return generators instead of tuples. Returns the written paths.
+
+        Static files of plugins are copied from their package without
+        decoding them. With `link_static_files` they are hard linked
+        instead, if the build directory is on the same file system.
+        Never modify linked files in place, as that would modify the
+        installed package as well.
+        """
+        destination = Path(destination)
+        destination.mkdir(parents=True, exist_ok=True)
+        written = []
+        for name, emit in chain.from_iterable(map(self.__files_of, args)):
+            path = destination / name
+            _write_text(path, emit, buffer_size)
+            written.append(path)
+        for name, fn in self.__static_files.items():
+            path = destination / name
+            if isinstance(fn, _StaticFile):
+                _export_file(fn.path, path, link_static_files)
+            else:
+                _write_text(path, partial(_emit_static, fn), buffer_size)
+            written.append(path)
+        return written
+
+    def build(
+        self,
+        args: Iterable[Implementation],
+        destination: str | os.PathLike,
+        manifest: str | os.PathLike | None = None,
+        buffer_size: int = 2**16,
+        link_static_files: bool = False,
+    ) -> "BuildReport":
+        """Like `write`, but skip everything that did not change since the last build.
+
+        The manifest, `destination/.ir2vhdl_manifest.json` by default, stores
+        the hash of each implementation and the version of its handler
+        together with the hashes of the written files. Implementations with
+        an unchanged hash are not lowered again. Files are only replaced if
+        their content changed, so unchanged files keep their modification
+        time. The version of a handler is the value of its `version`
+        attribute, if defined, and derived from its bytecode otherwise.
+        Set `version` when a handler depends on helpers that might change.
+        """
+        destination = Path(destination)
+        destination.mkdir(parents=True, exist_ok=True)
+        manifest_path = (
+            destination / MANIFEST_NAME if manifest is None else Path(manifest)
+        )
+        old = _read_manifest(manifest_path)
+        new: dict[str, Any] = {"version": 1, "implementations": {}, "static_files": {}}
+        report = BuildReport()
+
+        def write(files: Iterable[tuple[str, Callable[[TextIO], None]]]) -> dict:
+            outputs = {}
+            for name, emit in files:
+                path = destination / name
+                outputs[name], changed = _write_if_changed(path, emit, buffer_size)
+                (report.changed if changed else report.unchanged).append(path)
+            return outputs
+
+        for impl in self.__loading_types(args):
+            key = content_hash((hash_graph(impl), self.__handler_version(impl.type)))
+            entry = old["implementations"].get(impl.name)
+            if (
+                entry is not None
+                and entry["input"] == key
+                and all(
+                    _is_up_to_date(destination / name, output)
+                    for name, output in entry["outputs"].items()
+                )
+            ):
+                new["implementations"][impl.name] = entry
+                report.unchanged.extend(destination / name for name in entry["outputs"])
+            else:
+                new["implementations"][impl.name] = {
+                    "input": key,
+                    "outputs": write(self.__files_of(impl)),
+                }
+        for name, fn in self.__static_files.items():
+            path = destination / name
+            if isinstance(fn, _StaticFile):
+                output, changed = _export_if_changed(
+                    fn.path, path, old["static_files"].get(name), link_static_files
+                )
+            else:
+                output, changed = _write_if_changed(
+                    path, partial(_emit_static, fn), buffer_size
+                )
+            new["static_files"][name] = output
+            (report.changed if changed else report.unchanged).append(path)
+
+        produced = set(report.changed) | set(report.unchanged)
+        for name in _output_names(old):
+            if destination / name not in produced:
+                report.stale.append(destination / name)
+        _write_manifest(manifest_path, new)
+        return report
+
+    def __files_of(
+        self, impl: Implementation
+    ) -> Iterator[tuple[str, Callable[[TextIO], None]]]:
+        self._load_type(impl.type)
+        streaming = self.__streaming.get(impl.type)
+        if streaming is not None:
+            yield f"{impl.name}.vhd", lambda f: streaming(impl, CodeWriter(f))
+        else:
+            for name, content in LoweringPass.__call__(self, (impl,)):
+                yield (
+                    f"{name}.vhd",
+                    lambda f, content=content: CodeWriter(f).write_lines(content),
+                )
+
+    def __handler_version(self, type: str) -> str:
+        fn = self.__handlers.get(type)
+        if fn is None:
+            return ""
+        return function_version(fn)
+
+    def __lower_in_processes(
+        self, args: Iterable[Implementation], jobs: int
+    ) -> Iterator[Code]:
+        args = list(args)
+        setup = (
+            type(self),
+            tuple(self.__plugin_packages),
+            tuple(self.__registrations),
+        )
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=setup
+        ) as executor:
+            chunksize = max(1, len(args) // (4 * jobs))
+            for codes in executor.map(_lower_in_worker, args, chunksize=chunksize):
+                yield from codes
+
+
+MANIFEST_NAME = ".ir2vhdl_manifest.json"
+
+
+@dataclass
+class BuildReport:
+    """Files written by `Ir2Vhdl.build`.
+
+    `stale` files were produced by the previous build, but not by this
+    one. They are not deleted.
+    """
+
+    changed: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+    stale: list[Path] = field(default_factory=list)
+
+
+def _open_text(path: Path, buffer_size: int) -> TextIO:
+    return path.open("w", encoding="utf-8", newline="\n", buffering=buffer_size)
+
+
+def _write_text(path: Path, emit: Callable[[TextIO], None], buffer_size: int) -> None:
+    path.unlink(missing_ok=True)  # do not write through hard links
+    with _open_text(path, buffer_size) as f:
+        emit(f)
+
+
+def _emit_static(fn: Callable[[], Any], f: TextIO) -> None:
+    content = fn()
+    if isinstance(content, str):
+        f.write(content)
+    else:
+        f.writelines(content)
+
+
+def _export_file(source: Path, destination: Path, link: bool) -> None:
+    """Copy `source` without decoding it, the copy is done by the kernel where possible."""
+    destination.unlink(missing_ok=True)
+    if link:
+        try:
+            os.link(source, destination)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(source, destination)
+
+
+_source_digests: dict[tuple[Path, int, int], str] = {}
+
+
+def _source_digest(source: Path) -> str:
+    stat = source.stat()
+    key = (source, stat.st_size, stat.st_mtime_ns)
+    if key not in _source_digests:
+        _source_digests[key] = _file_digest(source)
+    return _source_digests[key]
+
+
+def _export_if_changed(
+    source: Path, path: Path, previous: dict[str, Any] | None, link: bool
+) -> tuple[dict[str, Any], bool]:
+    digest = _source_digest(source)
+    if previous is not None and previous["hash"] == digest:
+        changed = not _is_up_to_date(path, previous)
+    else:
+        changed = not (path.is_file() and _file_digest(path) == digest)
+    if changed:
+        tmp = path.with_name(f"{path.name}.tmp")
+        try:
+            _export_file(source, tmp, link)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+    stat = path.stat()
+    return {"hash": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}, changed
+
+
+class _HashingStream:
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        self._hash = hashlib.blake2b(digest_size=16)
+
+    def write(self, text: str) -> int:
+        self._hash.update(text.encode("utf-8"))
+        return self._stream.write(text)
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.write(line)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def _file_digest(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(
+            f, lambda: hashlib.blake2b(digest_size=16)
+        ).hexdigest()
+
+
+def _write_if_changed(
+    path: Path, emit: Callable[[TextIO], None], buffer_size: int
+) -> tuple[dict[str, Any], bool]:
+    tmp = path.with_name(f"{path.name}.tmp")
+    try:
+        with _open_text(tmp, buffer_size) as f:
+            stream = _HashingStream(f)
+            emit(stream)  # type: ignore[arg-type]
+        digest = stream.hexdigest()
+        changed = not (path.is_file() and _file_digest(path) == digest)
+        if changed:
+            os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    stat = path.stat()
+    return {"hash": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}, changed
+
+
+def _is_up_to_date(path: Path, output: dict[str, Any]) -> bool:
+    """Cheap check that the file was not modified since it was written."""
+    if not path.is_file():
+        return False
+    stat = path.stat()
+    return stat.st_size == output["size"] and stat.st_mtime_ns == output["mtime_ns"]
+
+
+def _read_manifest(path: Path) -> dict[str, Any]:
+    if path.is_file():
+        try:
+            manifest = json.loads(path.read_text())
+            if manifest.get("version") == 1:
+                return manifest
+        except json.JSONDecodeError:
+            pass
+    return {"version": 1, "implementations": {}, "static_files": {}}
+
+
+def _write_manifest(path: Path, manifest: dict[str, Any]) -> None:
+    path.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+
+
+def _output_names(manifest: dict[str, Any]) -> Iterator[str]:
+    for entry in manifest["implementations"].values():
+        yield from entry["outputs"]
+    yield from manifest["static_files"]
+
+
+_worker_lowering: Ir2Vhdl | None = None
+
+
+def _init_worker(
+    cls: type[Ir2Vhdl],
+    plugin_packages: tuple[str, ...],
+    registrations: tuple[tuple[str, Callable, str], ...],
+) -> None:
+    global _worker_lowering
+    lowering = cls()
+    loader = PluginLoader(lowering)
+    for package in plugin_packages:
+        loader.load_from_package(package)
+    for name, fn, kind in registrations:
+        if kind == "iterable":
+            lowering.register_iterable(name, fn)
+        elif kind == "streaming":
+            lowering.register_streaming(name, fn)
+        else:
+            lowering.register(name, fn)
+    _worker_lowering = lowering
+
+
+def _lower_in_worker(impl: Implementation) -> list[Code]:
+    assert _worker_lowering is not None
+    _worker_lowering._load_type(impl.type)
+    return list(LoweringPass.__call__(_worker_lowering, (impl,)))
+
+
+class _SignalTypes(MutableSet[type["Signal"]]):
+    """Set of the registered signal types that keeps their registration order.
+
+    `Signal.from_code` tries the types in this order. Adding a type checks
+    that it can be created from the groups of its `pattern`.
+    """
+
+    def __init__(self, types: Iterable[type["Signal"]] = tuple()) -> None:
+        self._types: dict[type[Signal], None] = dict.fromkeys(types)
+
+    def __contains__(self, t: object) -> bool:
+        return t in self._types
+
+    def __iter__(self) -> Iterator[type["Signal"]]:
+        return iter(self._types)
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def add(self, t: type["Signal"]) -> None:
+        global _parser
+        defines_from_groups = next(c for c in t.__mro__ if "from_groups" in vars(c))
+        if t.pattern is not None and defines_from_groups is Signal:
+            raise TypeError(
+                f"signal type {t.__qualname__} defines a pattern but does not override from_groups"
+            )
+        self._types[t] = None
+        _parser = None
+
+    def discard(self, t: type["Signal"]) -> None:
+        global _parser
+        self._types.pop(t, None)
+        _parser = None
+
+    def copy(self) -> "_SignalTypes":
+        return _SignalTypes(self._types)
+
+    def __repr__(self) -> str:
+        return f"{{{', '.join(t.__qualname__ for t in self._types)}}}"
+
 
 class Signal(ABC):
-    types: set[type["Signal"]] = set()
+    types: _SignalTypes = _SignalTypes()
+    """registered signal types in the order `from_code` tries them"""
+
+    pattern: ClassVar[str | None] = None
+    """Regular expression matching the definition of the signal.
+
+    Types defining a `pattern` are recognized by a single search over the
+    alternation of all registered patterns and created via `from_groups`.
+    Other types are tried afterward through `can_create_from_code`.
+    """
 
     @abstractmethod
     def define(self) -> Iterator[str]: ...
@@ -178,10 +754,16 @@ class Signal(ABC):
 
     @classmethod
     def from_code(cls, code: str) -> "Signal":
-        for t in cls.types:
-            if t.can_create_from_code(code):
-                return t.from_code(code)
-        return NullDefinedLogicSignal.from_code(code)
+        return _signal_parser().parse(code)
+
+    @classmethod
+    def from_groups(cls, groups: Sequence[str | None]) -> "Signal":
+        """Create the signal from the groups captured by `pattern`.
+
+        Required for types that define a `pattern`, `register_type`
+        rejects types that do not override it.
+        """
+        raise NotImplementedError
 
     @classmethod
     @abstractmethod
@@ -196,6 +778,9 @@ class Signal(ABC):
 
 
 class LogicSignal(Signal):
+    pattern = r"signal ([a-zA-Z_][a-zA-Z0-9_]*)\s*:\s*std_logic(?:\s+|;)"
+    _regex = re.compile(pattern)
+
     def __init__(self, name: str):
         self._name = name
 
@@ -211,19 +796,20 @@ class LogicSignal(Signal):
         return cls._search(code) is not None
 
     @classmethod
-    def _search(cls, code: str) -> Signal | None:
-        match = re.search(
-            r"signal ([a-zA-Z_][a-zA-Z0-9_]*)\s*:\s*std_logic(?:\s+|;)", code
-        )
-        return match
+    def _search(cls, code: str) -> re.Match | None:
+        return cls._regex.search(code)
 
     @classmethod
     def from_code(cls, code: str) -> "Signal":
         match = cls._search(code)
         if match is None:
             raise ValueError(f"Cannot create signal from code: {code}")
-        (name,) = match.groups()
-        return cls(name)
+        return cls.from_groups(match.groups())
+
+    @classmethod
+    def from_groups(cls, groups: Sequence[str | None]) -> "Signal":
+        (name,) = groups
+        return cls(name)  # type: ignore[arg-type]
 
     def make_instance_specific(self, instance: str) -> Signal:
         return self.__class__(f"{self.name}_{instance}")
@@ -237,6 +823,9 @@ class LogicSignal(Signal):
 
 
 class LogicVectorSignal(Signal):
+    pattern = r"\Asignal ([a-zA-Z_][a-zA-Z0-9_]*)\s*: std_logic_vector\((\d+|(?:\d+ - \d+)) downto 0\)"
+    _regex = re.compile(pattern)
+
     def __init__(self, name: str, width: int):
         self._name = name
         self._width = width
@@ -257,19 +846,20 @@ class LogicVectorSignal(Signal):
         return cls._search(code) is not None
 
     @classmethod
-    def _search(cls, code: str) -> Signal | None:
-        match = re.match(
-            r"signal ([a-zA-Z_][a-zA-Z0-9_]*)\s*: std_logic_vector\((\d+|(?:\d+ - \d+)) downto 0\)",
-            code,
-        )
-        return match
+    def _search(cls, code: str) -> re.Match | None:
+        return cls._regex.search(code)
 
     @classmethod
     def from_code(cls, code: str) -> "Signal":
         match = cls._search(code)
         if match is None:
             raise ValueError(f"Cannot create signal from code: {code}")
-        name, width = match.groups()
+        return cls.from_groups(match.groups())
+
+    @classmethod
+    def from_groups(cls, groups: Sequence[str | None]) -> "Signal":
+        name, width = groups
+        assert name is not None and width is not None
         if " - " in width:
             a, b = width.split(" - ")
             width = str(int(a) - int(b))
@@ -309,6 +899,49 @@ class NullDefinedLogicSignal(Signal):
         return self
 
 
+class _SignalParser:
+    """Recognize signal definitions with one compiled alternation of the patterns of all registered types.
+
+    Each pattern becomes a named group, the name of the matching group
+    selects the type.
+    """
+
+    def __init__(self, types: Iterable[type[Signal]]) -> None:
+        types = tuple(types)
+        self._dispatch: dict[str, tuple[type[Signal], int, int]] = {}
+        alternatives = []
+        position = 0
+        for i, t in enumerate(t for t in types if t.pattern is not None):
+            group = f"_{i}"
+            alternatives.append(f"(?P<{group}>{t.pattern})")
+            num_groups = re.compile(t.pattern).groups  # type: ignore[arg-type]
+            self._dispatch[group] = (t, position + 1, position + 1 + num_groups)
+            position += 1 + num_groups
+        self._regex = re.compile("|".join(alternatives)) if alternatives else None
+        self._others = tuple(t for t in types if t.pattern is None)
+
+    def parse(self, code: str) -> Signal:
+        if self._regex is not None:
+            match = self._regex.search(code)
+            if match is not None:
+                t, start, end = self._dispatch[match.lastgroup]  # type: ignore[index]
+                return t.from_groups(match.groups()[start:end])
+        for t in self._others:
+            if t.can_create_from_code(code):
+                return t.from_code(code)
+        return NullDefinedLogicSignal.from_code(code)
+
+
+_parser: _SignalParser | None = None
+
+
+def _signal_parser() -> _SignalParser:
+    global _parser
+    if _parser is None:
+        _parser = _SignalParser(Signal.types)
+    return _parser
+
+
 for t in (LogicSignal, LogicVectorSignal, NullDefinedLogicSignal):
     Signal.register_type(t)
 
@@ -420,10 +1053,34 @@ class PluginLoader(_Loader[Ir2Vhdl]):
             plugin_receiver=lowering,
         )
 
+    def load_from_package(self, package: str) -> None:
+        with self._receiver._loading_plugins_from(package):
+            super().load_from_package(package)
+
     @staticmethod
     def __get_generated(plugin: PluginSpec) -> Iterator[PluginSymbol]:
-        if plugin.target_runtime == "vhdl":
-            yield from _pl.import_symbols(plugin.package, plugin.generated)
+        if plugin.target_runtime == "vhdl" and len(plugin.generated) > 0:
+            yield _LazySymbols(plugin.package, plugin.generated, plugin.types)
+
+
+class _LazySymbols(_PluginSymbol[Ir2Vhdl]):
+    """Import the `generated` symbols of a plugin when `Ir2Vhdl` lowers one of their types for the first time.
+
+    The handled types are taken from the `types` of the plugin spec
+    without importing the plugin, see `PluginSpec`.
+    """
+
+    def __init__(self, package: str, names: Iterable[str], types: Mapping[str, str]):
+        self._package = package
+        self._names = tuple(names)
+        self._types = tuple(types.get(name, name) for name in self._names)
+
+    def load_into(self, receiver: Ir2Vhdl) -> None:
+        receiver._register_lazy(self._types, partial(self._load, receiver))
+
+    def _load(self, receiver: Ir2Vhdl) -> None:
+        for symbol in _pl.import_symbols(self._package, self._names):
+            symbol.load_into(receiver)
 
 
 class _StaticFile(_PluginSymbol[PluginLoader]):
@@ -444,11 +1101,29 @@ class _StaticFile(_PluginSymbol[PluginLoader]):
             for name in p.static_files:
                 yield cls(name=name, package=p.package)
 
+    @property
+    def path(self) -> Path:
+        """Location of the file on the file system, files of zipped packages are extracted once per process."""
+        return _resource_path(self._package, f"vhdl/{self.name}")
+
     def __call__(self) -> Iterator[str]:
         file = res.files(self._package).joinpath(f"vhdl/{self.name}")
         yield file.read_text()
 
 
+_resource_paths: dict[tuple[str, str], Path] = {}
+_extracted_resources = ExitStack()
+atexit.register(_extracted_resources.close)
+
+
+def _resource_path(package: str, name: str) -> Path:
+    key = (package, name)
+    if key not in _resource_paths:
+        resource = res.files(package).joinpath(name)
+        _resource_paths[key] = _extracted_resources.enter_context(res.as_file(resource))
+    return _resource_paths[key]
+
+
 _Tcontra = TypeVar("_Tcontra", contravariant=True)
 
 TypeHandlerFn: TypeAlias = Callable[[Implementation], Code]
@@ -470,5 +1145,13 @@ def _type_handler_for_iterable(
     return _pl.make_plugin_symbol(load_into, fn)
 
 
+def _type_handler_streaming(name: str, fn: StreamingTypeHandlerFn) -> PluginSymbol:
+    def load_into(lower: Ir2Vhdl) -> None:
+        lower.register_streaming(name)(fn)
+
+    return _pl.make_plugin_symbol(load_into, fn)
+
+
 type_handler = F.FunctionDecorator(_type_handler)
 type_handler_iterable = F.FunctionDecorator(_type_handler_for_iterable)
+type_handler_streaming = F.FunctionDecorator(_type_handler_streaming)
@@ -78,16 +78,25 @@ Most other classes defined in this module are supposed to increase usability and
 
 """
 
+import atexit
+import hashlib
 import importlib.resources as _res
+import json
+import os
 from abc import abstractmethod
 from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import partial, update_wrapper
 from importlib import import_module as _import_module
+from importlib.metadata import entry_points as _entry_points
+from importlib.resources.abc import Traversable
+from importlib.util import find_spec as _find_spec
 from inspect import signature as _signature
-from typing import Generic, ParamSpec, Protocol, TypeAlias, TypeVar
+from pathlib import Path
+from typing import Any, Generic, ParamSpec, Protocol, TypeAlias, TypeVar
 
-import tomlkit as toml
+import tomllib
 
 
 @dataclass
@@ -100,7 +109,7 @@ class PluginSpec:
     support type checking and improve code readability.
 
     You can achieve your goals just as well with the `PluginDict` dictionary.
-    That is defined as an alias for `dict[str, str | tuple[str, ...]]`.
+    That is defined as an alias for `dict[str, str | tuple[str, ...] | dict[str, str]]`.
     """
 
     name: str
@@ -111,7 +120,7 @@ class PluginSpec:
     package: str
 
 
-PluginDict: TypeAlias = dict[str, str | tuple[str, ...]]
+PluginDict: TypeAlias = dict[str, str | tuple[str, ...] | dict[str, str]]
 
 _PlRecT = TypeVar("_PlRecT", contravariant=True)
 _T = TypeVar("_T")
@@ -149,6 +158,14 @@ class PluginLoader(Generic[_PlRecT]):
         for loadable in symbols:
             loadable.load_into(self._receiver)
 
+    def load_from_entry_points(self, registry: "PluginRegistry | None" = None) -> None:
+        """load the plugins of all packages found by `registry`, by default the process wide `plugin_registry`."""
+        if registry is None:
+            registry = plugin_registry
+        # reading all meta.toml files up front fills the plugin index concurrently
+        for package in registry.plugin_dicts():
+            self.load_from_package(package)
+
 
 class PluginSymbol(Protocol[_PlRecT]):
     """A symbol that the `PluginLoader` can load into a receiver object.
@@ -272,35 +289,185 @@ def make_plugin_symbol(
 
 
 def build_plugin_spec(d: PluginDict, spec_type: type[PluginSpecT]) -> PluginSpecT:
-    """inspect spec_type and build an instance of it from the dictionary `d` raising an error in case of unexpected fields or missing fields."""
-    args = {k: tuple(v) if not isinstance(v, str) else v for k, v in d.items()}
+    """inspect spec_type and build an instance of it from the dictionary `d` raising an error in case of unexpected fields or missing fields.
+
+    Fields with a default value in `spec_type` are optional. Lists are
+    converted to tuples, tables are passed as dictionaries.
+    """
+    args = {k: tuple(v) if isinstance(v, list) else v for k, v in d.items()}
     s = _signature(spec_type)
     expected_params = set(s.parameters.keys())
+    required_params = {name for name, p in s.parameters.items() if p.default is p.empty}
     actual_params = set(args.keys())
-    if expected_params != actual_params:
-        if expected_params.issubset(actual_params):
-            raise UnexpectedFieldError(
-                actual_params.difference(expected_params), spec_type
-            )
-        else:
-            raise MissingFieldError(
-                expected_params.difference(actual_params), spec_type
-            )
+    if not actual_params.issubset(expected_params):
+        raise UnexpectedFieldError(actual_params.difference(expected_params), spec_type)
+    if not required_params.issubset(actual_params):
+        raise MissingFieldError(required_params.difference(actual_params), spec_type)
     bound = s.bind(**args)
     return spec_type(*bound.args, **bound.kwargs)
 
 
 def read_plugin_dicts_from_package(package: str) -> Iterable[PluginDict]:
-    """read the meta.toml file from the package returning the list of plugin dictionaries."""
+    """read the meta.toml file from the package returning the list of plugin dictionaries.
+
+    The parsed files are cached by the process wide `plugin_index`.
+    """
+    return plugin_index.read(package)
+
+
+class PluginIndex:
+    """Cache of the plugin dictionaries read from the `meta.toml` files of packages.
+
+    An entry is reused as long as the `meta.toml` file keeps its
+    modification time and size, files inside of zipped packages are
+    compared by their content hash instead. Pass a `cache_file` and call
+    `save` to reuse the index in later processes, e.g., for repeated
+    command line runs. The process wide `plugin_index` does that by
+    default, see `default_cache_file`.
+    """
+
+    def __init__(self, cache_file: str | os.PathLike | None = None) -> None:
+        self._cache_file = None if cache_file is None else Path(cache_file)
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._modified = False
+        if self._cache_file is not None and self._cache_file.is_file():
+            try:
+                entries = json.loads(self._cache_file.read_text())
+            except (OSError, json.JSONDecodeError):
+                entries = {}
+            self._entries = entries if isinstance(entries, dict) else {}
+
+    def read(self, package: str) -> list[PluginDict]:
+        location = _meta_toml_of(package)
+        if location is None:
+            return []
+        key = _file_key(location)
+        entry = self._entries.get(package)
+        if entry is None or entry["key"] != key:
+            with location.open("rb") as f:
+                plugins = tomllib.load(f).get("plugins", [])
+            entry = {"key": key, "plugins": plugins}
+            self._entries[package] = entry
+            self._modified = True
+        return [dict(d) | {"package": package} for d in entry["plugins"]]
+
+    def save(self) -> None:
+        """Write the index to the `cache_file`, if it changed."""
+        if self._cache_file is None or not self._modified:
+            return
+        self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._cache_file.with_name(f"{self._cache_file.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(self._entries))
+            os.replace(tmp, self._cache_file)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self._modified = False
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._modified = True
+
+
+CACHE_FILE_VARIABLE = "ELASTICAI_CREATOR_PLUGIN_INDEX"
+
+
+def default_cache_file() -> Path | None:
+    """The file that persists the `plugin_index` across processes.
+
+    The path is taken from the environment variable named by
+    `CACHE_FILE_VARIABLE`, an empty value disables persisting the index.
+    Defaults to `elasticai.creator/plugin_index.json` in the user cache
+    directory, i.e., `$XDG_CACHE_HOME` or `~/.cache`, and `%LOCALAPPDATA%`
+    on windows.
+    """
+    path = os.environ.get(CACHE_FILE_VARIABLE)
+    if path is not None:
+        return Path(path) if path != "" else None
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+    if cache_dir is None:
+        cache_dir = str(Path.home() / ".cache")
+    return Path(cache_dir) / "elasticai.creator" / "plugin_index.json"
+
+
+def _save_plugin_index() -> None:
+    try:
+        plugin_index.save()
+    except OSError:
+        pass  # the index is only a cache, e.g., the cache directory may be read-only
+
+
+plugin_index = PluginIndex(default_cache_file())
+"""The index used by `read_plugin_dicts_from_package`, saved to `default_cache_file()` on exit."""
+
+atexit.register(_save_plugin_index)
+
+
+def _meta_toml_of(package: str) -> Path | Traversable | None:
+    spec = _find_spec(package)
+    if spec is not None and spec.submodule_search_locations is not None:
+        for location in spec.submodule_search_locations:
+            path = Path(location) / "meta.toml"
+            if path.is_file():
+                return path
     t = _res.files(package).joinpath("meta.toml")
-    parsed: list[PluginDict] = []
     if t.is_file():
-        with t.open("rb") as f:
-            content = toml.load(f).unwrap()
-            parsed.extend(content["plugins"])
-    for d in parsed:
-        d.update(dict(package=package))
-    return parsed
+        return t
+    return None
+
+
+def _file_key(location: Path | Traversable) -> list[Any]:
+    if isinstance(location, Path):
+        stat = location.stat()
+        return [str(location), stat.st_mtime_ns, stat.st_size]
+    return [str(location), hashlib.blake2b(location.read_bytes()).hexdigest()]
+
+
+ENTRY_POINT_GROUP = "elasticai.creator_plugins"
+
+
+class PluginRegistry:
+    """Discover plugin packages from the entry points of all installed distributions.
+
+    A distribution declares its plugin packages in its `pyproject.toml`,
+    the value of each entry point is the package containing the `meta.toml` file:
+
+    [source,toml]
+    ----
+    [project.entry-points."elasticai.creator_plugins"]
+    my_plugin = "my_company.my_plugin"
+    ----
+
+    The packages are looked up once and the `meta.toml` files of all
+    packages are read concurrently through the `plugin_index`. Call
+    `refresh` after installing or removing distributions.
+    """
+
+    def __init__(self, group: str = ENTRY_POINT_GROUP, max_workers: int | None = None):
+        self._group = group
+        self._max_workers = max_workers
+        self._packages: tuple[str, ...] | None = None
+
+    def packages(self) -> tuple[str, ...]:
+        """Names of the plugin packages sorted by name, without duplicates."""
+        if self._packages is None:
+            self._packages = tuple(
+                sorted({ep.module for ep in _entry_points(group=self._group)})
+            )
+        return self._packages
+
+    def plugin_dicts(self) -> dict[str, list[PluginDict]]:
+        """The plugin dictionaries of each discovered package."""
+        packages = self.packages()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            return dict(zip(packages, pool.map(plugin_index.read, packages)))
+
+    def refresh(self) -> None:
+        self._packages = None
+
+
+plugin_registry = PluginRegistry()
+"""The registry used by `PluginLoader.load_from_entry_points`."""
 
 
 class UnexpectedFieldError(Exception):
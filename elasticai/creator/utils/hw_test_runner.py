@@ -8,6 +8,8 @@ from io import BytesIO
 from pathlib import Path
 from typing import AsyncIterable, Iterator, Literal
 
+from elasticai.creator.plugin import plugin_registry
+
 from ._console_out import Printer
 from ._run import run_and_process_pipes, run_and_wait
 from .ghdl_msg import GhdlMsg, parse_ghdl_msg
@@ -25,6 +27,15 @@ def get_paths_from_package(package: str) -> Iterator[Path]:
             yield f
 
 
+def get_plugin_paths() -> Iterator[Path]:
+    """Directories of the plugins in the creator namespace and of plugin packages registered via entry points by other distributions."""
+    yield from get_paths_from_package(CREATOR_PLUGIN_NAMESPACE)
+    for package in plugin_registry.packages():
+        if not package.startswith(f"{CREATOR_PLUGIN_NAMESPACE}."):
+            with _res.as_file(_res.files(package)) as f:
+                yield f
+
+
 def check_for_ghdl():
     ghdl_path = run_and_wait("which", "ghdl").stdout
     log = _get_logger()
@@ -272,7 +283,7 @@ class VhdlTestBenchRunner:
 
     def _collect_files(self) -> None:
         self._log.debug("collecting vhd files")
-        for f in get_paths_from_package(CREATOR_PLUGIN_NAMESPACE):
+        for f in get_plugin_paths():
             for sub_path in f.glob("**/*.vhd"):
                 if "middleware" not in sub_path.parts:
                     self._log.debug("collecting {}".format(sub_path.name))
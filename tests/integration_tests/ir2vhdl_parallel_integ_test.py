@@ -0,0 +1,11 @@
+from elasticai.creator.ir2vhdl import Implementation, Ir2Vhdl, PluginLoader
+
+
+def test_workers_load_the_same_plugins() -> None:
+    lower = Ir2Vhdl()
+    PluginLoader(lower).load_from_package("tests.integration_tests.ir2vhdl_plugin")
+    impls = [
+        Implementation(name=f"p{i}", type="passthrough", attributes={"value": i})
+        for i in range(8)
+    ]
+    assert list(lower(impls)) == list(lower(impls, jobs=2))
@@ -0,0 +1,16 @@
+from elasticai.creator.ir import Node
+from elasticai.creator.ir.scheduling_plugins import latency_model
+from elasticai.creator.ir2vhdl import Code, Implementation, type_handler
+
+
+@type_handler
+def passthrough(impl: Implementation) -> Code:
+    return impl.name, [f"-- {impl.name}: {impl.attributes['value']}"]
+
+
+@latency_model("passthrough")
+def passthrough_latency(node: Node) -> int:
+    return node.data["value"]
+
+
+__all__ = ["passthrough", "passthrough_latency"]
@@ -0,0 +1,9 @@
+from elasticai.creator.ir2vhdl import Code, Implementation, type_handler
+
+
+@type_handler("conv")
+def conv_handler(impl: Implementation) -> Code:
+    return impl.name, [f"-- conv {impl.name}"]
+
+
+__all__ = ["conv_handler"]
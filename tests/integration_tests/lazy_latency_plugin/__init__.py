@@ -0,0 +1,10 @@
+from elasticai.creator.ir import Node
+from elasticai.creator.ir.scheduling_plugins import latency_model
+
+
+@latency_model("conv")
+def conv(node: Node) -> int:
+    return 1
+
+
+__all__ = ["conv"]
@@ -0,0 +1,55 @@
+import sys
+
+import pytest
+
+from elasticai.creator.ir2vhdl import Implementation, Ir2Vhdl, PluginLoader
+
+PACKAGE = "tests.integration_tests.lazy_plugin"
+
+
+@pytest.fixture
+def lower() -> Ir2Vhdl:
+    sys.modules.pop(PACKAGE, None)
+    lower = Ir2Vhdl()
+    PluginLoader(lower).load_from_package(PACKAGE)
+    return lower
+
+
+def test_plugin_module_is_not_imported_while_loading(lower) -> None:
+    assert PACKAGE not in sys.modules
+
+
+def test_plugin_module_is_imported_on_first_dispatch(lower) -> None:
+    impl = Implementation(name="p", type="lazy_passthrough", attributes={})
+    assert [("p.vhd", ["-- p"])] == list(lower((impl,)))
+    assert PACKAGE in sys.modules
+
+
+def test_lowering_other_types_does_not_import_plugin(lower) -> None:
+    @lower.register("other")
+    def other(impl: Implementation):
+        return impl.name, []
+
+    list(lower((Implementation(name="o", type="other", attributes={}),)))
+    assert PACKAGE not in sys.modules
+
+
+def test_unknown_types_load_all_pending_plugins(lower) -> None:
+    with pytest.raises(KeyError):
+        list(lower((Implementation(name="u", type="unknown", attributes={}),)))
+    assert PACKAGE in sys.modules
+
+
+def test_types_declared_in_meta_toml_import_only_their_plugin() -> None:
+    latency_package = "tests.integration_tests.lazy_latency_plugin"
+    handler_package = "tests.integration_tests.lazy_handler_plugin"
+    for package in (latency_package, handler_package):
+        sys.modules.pop(package, None)
+    lower = Ir2Vhdl()
+    loader = PluginLoader(lower)
+    loader.load_from_package(latency_package)
+    loader.load_from_package(handler_package)
+    impl = Implementation(name="c", type="conv", attributes={})
+    assert [("c.vhd", ["-- conv c"])] == list(lower((impl,)))
+    assert handler_package in sys.modules
+    assert latency_package not in sys.modules
@@ -0,0 +1,26 @@
+from elasticai.creator.ir import Graph, edge, node
+from elasticai.creator.ir.scheduling import Scheduler
+from elasticai.creator.ir.scheduling_plugins import SchedulerPluginLoader
+from elasticai.creator.ir2vhdl import Implementation, Ir2Vhdl, PluginLoader
+
+PACKAGE = "tests.integration_tests.ir2vhdl_plugin"
+
+
+def test_latency_models_are_loaded_from_plugins() -> None:
+    scheduler = Scheduler()
+    SchedulerPluginLoader(scheduler).load_from_package(PACKAGE)
+    g = Graph(
+        nodes=(
+            node("a", "passthrough", {"value": 3}),
+            node("b", "passthrough", {"value": 4}),
+        ),
+        edges=(edge("a", "b"),),
+    )
+    assert 7 == scheduler(g).total_latency
+
+
+def test_ir2vhdl_ignores_latency_models() -> None:
+    lower = Ir2Vhdl()
+    PluginLoader(lower).load_from_package(PACKAGE)
+    impl = Implementation(name="p", type="passthrough", attributes={"value": 1})
+    assert [("p.vhd", ["-- p: 1"])] == list(lower((impl,)))
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from elasticai.creator.ir2vhdl import Ir2Vhdl, PluginLoader
+
+PACKAGE = "tests.integration_tests.static_files_plugin"
+
+
+@pytest.fixture
+def lower() -> Ir2Vhdl:
+    lower = Ir2Vhdl()
+    PluginLoader(lower).load_from_package(PACKAGE)
+    return lower
+
+
+def test_static_files_are_copied_byte_by_byte(tmp_path, lower) -> None:
+    lower.write((), tmp_path)
+    assert (
+        b"-- static package\r\npackage pkg is\nend package;\n"
+        == (tmp_path / "pkg.vhd").read_bytes()
+    )
+
+
+def test_static_files_are_hard_linked_on_same_file_system(tmp_path, lower) -> None:
+    source = Path(__file__).parent / "static_files_plugin" / "vhdl" / "pkg.vhd"
+    (path,) = lower.write((), tmp_path, link_static_files=True)
+    assert source.read_bytes() == path.read_bytes()
+    if source.stat().st_dev == tmp_path.stat().st_dev:
+        assert path.samefile(source)
+
+
+def test_rebuild_keeps_unchanged_static_files(tmp_path, lower) -> None:
+    assert [tmp_path / "pkg.vhd"] == lower.build((), tmp_path).changed
+    mtime = (tmp_path / "pkg.vhd").stat().st_mtime_ns
+    report = lower.build((), tmp_path)
+    assert [tmp_path / "pkg.vhd"] == report.unchanged
+    assert mtime == (tmp_path / "pkg.vhd").stat().st_mtime_ns
+
+
+def test_writing_again_does_not_modify_linked_source(tmp_path, lower) -> None:
+    lower.write((), tmp_path, link_static_files=True)
+    before = (tmp_path / "pkg.vhd").read_bytes()
+    lower.write((), tmp_path)
+    lower.write((), tmp_path, link_static_files=True)
+    assert before == (tmp_path / "pkg.vhd").read_bytes()
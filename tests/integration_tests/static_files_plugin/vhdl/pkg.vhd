@@ -0,0 +1,3 @@
+-- static package
+package pkg is
+end package;
@@ -0,0 +1,67 @@
+from collections.abc import Iterator
+
+import pytest
+
+from elasticai.creator.file_generation.resource_utils import (
+    ResourceCache,
+    get_file_from_package,
+    read_text,
+    resource_cache,
+)
+from elasticai.creator.file_generation.template import InProjectTemplate
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch) -> Iterator[str]:
+    root = tmp_path / "src"
+    (root / "templates").mkdir(parents=True)
+    (root / "templates" / "__init__.py").touch()
+    (root / "templates" / "a.tpl.vhd").write_text("first\nsecond\n")
+    (root / "templates" / "b.tpl.vhd").write_text("$x\n")
+    monkeypatch.syspath_prepend(str(root))
+    resource_cache.clear()
+    yield "templates"
+    resource_cache.clear()
+
+
+def test_reads_lines_without_newlines(package) -> None:
+    assert ("first", "second") == ResourceCache().read_lines(package, "a.tpl.vhd")
+
+
+def test_repeated_reads_are_hits(package) -> None:
+    cache = ResourceCache()
+    cache.read_lines(package, "a.tpl.vhd")
+    cache.read_lines(package, "a.tpl.vhd")
+    assert (1, 1, 1) == cache.stats()[:3]
+
+
+def test_least_recently_used_file_is_evicted(package) -> None:
+    cache = ResourceCache(maxsize=1)
+    cache.read_lines(package, "a.tpl.vhd")
+    cache.read_lines(package, "b.tpl.vhd")
+    cache.read_lines(package, "a.tpl.vhd")
+    assert (0, 3, 1) == cache.stats()[:3]
+
+
+def test_warm_reads_all_non_python_files(package) -> None:
+    cache = ResourceCache()
+    cache.warm(package)
+    cache.read_lines(package, "a.tpl.vhd")
+    cache.read_lines(package, "b.tpl.vhd")
+    assert (2, 2, 2) == cache.stats()[:3]
+
+
+def test_missing_file_raises_file_not_found(package) -> None:
+    with pytest.raises(FileNotFoundError):
+        ResourceCache().find(package, "c.tpl.vhd")
+
+
+def test_get_file_from_package_yields_path(package) -> None:
+    with get_file_from_package(package, "a.tpl.vhd") as path:
+        assert "first\nsecond\n" == path.read_text()
+
+
+def test_templates_do_not_share_content(package) -> None:
+    first = InProjectTemplate(package, "a.tpl.vhd", {})
+    first.content.append("third")
+    assert ["first", "second"] == list(read_text(package, "a.tpl.vhd"))
@@ -2,7 +2,10 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from unittest import TestCase
 
-from elasticai.creator.file_generation.template import TemplateExpander
+from elasticai.creator.file_generation.template import (
+    TemplateExpander,
+    compile_template,
+)
 
 
 @dataclass
@@ -126,3 +129,28 @@ class ExpandTemplatesTestCase(TestCase):
         template = Template(["$a", "$b", "$c"], parameters=dict(a="1", c="3"))
         expander = TemplateExpander(template)
         self.assertEqual({"b"}, expander.unfilled_variables())
+
+
+class CompiledTemplateTestCase(TestCase):
+    def test_equal_content_is_compiled_once(self) -> None:
+        self.assertIs(
+            compile_template(("$a", "b")), compile_template(tuple(["$a", "b"]))
+        )
+
+    def test_escaped_dollar_is_unescaped_once(self) -> None:
+        template = ["$$a $b", "${c}"]
+        expected = "$a 1\nx\ny"
+        actual = get_result_string(template, b="1", c=["x", "y"])
+        self.assertEqual(expected, actual)
+
+    def test_single_line_values_are_not_expanded_again(self) -> None:
+        template = ["$a"]
+        expected = "$b"
+        actual = get_result_string(template, a="$b")
+        self.assertEqual(expected, actual)
+
+    def test_single_and_multi_line_keys_on_one_line(self) -> None:
+        template = ["${a}_$b;"]
+        expected = "x_0;\nx_1;"
+        actual = get_result_string(template, a="x", b=["0", "1"])
+        self.assertEqual(expected, actual)
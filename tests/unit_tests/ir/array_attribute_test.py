@@ -0,0 +1,81 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from elasticai.creator.ir import ArrayAttribute, binary_format
+from elasticai.creator.ir.hashing import content_hash
+from elasticai.creator.ir.node_table import NodeTable
+from elasticai.creator.ir2vhdl import Implementation, VhdlNode
+
+
+@pytest.fixture
+def weights() -> ArrayAttribute:
+    return ArrayAttribute(np.arange(12).reshape(3, 4), dtype=np.int8)
+
+
+def network(weights: ArrayAttribute) -> Implementation:
+    return Implementation(
+        name="net", type="net", attributes={}, nodes=(linear(weights),)
+    )
+
+
+def linear(weights: ArrayAttribute) -> VhdlNode:
+    return VhdlNode(
+        dict(name="lin", type="linear", implementation="linear", weights=weights)
+    )
+
+
+def test_attributes_with_same_values_are_equal(weights) -> None:
+    other = ArrayAttribute(np.arange(12, dtype=np.int8).reshape(3, 4))
+    assert weights == other
+    assert hash(weights) == hash(other)
+
+
+def test_dtype_and_shape_are_part_of_the_value(weights) -> None:
+    assert weights != ArrayAttribute(np.arange(12).reshape(3, 4), dtype=np.int16)
+    assert weights != ArrayAttribute(np.arange(12, dtype=np.int8).reshape(4, 3))
+
+
+def test_buffer_is_read_only(weights) -> None:
+    with pytest.raises(ValueError):
+        weights.array[0, 0] = 1
+
+
+def test_values_are_copied_on_creation() -> None:
+    values = np.zeros(4)
+    attribute = ArrayAttribute(values)
+    values[0] = 1
+    assert 0 == attribute.array[0]
+
+
+def test_copying_an_implementation_shares_the_buffer(weights) -> None:
+    copied = Implementation.fromdict(network(weights).asdict())
+    assert copied.nodes["lin"].data["weights"].array is weights.array
+
+
+def test_node_table_stores_array_attributes(weights) -> None:
+    table: NodeTable[VhdlNode] = NodeTable()
+    table["lin"] = linear(weights)
+    assert weights == table["lin"].data["weights"]
+
+
+def test_content_hash_depends_on_values(weights) -> None:
+    assert content_hash({"w": weights}) == content_hash(
+        {"w": ArrayAttribute(weights.array)}
+    )
+    assert content_hash({"w": weights}) != content_hash({"w": weights.tolist()})
+
+
+@pytest.mark.parametrize("zero_copy", [False, True])
+def test_binary_format_preserves_dtype(tmp_path, weights, zero_copy) -> None:
+    path = tmp_path / "net.bin"
+    binary_format.dump(network(weights).asdict(), path)
+    with binary_format.load(path, zero_copy_arrays=zero_copy) as loaded:
+        loaded_weights = loaded.nodes["lin"]["weights"]
+        assert np.int8 == loaded_weights.dtype
+        assert weights == loaded_weights
+
+
+def test_pickle_roundtrip(weights) -> None:
+    assert weights == pickle.loads(pickle.dumps(weights))
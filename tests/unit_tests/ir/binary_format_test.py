@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from elasticai.creator.ir import binary_format
+from elasticai.creator.ir2vhdl import Implementation
+
+
+@pytest.fixture
+def data() -> dict:
+    weights = tuple(tuple(float(i * 4 + j) for j in range(4)) for i in range(3))
+    return {
+        "name": "network",
+        "type": "network",
+        "attributes": {"generic_map": {"WIDTH": "8"}, "big": 2**70, "flag": True},
+        "nodes": [
+            {"name": "input", "type": "input", "input_shape": (1, 3)},
+            {"name": "lin", "type": "linear", "weights": weights, "bias": None},
+            {"name": "output", "type": "output", "taps": list(range(10))},
+        ],
+        "edges": [
+            {"src": "input", "sink": "lin", "src_sink_indices": ((0, 0), (1, 1))},
+            {"src": "lin", "sink": "output", "src_sink_indices": tuple()},
+        ],
+    }
+
+
+@pytest.fixture
+def file(tmp_path, data):
+    path = tmp_path / "network.bin"
+    binary_format.dump(data, path)
+    return path
+
+
+def test_roundtrip_preserves_data(file, data) -> None:
+    with binary_format.load(file) as loaded:
+        assert data == loaded.asdict()
+
+
+def test_roundtrip_preserves_value_types(file) -> None:
+    with binary_format.load(file) as loaded:
+        nodes = loaded.nodes
+        assert isinstance(nodes["lin"]["weights"][0], tuple)
+        assert isinstance(nodes["output"]["taps"], list)
+        assert loaded.attributes["flag"] is True
+
+
+def test_nodes_are_iterated_in_insertion_order(file) -> None:
+    with binary_format.load(file) as loaded:
+        assert ("input", "lin", "output") == tuple(loaded.nodes)
+
+
+def test_looking_up_missing_node_raises_key_error(file) -> None:
+    with binary_format.load(file) as loaded:
+        assert "missing" not in loaded.nodes
+        with pytest.raises(KeyError):
+            loaded.nodes["missing"]
+
+
+def test_find_node_names_by_type(file) -> None:
+    with binary_format.load(file) as loaded:
+        assert ("lin",) == loaded.node_names_of_type("linear")
+        assert () == loaded.node_names_of_type("conv")
+
+
+def test_zero_copy_arrays_are_read_only_views(file, data) -> None:
+    with binary_format.load(file, zero_copy_arrays=True) as loaded:
+        weights = loaded.nodes["lin"]["weights"]
+        assert isinstance(weights, np.ndarray)
+        assert (3, 4) == weights.shape
+        assert not weights.flags.writeable
+        assert data["nodes"][1]["weights"] == tuple(map(tuple, weights.tolist()))
+        del weights
+
+
+def test_loading_other_file_raises_error(tmp_path) -> None:
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\x00" * 256)
+    with pytest.raises(binary_format.BinaryFormatError):
+        binary_format.load(path)
+
+
+def test_unsupported_values_raise_type_error(tmp_path, data) -> None:
+    data["attributes"]["x"] = object()
+    with pytest.raises(TypeError):
+        binary_format.dump(data, tmp_path / "network.bin")
+
+
+def test_implementation_roundtrip(tmp_path, data) -> None:
+    impl = Implementation.fromdict(data)
+    impl.save(tmp_path / "impl.bin")
+    assert impl.asdict() == Implementation.load(tmp_path / "impl.bin").asdict()
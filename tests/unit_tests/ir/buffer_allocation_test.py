@@ -0,0 +1,60 @@
+from elasticai.creator.ir.buffer_allocation import (
+    Lifetime,
+    allocate_buffers,
+    compute_lifetimes,
+)
+from elasticai.creator.ir.core import Edge, Node, edge, node
+from elasticai.creator.ir.graph import Graph
+
+
+def graph_of(sizes: dict[str, int], edges: list[tuple[str, str]]) -> Graph[Node, Edge]:
+    return Graph(
+        nodes=(node(n, "t", {"output_shape": (1, s)}) for n, s in sizes.items()),
+        edges=(edge(a, b) for a, b in edges),
+    )
+
+
+def test_lifetime_ends_with_last_consumer() -> None:
+    """a -> b -> c, a -> c"""
+    g = graph_of({"a": 1, "b": 1, "c": 1}, [("a", "b"), ("b", "c"), ("a", "c")])
+    assert {
+        "a": Lifetime(0, 2),
+        "b": Lifetime(1, 2),
+        "c": Lifetime(2, 2),
+    } == compute_lifetimes(g, overlap=0)
+
+
+def test_sequential_layers_alternate_between_two_blocks() -> None:
+    sizes = {"l0": 8, "l1": 4, "l2": 8, "l3": 2}
+    g = graph_of(sizes, [("l0", "l1"), ("l1", "l2"), ("l2", "l3")])
+    assignment = allocate_buffers(g, overlap=0)
+    assert {"l0": 0, "l1": 1, "l2": 0, "l3": 1} == assignment.blocks
+    assert [8, 4] == assignment.block_sizes
+    assert 12 == assignment.total_size
+    assert 22 == assignment.unshared_size
+
+
+def test_buffers_with_overlapping_lifetimes_do_not_share_blocks() -> None:
+    """skip connection keeps the output of a alive until d"""
+    g = graph_of(
+        {"a": 4, "b": 4, "c": 4, "d": 4},
+        [("a", "b"), ("b", "c"), ("c", "d"), ("a", "d")],
+    )
+    assignment = allocate_buffers(g, overlap=0)
+    for x, y in [("a", "b"), ("a", "c"), ("b", "c"), ("c", "d")]:
+        assert assignment.blocks[x] != assignment.blocks[y]
+
+
+def test_pipelined_layers_share_no_buffers_by_default() -> None:
+    g = graph_of({"l0": 8, "l1": 4, "l2": 8}, [("l0", "l1"), ("l1", "l2")])
+    assignment = allocate_buffers(g)
+    assert 3 == len(assignment.block_sizes)
+    assert assignment.unshared_size == assignment.total_size
+
+
+def test_overlap_extends_lifetimes_past_last_consumer() -> None:
+    sizes = {f"l{i}": 4 for i in range(5)}
+    g = graph_of(sizes, [(f"l{i}", f"l{i + 1}") for i in range(4)])
+    assert Lifetime(0, 2) == compute_lifetimes(g, overlap=1)["l0"]
+    assignment = allocate_buffers(g, overlap=1)
+    assert {"l0": 0, "l1": 1, "l2": 2, "l3": 0, "l4": 1} == assignment.blocks
@@ -0,0 +1,158 @@
+import random
+
+import pytest
+
+from elasticai.creator.ir.core import edge, node
+from elasticai.creator.ir.csr_graph_delegate import CsrGraphDelegate
+from elasticai.creator.ir.graph import Graph
+from elasticai.creator.ir.graph_delegate import GraphDelegate
+from elasticai.creator.ir.graph_iterators import bfs_iter_up, dfs_pre_order
+
+
+@pytest.fixture
+def adjacency() -> dict[str, list[str]]:
+    """
+             0
+             |
+          /-----\\
+          |     |
+          1     2
+          | /---+
+          |/    |
+          3     4
+          |     |
+          |     6
+          |/----+
+          5
+    """
+    return {
+        "0": ["2", "1"],
+        "1": ["3"],
+        "2": ["4", "3"],
+        "3": ["5"],
+        "4": ["6"],
+        "6": ["5"],
+    }
+
+
+def test_successors_are_sorted(adjacency) -> None:
+    g = CsrGraphDelegate.from_dict(adjacency)
+    assert ("3", "4") == tuple(g.get_successors("2"))
+
+
+def test_predecessors_are_sorted(adjacency) -> None:
+    g = CsrGraphDelegate.from_dict(adjacency)
+    assert ("3", "6") == tuple(g.get_predecessors("5"))
+
+
+def test_nodes_are_iterated_in_insertion_order(adjacency) -> None:
+    g = CsrGraphDelegate.from_dict(adjacency)
+    assert tuple(GraphDelegate.from_dict(adjacency).iter_nodes()) == tuple(
+        g.iter_nodes()
+    )
+
+
+def test_duplicate_edges_are_stored_once() -> None:
+    g = CsrGraphDelegate().add_edges_from((("a", "b"), ("a", "b")))
+    assert (("a", "b"),) == tuple(g.get_edges())
+
+
+def test_as_dict_matches_dict_delegate(adjacency) -> None:
+    expected = GraphDelegate.from_dict(adjacency).as_dict()
+    assert expected == CsrGraphDelegate.from_dict(adjacency).as_dict()
+
+
+def test_can_add_edges_after_reading(adjacency) -> None:
+    g = CsrGraphDelegate.from_dict(adjacency)
+    tuple(g.get_successors("0"))
+    g.add_edge("0", "7")
+    assert ("1", "2", "7") == tuple(g.get_successors("0"))
+
+
+def test_isolated_node_added_after_reading_has_no_neighbours(adjacency) -> None:
+    g = CsrGraphDelegate.from_dict(adjacency)
+    tuple(g.get_successors("0"))
+    g.add_node("x")
+    assert () == tuple(g.get_successors("x"))
+    assert () == tuple(g.get_predecessors("x"))
+
+
+@pytest.mark.parametrize("delegate", [GraphDelegate, CsrGraphDelegate])
+def test_iterators_yield_same_order_for_both_delegates(delegate, adjacency) -> None:
+    g = delegate.from_dict(adjacency)
+    assert ("3", "6", "1", "4", "2", "0") == tuple(
+        bfs_iter_up(g.get_predecessors, g.get_successors, "5")
+    )
+    assert ("0", "1", "3", "5", "2", "4", "6") == tuple(
+        dfs_pre_order(g.get_successors, "0")
+    )
+
+
+def test_graph_can_use_csr_delegate() -> None:
+    g = Graph(
+        nodes=(node("x", "t"), node("y", "t"), node("z", "t")),
+        edges=(edge("x", "z"), edge("x", "y")),
+        graph_delegate=CsrGraphDelegate,
+    )
+    assert ("y", "z") == tuple(g.successors("x"))
+    assert ("x",) == tuple(g.predecessors("z"))
+
+
+def test_removing_many_nodes_keeps_graph_consistent() -> None:
+    chain = {str(i): [str(i + 1)] for i in range(200)}
+    g = CsrGraphDelegate.from_dict(chain)
+    expected = GraphDelegate.from_dict(chain)
+    for i in range(0, 200, 2):
+        g.remove_node(str(i))
+        expected.remove_node(str(i))
+    assert tuple(expected.iter_nodes()) == tuple(g.iter_nodes())
+    assert expected.as_dict() == g.as_dict()
+
+
+@pytest.mark.parametrize("read", ["get_successors", "get_predecessors"])
+def test_reading_after_remove_and_add_matches_dict_delegate(read) -> None:
+    delegates = (CsrGraphDelegate(), GraphDelegate())
+    for d in delegates:
+        d.add_edges_from([("a", "c"), ("d", "d"), ("b", "c")])
+        d.remove_node("a")
+        d.add_edge("c", "d")
+    g, expected = delegates
+    for n in expected.iter_nodes():
+        assert tuple(getattr(expected, read)(n)) == tuple(getattr(g, read)(n))
+
+
+def test_graph_splice_on_csr_delegate_matches_dict_delegate() -> None:
+    graphs = [
+        Graph(
+            nodes=[node(n, "t") for n in "abcd"],
+            edges=[edge("a", "b"), edge("c", "d")],
+            graph_delegate=delegate,
+        )
+        for delegate in (CsrGraphDelegate, GraphDelegate)
+    ]
+    for g in graphs:
+        g.remove_node("a")
+        g.add_edge(edge("b", "c"))
+    csr, expected = graphs
+    assert ["d"] == list(csr.successors("c"))
+    assert list(expected.successors("b")) == list(csr.successors("b"))
+
+
+def test_random_mutations_match_dict_delegate() -> None:
+    rng = random.Random(0)
+    g: CsrGraphDelegate[str] = CsrGraphDelegate()
+    expected: GraphDelegate[str] = GraphDelegate()
+    names = [str(i) for i in range(12)]
+    for _ in range(500):
+        a, b = rng.choice(names), rng.choice(names)
+        if rng.random() < 0.3 and a in expected.as_dict():
+            g.remove_node(a)
+            expected.remove_node(a)
+        else:
+            g.add_edge(a, b)
+            expected.add_edge(a, b)
+        n = rng.choice(list(expected.iter_nodes()) or ["0"])
+        if n in expected.as_dict():
+            assert tuple(expected.get_successors(n)) == tuple(g.get_successors(n))
+            assert tuple(expected.get_predecessors(n)) == tuple(g.get_predecessors(n))
+    assert expected.as_dict() == g.as_dict()
@@ -0,0 +1,84 @@
+import pytest
+
+from elasticai.creator.ir.core import edge, node
+from elasticai.creator.ir.graph import Graph
+from elasticai.creator.ir.node_table import NodeTable
+
+
+@pytest.fixture(params=[dict, NodeTable])
+def graph(request) -> Graph:
+    return Graph(
+        nodes=(
+            node("x", "input"),
+            node("a", "conv", {"implementation": "conv_a", "bits": 8}),
+            node("b", "conv", {"implementation": "conv_b", "bits": 4}),
+        ),
+        edges=(edge("x", "a"), edge("a", "b")),
+        node_table=request.param,
+        indexed_attributes=("bits",),
+    )
+
+
+def names(nodes) -> tuple[str, ...]:
+    return tuple(nodes)
+
+
+def test_find_nodes_by_type(graph) -> None:
+    assert ("a", "b") == names(graph.nodes_by("type", "conv"))
+    assert () == names(graph.nodes_by("type", "linear"))
+
+
+def test_find_nodes_by_implementation(graph) -> None:
+    assert ("b",) == names(graph.nodes_by("implementation", "conv_b"))
+
+
+def test_find_nodes_by_user_declared_key(graph) -> None:
+    assert ("a",) == names(graph.nodes_by("bits", 8))
+
+
+def test_looking_up_key_without_index_raises_error(graph) -> None:
+    with pytest.raises(KeyError):
+        graph.nodes_by("stride", 1)
+
+
+def test_index_added_later_contains_existing_nodes(graph) -> None:
+    graph.add_index("name")
+    assert ("b",) == names(graph.nodes_by("name", "b"))
+
+
+def test_indexes_follow_mutations(graph) -> None:
+    graph.replace_node(node("a", "linear"))
+    graph.remove_node("b")
+    graph.add_node(node("c", "conv"))
+    graph.splice_subgraph(remove=("x",), nodes=(node("y", "conv"),))
+    assert ("c", "y") == names(graph.nodes_by("type", "conv"))
+    assert ("a",) == names(graph.nodes_by("type", "linear"))
+    assert () == names(graph.nodes_by("bits", 8))
+
+
+def test_snapshots_have_independent_indexes(graph) -> None:
+    snap = graph.snapshot()
+    graph.replace_node(node("a", "linear"))
+    snap.add_node(node("c", "conv"))
+    assert ("a", "b", "c") == names(snap.nodes_by("type", "conv"))
+    assert ("b",) == names(graph.nodes_by("type", "conv"))
+
+
+def test_snapshots_copy_only_written_index_buckets(graph) -> None:
+    snap = graph.snapshot()
+    snap.replace_node(node("a", "linear"))
+    assert graph._indexes["type"]["input"] is snap._indexes["type"]["input"]
+    assert {"a": None, "b": None} == graph._indexes["type"]["conv"]
+    assert {"b": None} == snap._indexes["type"]["conv"]
+    assert "linear" not in graph._indexes["type"]
+
+
+def test_writing_after_repeated_snapshots_keeps_indexes_apart(graph) -> None:
+    first = graph.snapshot()
+    first.add_node(node("c", "conv"))
+    second = first.snapshot()
+    second.remove_node("c")
+    first.remove_node("a")
+    assert ("a", "b") == names(graph.nodes_by("type", "conv"))
+    assert {"b": None, "c": None} == first._indexes["type"]["conv"]
+    assert {"a": None, "b": None} == second._indexes["type"]["conv"]
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from elasticai.creator.ir.core import edge, node
+from elasticai.creator.ir.graph import Graph
+from elasticai.creator.ir.graph_delegate import GraphDelegate
+from elasticai.creator.ir.graph_iterators import (
+    bfs_iter_down,
+    bfs_iter_up,
+    topological_iter,
+)
+
+
+def quadratic_bfs_iter_down(successors, predecessors, start):
+    """The original implementation, kept to check that ordering is unchanged."""
+    visited = set()
+    visit_next = sorted(list(successors(start)))
+    while len(visit_next) > 0:
+        current = visit_next.pop(0)
+        if current not in visited:
+            visited.add(current)
+            yield current
+            for child in successors(current):
+                if set(predecessors(child)).issubset(visited):
+                    visit_next.append(child)
+
+
+def random_dag(seed: int, num_nodes: int = 60) -> GraphDelegate[str]:
+    rng = random.Random(seed)
+    g: GraphDelegate[str] = GraphDelegate()
+    for sink in range(1, num_nodes):
+        for src in rng.sample(range(sink), k=min(sink, rng.randint(1, 3))):
+            g.add_edge(str(src), str(sink))
+    return g
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_bfs_iter_down_keeps_ordering_of_quadratic_version(seed) -> None:
+    g = random_dag(seed)
+    expected = tuple(
+        quadratic_bfs_iter_down(g.get_successors, g.get_predecessors, "0")
+    )
+    assert expected == tuple(bfs_iter_down(g.get_successors, g.get_predecessors, "0"))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_bfs_iter_up_keeps_ordering_of_quadratic_version(seed) -> None:
+    g = random_dag(seed)
+    start = tuple(g.iter_nodes())[-1]
+    expected = tuple(
+        quadratic_bfs_iter_down(g.get_predecessors, g.get_successors, start)
+    )
+    assert expected == tuple(bfs_iter_up(g.get_predecessors, g.get_successors, start))
+
+
+def test_topological_iter_visits_predecessors_first() -> None:
+    g = random_dag(0)
+    order = tuple(topological_iter(g.iter_nodes(), g.get_successors))
+    position = {n: i for i, n in enumerate(order)}
+    assert set(order) == set(g.iter_nodes())
+    for src, sink in g.get_edges():
+        assert position[src] < position[sink]
+
+
+def test_topological_iter_raises_error_for_cycle() -> None:
+    g = GraphDelegate.from_dict({"a": ["b"], "b": ["a"]})
+    with pytest.raises(ValueError):
+        tuple(topological_iter(g.iter_nodes(), g.get_successors))
+
+
+def test_graph_topological_order_is_updated_on_mutation() -> None:
+    g = Graph(
+        nodes=(node("x", "t"), node("y", "t")),
+        edges=(edge("x", "y"),),
+    )
+    assert ("x", "y") == g.topological_order()
+    g.add_node(node("z", "t"))
+    g.add_edge(edge("z", "x"))
+    assert ("z", "x", "y") == g.topological_order()
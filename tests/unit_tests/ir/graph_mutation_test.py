@@ -0,0 +1,100 @@
+import pytest
+
+from elasticai.creator.ir.core import Node, edge, node
+from elasticai.creator.ir.csr_graph_delegate import CsrGraphDelegate
+from elasticai.creator.ir.graph import Graph
+from elasticai.creator.ir.graph_delegate import GraphDelegate
+from elasticai.creator.ir.lowering import LoweringPass
+
+
+@pytest.fixture(params=[GraphDelegate, CsrGraphDelegate])
+def graph(request) -> Graph:
+    """x -> y -> z"""
+    return Graph(
+        nodes=(node("x", "t"), node("y", "t"), node("z", "t")),
+        edges=(edge("x", "y"), edge("y", "z")),
+        graph_delegate=request.param,
+    )
+
+
+def test_new_graph_has_empty_journal(graph) -> None:
+    assert graph.changes.is_empty()
+
+
+def test_removing_node_removes_incident_edges(graph) -> None:
+    graph.remove_node("y")
+    assert ("x", "z") == tuple(graph.nodes)
+    assert () == tuple(graph.edges)
+    assert () == tuple(graph.successors("x"))
+
+
+def test_removing_node_is_recorded(graph) -> None:
+    graph.remove_node("y")
+    changes = graph.changes
+    assert {"y"} == changes.removed_nodes
+    assert {("x", "y"), ("y", "z")} == changes.removed_edges
+    assert {"x", "z"} == changes.affected_nodes()
+
+
+def test_removing_edge(graph) -> None:
+    graph.remove_edge("x", "y")
+    assert () == tuple(graph.predecessors("y"))
+    assert {("x", "y")} == graph.changes.removed_edges
+
+
+def test_replace_node_keeps_edges(graph) -> None:
+    graph.replace_node(node("y", "other"))
+    assert "other" == graph.nodes["y"].type
+    assert ("z",) == tuple(graph.successors("y"))
+    assert {"y"} == graph.changes.modified_nodes
+
+
+def test_replacing_missing_node_raises_error(graph) -> None:
+    with pytest.raises(KeyError):
+        graph.replace_node(node("w", "t"))
+
+
+def test_splice_subgraph_replaces_nodes(graph) -> None:
+    graph.splice_subgraph(
+        remove=("y",),
+        nodes=(node("a", "t"), node("b", "t")),
+        edges=(edge("x", "a"), edge("a", "b"), edge("b", "z")),
+    )
+    assert ("x", "a", "b", "z") == graph.topological_order()
+    assert {"a", "b"} == graph.changes.added_nodes
+    assert {"y"} == graph.changes.removed_nodes
+
+
+def test_removing_and_adding_node_again_counts_as_modification(graph) -> None:
+    graph.remove_node("y")
+    graph.add_node(node("y", "t"))
+    changes = graph.changes
+    assert {"y"} == changes.modified_nodes
+    assert set() == changes.removed_nodes | changes.added_nodes
+
+
+def test_adding_and_removing_node_leaves_no_trace(graph) -> None:
+    graph.add_node(node("w", "t"))
+    graph.remove_node("w")
+    assert graph.changes.is_empty()
+
+
+def test_take_changes_starts_new_journal(graph) -> None:
+    graph.remove_node("z")
+    assert {"z"} == graph.take_changes().removed_nodes
+    assert graph.changes.is_empty()
+
+
+def test_lowering_pass_lowers_only_affected_nodes(graph) -> None:
+    lower: LoweringPass[Node, str] = LoweringPass()
+
+    @lower.register
+    def t(n: Node) -> str:
+        return n.name
+
+    @lower.register
+    def other(n: Node) -> str:
+        return n.name.upper()
+
+    graph.replace_node(node("z", "other"))
+    assert {"z": ("Z",)} == lower.lower_changed(graph.nodes, graph.take_changes())
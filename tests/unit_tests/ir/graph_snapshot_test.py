@@ -0,0 +1,121 @@
+import pytest
+
+from elasticai.creator.ir.core import edge, node
+from elasticai.creator.ir.csr_graph_delegate import CsrGraphDelegate
+from elasticai.creator.ir.graph import Graph
+from elasticai.creator.ir.graph_delegate import GraphDelegate
+from elasticai.creator.ir.node_table import NodeTable
+from elasticai.creator.ir.overlay import Overlay
+from elasticai.creator.ir2vhdl import Implementation
+
+
+@pytest.fixture(params=[GraphDelegate, CsrGraphDelegate])
+def graph(request) -> Graph:
+    """x -> y -> z"""
+    g = Graph(
+        nodes=(node("x", "t"), node("y", "t"), node("z", "t")),
+        edges=(edge("x", "y"), edge("y", "z")),
+        graph_delegate=request.param,
+    )
+    tuple(g.successors("x"))
+    return g
+
+
+def test_snapshot_shares_nodes(graph) -> None:
+    snap = graph.snapshot()
+    assert snap.nodes["y"] is graph.nodes["y"]
+
+
+def test_modifying_snapshot_does_not_change_original(graph) -> None:
+    snap = graph.snapshot()
+    snap.remove_node("y")
+    snap.add_node(node("w", "t"))
+    snap.add_edge(edge("x", "w"))
+    assert ("x", "y", "z") == tuple(graph.nodes)
+    assert ("y",) == tuple(graph.successors("x"))
+    assert ("w",) == tuple(snap.successors("x"))
+
+
+def test_modifying_original_does_not_change_snapshot(graph) -> None:
+    snap = graph.snapshot()
+    graph.add_edge(edge("x", "z"))
+    graph.replace_node(node("z", "other"))
+    assert ("y",) == tuple(snap.successors("x"))
+    assert "t" == snap.nodes["z"].type
+
+
+def test_snapshots_of_snapshots_are_independent(graph) -> None:
+    a = graph.snapshot()
+    b = a.snapshot()
+    a.remove_edge("x", "y")
+    b.add_node(node("w", "t"))
+    assert ("y",) == tuple(graph.successors("x"))
+    assert ("y",) == tuple(b.successors("x"))
+    assert "w" not in a.nodes
+
+
+def test_snapshot_starts_with_empty_journal(graph) -> None:
+    graph.remove_edge("x", "y")
+    assert graph.snapshot().changes.is_empty()
+
+
+def test_diff_against_snapshot(graph) -> None:
+    snap = graph.snapshot()
+    graph.splice_subgraph(
+        remove=("y",), nodes=(node("a", "t"),), edges=(edge("x", "a"),)
+    )
+    graph.replace_node(node("z", "other"))
+    changes = graph.diff(snap)
+    assert {"a"} == changes.added_nodes
+    assert {"y"} == changes.removed_nodes
+    assert {"z"} == changes.modified_nodes
+    assert {("x", "a")} == changes.added_edges
+    assert {("x", "y"), ("y", "z")} == changes.removed_edges
+
+
+def test_unchanged_snapshot_has_empty_diff(graph) -> None:
+    assert graph.diff(graph.snapshot()).is_empty()
+
+
+def test_candidates_store_only_their_own_changes() -> None:
+    g = Graph(
+        nodes=(node(f"n{i}", "t") for i in range(100)),
+        edges=(edge(f"n{i}", f"n{i + 1}") for i in range(99)),
+    )
+    snap = g.snapshot()
+    candidates = [snap.snapshot() for _ in range(3)]
+    for i, c in enumerate(candidates):
+        c.replace_node(node(f"n{i}", "other"))
+        c.remove_edge(f"n{i}", f"n{i + 1}")
+    for i, c in enumerate(candidates):
+        assert isinstance(c._node_data, Overlay)
+        assert {f"n{i}"} == c._node_data.changed_keys(g._node_data)
+        assert {(f"n{i}", f"n{i + 1}")} == c._edge_data.changed_keys(g._edge_data)  # type: ignore[attr-defined]
+    changes = candidates[0].diff(candidates[1])
+    assert {"n0", "n1"} == changes.modified_nodes
+    assert {("n1", "n2")} == changes.added_edges
+    assert {("n0", "n1")} == changes.removed_edges
+    assert ("n1",) == tuple(g.successors("n0"))
+
+
+def test_snapshot_of_graph_with_node_table() -> None:
+    g = Graph(
+        nodes=(node("x", "t"), node("y", "t")),
+        edges=(edge("x", "y"),),
+        node_table=NodeTable,
+    )
+    snap = g.snapshot()
+    snap.replace_node(node("y", "other"))
+    snap.add_node(node("z", "t"))
+    assert "t" == g.nodes["y"].type
+    assert ("x", "y", "z") == tuple(snap.nodes)
+    assert {"z"} == snap.diff(g).added_nodes
+    assert {"y"} == snap.diff(g).modified_nodes
+
+
+def test_implementation_snapshot_copies_attributes() -> None:
+    impl: Implementation = Implementation(name="a", type="b", attributes={"x": 1})
+    snap = impl.snapshot()
+    snap.attributes["x"] = 2
+    assert {"x": 1} == impl.attributes
+    assert "a" == snap.name
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+import torch
+
+from elasticai.creator.ir import ArrayAttribute, Graph, Node, edge, node
+from elasticai.creator.ir.interpreter import Interpreter, InterpreterError
+
+
+@pytest.fixture
+def interpreter() -> Interpreter:
+    interpreter = Interpreter()
+
+    @interpreter.register("linear")
+    def linear(n: Node, inputs, out) -> None:
+        np.matmul(inputs[0], np.asarray(n.data["weight"]).T, out=out)
+        out += np.asarray(n.data["bias"])
+
+    @interpreter.register("relu")
+    def relu(n: Node, inputs, out) -> None:
+        np.maximum(inputs[0], 0, out=out)
+
+    @interpreter.register("add")
+    def add(n: Node, inputs, out) -> None:
+        np.add(inputs[0], inputs[1], out=out)
+
+    return interpreter
+
+
+def linear_node(name: str, layer: torch.nn.Linear) -> Node:
+    return node(
+        name,
+        "linear",
+        {
+            "output_shape": (layer.out_features,),
+            "weight": ArrayAttribute(layer.weight.detach().numpy()),
+            "bias": ArrayAttribute(layer.bias.detach().numpy()),
+        },
+    )
+
+
+def test_matches_pytorch_model(interpreter) -> None:
+    torch.manual_seed(0)
+    model = torch.nn.Sequential(
+        torch.nn.Linear(4, 8), torch.nn.ReLU(), torch.nn.Linear(8, 2)
+    )
+    g = Graph(
+        nodes=(
+            node("input", "input", {"output_shape": (4,)}),
+            linear_node("fc1", model[0]),
+            node("act", "relu", {"output_shape": (8,)}),
+            linear_node("fc2", model[2]),
+        ),
+        edges=(edge("input", "fc1"), edge("fc1", "act"), edge("act", "fc2")),
+    )
+    x = torch.randn(16, 4)
+    run = interpreter.compile(g, dtype=np.float32)
+    for _ in range(2):
+        result = run({"input": x.numpy()})
+        np.testing.assert_allclose(
+            model(x).detach().numpy(), result["fc2"], rtol=1e-5, atol=1e-6
+        )
+
+
+def test_shared_buffers_do_not_overwrite_live_values(interpreter) -> None:
+    """a is needed by add after b and c were computed"""
+    g = Graph(
+        nodes=(
+            node("a", "input", {"output_shape": (3,)}),
+            node("b", "relu", {"output_shape": (3,)}),
+            node("c", "relu", {"output_shape": (3,)}),
+            node("sum", "add", {"output_shape": (3,)}),
+        ),
+        edges=(edge("a", "b"), edge("b", "c"), edge("a", "sum"), edge("c", "sum")),
+    )
+    run = interpreter.compile(g)
+    x = np.array([[-1.0, 2.0, 3.0]])
+    np.testing.assert_equal([[-1.0, 4.0, 6.0]], run({"a": x})["sum"])
+    assert 9 == run.memory_per_sample
+
+
+def test_inputs_late_in_topological_order_get_own_buffers(interpreter) -> None:
+    g = Graph(
+        nodes=(
+            node("x", "input", {"output_shape": (2,)}),
+            node("rx", "relu", {"output_shape": (2,)}),
+            node("y", "input", {"output_shape": (2,)}),
+            node("sum", "add", {"output_shape": (2,)}),
+        ),
+        edges=(edge("x", "rx"), edge("rx", "sum"), edge("y", "sum")),
+    )
+    result = interpreter.compile(g)(
+        {"x": np.array([[1.0, -1.0]]), "y": np.array([[10.0, 20.0]])}
+    )
+    np.testing.assert_equal([[11.0, 20.0]], result["sum"])
+
+
+def test_missing_kernel_raises_error_on_compile(interpreter) -> None:
+    g = Graph(
+        nodes=(
+            node("x", "input", {"output_shape": (2,)}),
+            node("y", "conv", {"output_shape": (2,)}),
+        ),
+        edges=(edge("x", "y"),),
+    )
+    with pytest.raises(InterpreterError, match="conv"):
+        interpreter.compile(g)
+
+
+def test_wrong_input_shape_raises_error(interpreter) -> None:
+    g = Graph(nodes=(node("x", "input", {"output_shape": (2,)}),))
+    with pytest.raises(InterpreterError, match="shape"):
+        interpreter.compile(g)({"x": np.zeros((1, 3))})
@@ -2,7 +2,11 @@ import pytest
 
 from elasticai.creator.ir.ir_data import IrData
 from elasticai.creator.ir.ir_data_meta import IrDataMeta
-from elasticai.creator.ir.required_field import ReadOnlyField, RequiredField
+from elasticai.creator.ir.required_field import (
+    CachedRequiredField,
+    ReadOnlyField,
+    RequiredField,
+)
 
 
 def test_using_metaclass() -> None:
@@ -165,3 +169,52 @@ def test_inheriting_from_ir_data_without_annotated_fields_does_not_raise_excepti
             pass
     except KeyError:
         pytest.fail("did not expect an error")
+
+
+class _CountingConversion:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, value: str) -> int:
+        self.calls += 1
+        return int(value)
+
+
+def test_cached_field_converts_stored_value_once() -> None:
+    convert = _CountingConversion()
+
+    class Node(IrData):
+        length: RequiredField[str, int] = CachedRequiredField(str, convert)
+
+    n = Node(dict(length="12"))
+    assert (12, 12) == (n.length, n.length)
+    assert 1 == convert.calls
+
+
+def test_cached_field_is_invalidated_by_writing_field() -> None:
+    class Node(IrData):
+        length: RequiredField[str, int] = CachedRequiredField(str, int)
+
+    n = Node(dict(length="12"))
+    _ = n.length
+    n.length += 3
+    assert 15 == n.length
+
+
+def test_cached_field_is_invalidated_by_writing_data() -> None:
+    class Node(IrData):
+        length: RequiredField[str, int] = CachedRequiredField(str, int)
+
+    n = Node(dict(length="12"))
+    _ = n.length
+    n.data["length"] = "3"
+    assert 3 == n.length
+    n.data = dict(length="4")
+    assert 4 == n.length
+
+
+def test_cached_field_is_detected_as_required_field() -> None:
+    class Node(IrData):
+        length: RequiredField[str, int] = CachedRequiredField(str, int)
+
+    assert {"length": str} == dict(Node.required_fields)
@@ -0,0 +1,135 @@
+import pytest
+
+from elasticai.creator.ir.core import Node, edge, node
+from elasticai.creator.ir.graph import Graph
+from elasticai.creator.ir.node_table import NodeTable
+from elasticai.creator.ir2vhdl import Implementation, VhdlNode
+
+
+def vhdl_node(name: str, **attributes) -> VhdlNode:
+    return VhdlNode(
+        dict(
+            name=name,
+            type="linear",
+            implementation="linear",
+            input_shape=(1, 4),
+            output_shape=(1, 2),
+            **attributes,
+        )
+    )
+
+
+@pytest.fixture
+def table() -> NodeTable[VhdlNode]:
+    t: NodeTable[VhdlNode] = NodeTable()
+    t["a"] = vhdl_node("a", weights=[1, 2])
+    t["b"] = vhdl_node("b")
+    return t
+
+
+def test_views_satisfy_field_descriptors(table) -> None:
+    n = table["a"]
+    assert isinstance(n, VhdlNode)
+    assert ("a", "linear", 2) == (n.name, n.type, n.output_shape.width)
+
+
+def test_views_equal_stored_nodes(table) -> None:
+    assert vhdl_node("a", weights=[1, 2]) == table["a"]
+    assert vhdl_node("b").data == dict(table["b"].data)
+
+
+def test_repeated_values_are_stored_once(table) -> None:
+    assert table["a"].data["input_shape"] is table["b"].data["input_shape"]
+
+
+def test_equal_values_of_different_types_are_kept_apart(table) -> None:
+    table["c"] = VhdlNode(dict(vhdl_node("c").data) | {"input_shape": (1.0, 4.0)})
+    shape = table["c"].data["input_shape"]
+    assert [float, float] == [type(v) for v in shape]  # type: ignore[union-attr]
+    assert (1, 4) == table["a"].data["input_shape"]
+
+
+def test_values_that_equal_earlier_values_are_interned_once(table) -> None:
+    for name, shape in (("c", (1,)), ("d", (True,)), ("e", (True,))):
+        table[name] = VhdlNode(dict(vhdl_node(name).data) | {"input_shape": shape})
+    assert table["d"].data["input_shape"] is table["e"].data["input_shape"]
+    assert (True,) == table["d"].data["input_shape"]
+    assert bool is type(table["d"].data["input_shape"][0])  # type: ignore[index]
+
+
+def test_free_form_attributes_are_kept_in_side_table(table) -> None:
+    assert {"weights": [1, 2]} == dict(table["a"].attributes)
+    assert {} == dict(table["b"].attributes)
+
+
+def test_writing_view_data_writes_to_table(table) -> None:
+    n = table["b"]
+    n.data["implementation"] = "other"
+    n.data["bias"] = [3]
+    n.output_shape = n.input_shape
+    assert "other" == table["b"].implementation
+    assert [3] == table["b"].data["bias"]
+    assert (1, 4) == table["b"].data["output_shape"]
+
+
+def test_views_of_replaced_nodes_raise_key_error(table) -> None:
+    old = table["b"]
+    table["b"] = Node(dict(name="b", type="other"))
+    assert "other" == table["b"].type
+    assert not isinstance(table["b"], VhdlNode)
+    with pytest.raises(KeyError):
+        old.type
+
+
+def test_rows_are_reused(table) -> None:
+    for i in range(10):
+        table["b"] = vhdl_node("b", bias=[i])
+        del table["a"]
+        table["a"] = vhdl_node("a")
+    assert 2 == table._num_rows
+    assert [9] == table["b"].data["bias"]
+    assert {} == dict(table["a"].attributes)
+
+
+def test_views_of_removed_nodes_raise_key_error(table) -> None:
+    n = table["a"]
+    del table["a"]
+    assert ("b",) == tuple(table)
+    with pytest.raises(KeyError):
+        n.name
+
+
+def test_copy_is_independent(table) -> None:
+    del table["a"]
+    c = table.copy()
+    c["b"].data["implementation"] = "other"
+    assert "linear" == table["b"].implementation
+    assert ("b",) == tuple(c)
+    c["a"] = vhdl_node("a")
+    assert ("b",) == tuple(table)
+
+
+def test_graph_with_node_table() -> None:
+    g: Graph[Node, ...] = Graph(  # type: ignore[type-var]
+        nodes=(node("x", "t"), node("y", "t")),
+        edges=(edge("x", "y"),),
+        node_table=NodeTable,
+    )
+    snap = g.snapshot()
+    g.replace_node(node("y", "other"))
+    assert {"y"} == g.diff(snap).modified_nodes
+    assert "t" == snap.nodes["y"].type
+    assert ("y",) == tuple(n.name for n in g.successors("x").values())
+
+
+def test_implementation_roundtrip_with_node_table() -> None:
+    impl: Implementation = Implementation(
+        name="i",
+        type="t",
+        attributes={},
+        nodes=(vhdl_node("a"), vhdl_node("b")),
+        node_table=NodeTable,
+    )
+    assert [vhdl_node("a").data, vhdl_node("b").data] == [
+        dict(d) for d in impl.asdict()["nodes"]
+    ]
@@ -0,0 +1,56 @@
+import pytest
+
+from elasticai.creator.ir.overlay import Overlay
+
+
+@pytest.fixture
+def base() -> dict[str, int]:
+    return {"a": 1, "b": 2, "c": 3}
+
+
+def test_writes_do_not_change_base(base) -> None:
+    o = Overlay.over(base)
+    o["a"] = 10
+    o["d"] = 4
+    del o["b"]
+    assert {"a": 1, "b": 2, "c": 3} == base
+    assert {"a": 10, "c": 3, "d": 4} == dict(o)
+    assert 3 == len(o)
+    assert "b" not in o
+    with pytest.raises(KeyError):
+        o["b"]
+
+
+def test_iterates_in_same_order_as_dict(base) -> None:
+    o = Overlay.over(base)
+    d = dict(base)
+    for table in (o, d):
+        table["b"] = 20
+        del table["a"]
+        table["e"] = 5
+        table["a"] = 1
+        del table["e"]
+        table["e"] = 6
+    assert list(d.items()) == list(o.items())
+
+
+def test_copies_share_base_and_copy_only_changes(base) -> None:
+    o = Overlay.over(base)
+    o["a"] = 10
+    c = Overlay.over(o)
+    c["c"] = 30
+    assert {"a": 10, "b": 2, "c": 3} == dict(o)
+    assert {"a": 10, "b": 2, "c": 30} == dict(c)
+    assert {"a", "c"} == c.changed_keys(o)  # type: ignore[union-attr]
+    assert {"a"} == o.changed_keys(base)  # type: ignore[union-attr]
+
+
+def test_changes_are_merged_into_new_table_once_they_dominate(base) -> None:
+    o = Overlay.over(base)
+    o["a"] = 10
+    del o["b"]
+    merged = Overlay.over(o)
+    assert {"a": 10, "c": 3} == merged
+    assert not isinstance(merged, Overlay)
+    merged["d"] = 4
+    assert "d" not in o
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from elasticai.creator.ir.core import Node
+from elasticai.creator.ir.hashing import content_hash
+from elasticai.creator.ir.lowering import LoweringPass
+from elasticai.creator.ir.pass_manager import PassManager
+from elasticai.creator.ir2vhdl import Implementation, VhdlNode
+
+
+def impl(name: str, width: int) -> Implementation:
+    return Implementation(
+        name=name,
+        type="linear",
+        attributes={"width": width},
+        nodes=(VhdlNode(dict(name="x", type="t", implementation="t")),),
+    )
+
+
+@pytest.fixture
+def calls() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def passes(calls) -> PassManager[Implementation]:
+    passes: PassManager[Implementation] = PassManager()
+
+    @passes.analysis()
+    def num_nodes(impl, results) -> int:
+        calls.append(f"num_nodes:{impl.name}")
+        return len(impl.nodes)
+
+    @passes.transform(invalidates=("num_nodes",))
+    def double(impl, results) -> Implementation:
+        calls.append(f"double:{impl.name}")
+        return Implementation(
+            name=impl.name,
+            type=impl.type,
+            attributes={"width": impl.attributes["width"] * 2},
+            nodes=tuple(impl.nodes.values())
+            + (VhdlNode(dict(name="y", type="t", implementation="t")),),
+        )
+
+    @passes.analysis(requires=("double", "num_nodes"))
+    def summary(impl, results) -> str:
+        calls.append(f"summary:{impl.name}")
+        return f"{impl.attributes['width']}/{results['num_nodes']}"
+
+    return passes
+
+
+def test_requirements_are_recomputed_after_transform(passes, calls) -> None:
+    result = passes.run(impl("a", 2), targets=("summary",))
+    assert "4/2" == result.results["summary"]
+    assert 4 == result.implementation.attributes["width"]
+    assert ["double:a", "num_nodes:a", "summary:a"] == calls
+
+
+def test_invalidated_results_are_dropped(passes) -> None:
+    result = passes.run(impl("a", 2))
+    assert {"double", "num_nodes", "summary"} == set(result.results)
+    assert 2 == result.results["num_nodes"]
+
+
+def test_unchanged_implementations_are_served_from_cache(passes, calls) -> None:
+    list(passes([impl("a", 2), impl("b", 3)], targets=("summary",)))
+    calls.clear()
+    results = list(passes([impl("a", 2), impl("b", 5)], targets=("summary",)))
+    assert ["4/2", "10/2"] == [r.results["summary"] for r in results]
+    assert ["double:b", "num_nodes:b", "summary:b"] == calls
+
+
+def test_lowering_pass_as_analysis() -> None:
+    lower: LoweringPass[Implementation, str] = LoweringPass()
+
+    @lower.register
+    def linear(impl: Implementation) -> str:
+        return impl.name
+
+    passes: PassManager[Implementation] = PassManager()
+    passes.add_lowering("names", lower)
+    assert ("a",) == passes.run(impl("a", 1)).results["names"]
+
+
+def test_unknown_requirement_raises_error(passes) -> None:
+    with pytest.raises(KeyError):
+        passes.run(impl("a", 1), targets=("missing",))
+
+
+def test_content_hash_ignores_insertion_order() -> None:
+    assert content_hash({"a": 1, "b": (1, 2)}) == content_hash({"b": (1, 2), "a": 1})
+    assert content_hash({"a": 1}) != content_hash({"a": 1.0})
+
+
+def test_content_hash_of_numpy_scalars_and_sets() -> None:
+    assert content_hash(np.int64(3)) == content_hash(np.int64(3))
+    assert content_hash(np.int64(3)) != content_hash(np.int32(3))
+    assert content_hash(np.int64(3)) != content_hash(3)
+    assert content_hash({"b", "a"}) == content_hash({"a", "b"})
+
+
+def test_content_hash_of_nodes_distinguishes_values() -> None:
+    assert content_hash(Node(dict(name="x")).data) != content_hash(
+        Node(dict(name="y")).data
+    )
+
+
+def test_pass_version_is_part_of_cache_key() -> None:
+    passes: PassManager[Implementation] = PassManager()
+
+    def width(impl, results) -> int:
+        return impl.attributes["width"]
+
+    passes.analysis()(width)
+    passes.run(impl("a", 1))
+    width.version = "2"  # type: ignore[attr-defined]
+    other: PassManager[Implementation] = PassManager()
+    other.analysis()(width)
+    other._cache = passes._cache
+    other.run(impl("a", 1))
+    assert 0 == other.hits
+
+
+def test_least_recently_used_results_are_evicted(calls) -> None:
+    passes: PassManager[Implementation] = PassManager(cache_size=2)
+
+    @passes.analysis()
+    def name(impl, results) -> str:
+        calls.append(impl.name)
+        return impl.name
+
+    for n in ("a", "b", "a", "c", "a", "b"):
+        passes.run(impl(n, 1))
+    assert ["a", "b", "c", "b"] == calls
+    assert 2 == len(passes._cache)
@@ -0,0 +1,142 @@
+import pytest
+
+from elasticai.creator.ir.core import Edge, Node, edge, node
+from elasticai.creator.ir.graph import Graph
+from elasticai.creator.ir.rewriting import Match, Pattern, Replacement, Rewriter
+
+
+def chain(*types: str) -> Graph[Node, Edge]:
+    names = [f"{t}{i}" for i, t in enumerate(types)]
+    return Graph(
+        nodes=(node(n, t) for n, t in zip(names, types)),
+        edges=(edge(a, b) for a, b in zip(names[:-1], names[1:])),
+    )
+
+
+@pytest.fixture
+def fuse() -> Rewriter[Node, Edge]:
+    rewrite: Rewriter[Node, Edge] = Rewriter()
+
+    @rewrite.rule(
+        Pattern(nodes={"lin": "linear", "bn": "batchnorm"}, edges=[("lin", "bn")])
+    )
+    def fuse_linear_batchnorm(match: Match) -> Replacement:
+        name = match.nodes["lin"].name
+        return Replacement(
+            nodes=[node(name, "fused_linear")], rewire={"lin": name, "bn": name}
+        )
+
+    return rewrite
+
+
+@pytest.fixture
+def remove_identity() -> Rewriter[Node, Edge]:
+    rewrite: Rewriter[Node, Edge] = Rewriter()
+
+    @rewrite.rule(Pattern(nodes={"id": "identity"}))
+    def bypass(match: Match) -> Replacement:
+        return Replacement(
+            edges=[
+                edge(i.src, o.sink)
+                for i in match.incoming("id")
+                for o in match.outgoing("id")
+            ]
+        )
+
+    return rewrite
+
+
+def test_fuses_linear_and_batchnorm(fuse) -> None:
+    g = chain("input", "linear", "batchnorm", "output")
+    assert 1 == fuse(g)
+    assert ("input0", "linear1", "output3") == g.topological_order()
+    assert "fused_linear" == g.nodes["linear1"].type
+    assert ("output3",) == tuple(g.successors("linear1"))
+
+
+def test_does_not_match_if_intermediate_result_is_used_elsewhere(fuse) -> None:
+    g = chain("input", "linear", "batchnorm", "output")
+    g.add_node(node("other", "output"))
+    g.add_edge(edge("linear1", "other"))
+    assert 0 == fuse(g)
+
+
+def test_removes_all_identities_until_fixed_point(remove_identity) -> None:
+    g = chain("input", "identity", "identity", "linear", "identity", "output")
+    assert 3 == remove_identity(g)
+    assert ("input0", "linear3", "output5") == g.topological_order()
+    assert {("input0", "linear3"), ("linear3", "output5")} == set(g.edges)
+
+
+def test_rewrites_enable_new_matches(fuse, remove_identity) -> None:
+    g = chain("input", "linear", "identity", "batchnorm", "output")
+    rewrite: Rewriter[Node, Edge] = Rewriter(remove_identity.rules + fuse.rules)
+    assert 2 == rewrite(g)
+    assert ("input0", "linear1", "output4") == g.topological_order()
+
+
+def test_rule_can_decline_match() -> None:
+    rewrite: Rewriter[Node, Edge] = Rewriter()
+
+    @rewrite.rule(Pattern(nodes={"x": "linear"}))
+    def decline(match: Match) -> None:
+        return None
+
+    assert 0 == rewrite(chain("input", "linear"))
+
+
+def test_raises_error_if_rules_do_not_converge() -> None:
+    rewrite: Rewriter[Node, Edge] = Rewriter()
+
+    @rewrite.rule(Pattern(nodes={"x": "a"}))
+    def a_to_b(match: Match) -> Replacement:
+        return Replacement(nodes=[node(match.nodes["x"].name, "b")])
+
+    @rewrite.rule(Pattern(nodes={"x": "b"}))
+    def b_to_a(match: Match) -> Replacement:
+        return Replacement(nodes=[node(match.nodes["x"].name, "a")])
+
+    with pytest.raises(RuntimeError):
+        rewrite(chain("a"), max_rewrites=10)
+
+
+def test_pattern_has_to_be_connected() -> None:
+    with pytest.raises(ValueError):
+        Pattern(nodes={"a": "linear", "b": "linear"})
+
+
+def test_limit_is_checked_before_applying_next_rewrite() -> None:
+    rewrite: Rewriter[Node, Edge] = Rewriter()
+
+    @rewrite.rule(Pattern(nodes={"x": "a"}))
+    def a_to_b(match: Match) -> Replacement:
+        return Replacement(nodes=[node(match.nodes["x"].name, "b")])
+
+    @rewrite.rule(Pattern(nodes={"x": "b"}))
+    def b_to_a(match: Match) -> Replacement:
+        return Replacement(nodes=[node(match.nodes["x"].name, "a")])
+
+    g = chain("a")
+    with pytest.raises(RuntimeError):
+        rewrite(g, max_rewrites=3)
+    assert {"b"} == {n.type for n in g.nodes.values()}
+
+
+def test_reaching_fixed_point_exactly_at_limit_succeeds() -> None:
+    rewrite: Rewriter[Node, Edge] = Rewriter()
+
+    @rewrite.rule(Pattern(nodes={"x": "a"}))
+    def a_to_b(match: Match) -> Replacement:
+        return Replacement(nodes=[node(match.nodes["x"].name, "b")])
+
+    assert 2 == rewrite(chain("a", "a"), max_rewrites=2)
+
+
+def test_ignores_nodes_that_only_occur_in_edges(fuse, remove_identity) -> None:
+    g = chain("input", "linear", "identity", "batchnorm", "output")
+    g.add_edge(edge("linear1", "probe"))
+    g.add_edge(edge("unknown", "input0"))
+    rewrite: Rewriter[Node, Edge] = Rewriter(remove_identity.rules + fuse.rules)
+    assert 1 == rewrite(g)
+    assert "linear" == g.nodes["linear1"].type
+    assert {"probe", "unknown"} <= set(g.nodes)
@@ -0,0 +1,65 @@
+import pytest
+
+from elasticai.creator.ir import Graph, Node, edge, node
+from elasticai.creator.ir.scheduling import Scheduler
+
+
+def graph_of(latencies: dict[str, int], edges: list[tuple[str, str]]) -> Graph:
+    return Graph(
+        nodes=(node(n, "op", {"latency": lat}) for n, lat in latencies.items()),
+        edges=(edge(a, b) for a, b in edges),
+    )
+
+
+@pytest.fixture
+def scheduler() -> Scheduler:
+    scheduler = Scheduler()
+
+    @scheduler.register("op")
+    def op(n: Node) -> int:
+        return n.data["latency"]
+
+    return scheduler
+
+
+@pytest.fixture
+def diamond() -> Graph:
+    """a -> b -> d, a -> c -> d, the path through b is longer"""
+    return graph_of(
+        {"a": 1, "b": 5, "c": 2, "d": 1},
+        [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")],
+    )
+
+
+def test_asap_starts_after_slowest_predecessor(scheduler, diamond) -> None:
+    schedule = scheduler(diamond)
+    assert {"a": 0, "b": 1, "c": 1, "d": 6} == schedule.asap
+    assert 7 == schedule.total_latency
+
+
+def test_alap_delays_nodes_off_the_critical_path(scheduler, diamond) -> None:
+    schedule = scheduler(diamond)
+    assert {"a": 0, "b": 1, "c": 4, "d": 6} == schedule.alap
+    assert {"a": 0, "b": 0, "c": 3, "d": 0} == schedule.slacks
+
+
+def test_critical_path_follows_nodes_without_slack(scheduler, diamond) -> None:
+    schedule = scheduler(diamond)
+    assert ("a", "b", "d") == schedule.critical_path
+    assert schedule.report().splitlines()[0] == "total latency: 7 cycles"
+
+
+def test_outputs_finishing_early_have_slack(scheduler) -> None:
+    schedule = scheduler(graph_of({"a": 1, "b": 4, "c": 1}, [("a", "b"), ("a", "c")]))
+    assert 3 == schedule.slack("c")
+    assert ("a", "b") == schedule.critical_path
+
+
+def test_unregistered_types_take_default_latency() -> None:
+    schedule = Scheduler(default_latency=2)(graph_of({"a": 9, "b": 9}, [("a", "b")]))
+    assert 4 == schedule.total_latency
+
+
+def test_registering_type_twice_raises_error(scheduler) -> None:
+    with pytest.raises(ValueError):
+        scheduler.register("op", lambda n: 0)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from elasticai.creator.ir.core import Edge, Node, edge, node
+from elasticai.creator.ir.graph import Graph
+from elasticai.creator.ir.helpers import FilterParameters
+from elasticai.creator.ir.shape_inference import ShapeInference, ShapeInferenceError
+
+
+def conv(name: str, kernel_size: int, in_channels: int, out_channels: int) -> Node:
+    p = FilterParameters(
+        kernel_size=kernel_size, in_channels=in_channels, out_channels=out_channels
+    )
+    return node(name, "conv", {"filter_parameters": p.as_dict()})
+
+
+@pytest.fixture
+def graph() -> Graph[Node, Edge]:
+    """input -> conv0 -> relu -> conv1 -> flatten -> linear"""
+    linear = node(
+        "linear",
+        "linear",
+        {
+            "filter_parameters": FilterParameters(
+                kernel_size=-1, in_channels=4 * 6, out_channels=2
+            ).as_dict()
+        },
+    )
+    nodes = (
+        node("input", "input"),
+        conv("conv0", 3, 1, 2),
+        node("relu", "relu"),
+        conv("conv1", 5, 2, 4),
+        node("flatten", "flatten"),
+        linear,
+    )
+    names = [n.name for n in nodes]
+    return Graph(nodes=nodes, edges=(edge(a, b) for a, b in zip(names[:-1], names[1:])))
+
+
+def test_propagates_shapes_through_filters(graph) -> None:
+    ShapeInference()(graph, {"input": (1, 12)})
+    shapes = {
+        n.name: (n.data["input_shape"], n.data["output_shape"])
+        for n in graph.nodes.values()
+    }
+    assert ((1, 12), (2, 10)) == shapes["conv0"]
+    assert ((2, 10), (2, 10)) == shapes["relu"]
+    assert ((2, 10), (4, 6)) == shapes["conv1"]
+    assert ((4, 6), (2, 1)) == shapes["linear"]
+
+
+def test_fills_filter_parameters(graph) -> None:
+    ShapeInference()(graph, {"input": (1, 12)})
+    p = graph.nodes["conv1"].data["filter_parameters"]
+    assert (10, 6, 6) == (p["input_size"], p["output_size"], p["num_steps"])
+    assert 6 == FilterParameters.from_dict(p).num_steps
+
+
+def test_registered_rule_is_used(graph) -> None:
+    infer = ShapeInference()
+
+    @infer.register("flatten")
+    def flatten(inputs, nodes):
+        return np.stack((np.ones(len(inputs), dtype=int), inputs.prod(axis=1)), axis=1)
+
+    infer(graph, {"input": (1, 12)})
+    assert (1, 24) == graph.nodes["flatten"].data["output_shape"]
+
+
+def test_does_not_modify_snapshots(graph) -> None:
+    snap = graph.snapshot()
+    ShapeInference()(graph, {"input": (1, 12)})
+    assert "output_shape" not in snap.nodes["conv0"].data
+    assert "input_size" in graph.nodes["conv0"].data["filter_parameters"]
+    assert {"conv0", "conv1"} <= graph.changes.modified_nodes
+
+
+def test_raises_error_for_mismatching_channels(graph) -> None:
+    with pytest.raises(ShapeInferenceError, match="conv0"):
+        ShapeInference()(graph, {"input": (3, 12)})
+
+
+def test_raises_error_for_missing_input_shape(graph) -> None:
+    with pytest.raises(ShapeInferenceError, match="input"):
+        ShapeInference()(graph)
@@ -1,12 +1,17 @@
 from typing import Any
 
-from pytest import fixture
+import numpy as np
+from pytest import fixture, raises
 
+import elasticai.creator.ir2vhdl as ir2vhdl
 from elasticai.creator.ir import Node
 from elasticai.creator.ir.helpers import Shape
 from elasticai.creator.ir2vhdl import (
+    Code,
+    CodeWriter,
     Implementation,
     Instance,
+    Ir2Vhdl,
     LogicSignal,
     LogicVectorSignal,
     NullDefinedLogicSignal,
@@ -48,6 +53,53 @@ def test_load_from_dict(data):
     assert data == Implementation.fromdict(data).asdict()
 
 
+def _lower_to_comment(impl: Implementation) -> Code:
+    return impl.name, [f"-- {impl.attributes['a']}"]
+
+
+def test_parallel_lowering_yields_results_in_input_order():
+    lower = Ir2Vhdl()
+    lower.register("conv", _lower_to_comment)
+    lower.register_static("pkg.vhd", lambda: "-- pkg")
+    impls = [
+        Implementation(name=f"conv{i}", type="conv", attributes={"a": i})
+        for i in range(10)
+    ]
+    expected = [(f"conv{i}.vhd", [f"-- {i}"]) for i in range(10)]
+    expected.append(("pkg.vhd", "-- pkg"))
+    assert expected == list(lower(impls, jobs=3))
+
+
+def _stream_comment(impl: Implementation, out: CodeWriter) -> None:
+    out.write_line(f"-- {impl.attributes['a']}")
+    out.write_lines(f"-- line {i}" for i in range(2))
+
+
+def test_streaming_handler_writes_file(tmp_path, impl):
+    lower = Ir2Vhdl()
+    lower.register_streaming("conv", _stream_comment)
+    lower.register_static("pkg.vhd", lambda: "-- pkg\n")
+    written = lower.write((impl,), tmp_path)
+    assert [tmp_path / "conv1.vhd", tmp_path / "pkg.vhd"] == written
+    assert "-- 1\n-- line 0\n-- line 1\n" == (tmp_path / "conv1.vhd").read_text()
+    assert "-- pkg\n" == (tmp_path / "pkg.vhd").read_text()
+
+
+def test_write_streams_content_of_other_handlers(tmp_path, impl):
+    lower = Ir2Vhdl()
+    lower.register("conv", lambda impl: (impl.name, (f"-- {i}" for i in range(3))))
+    lower.write((impl,), tmp_path)
+    assert "-- 0\n-- 1\n-- 2\n" == (tmp_path / "conv1.vhd").read_text()
+
+
+def test_streaming_handlers_can_be_called_like_other_handlers(impl):
+    lower = Ir2Vhdl()
+    lower.register_streaming("conv", _stream_comment)
+    expected = [("conv1.vhd", ["-- 1", "-- line 0", "-- line 1"])]
+    assert expected == list(lower((impl,)))
+    assert expected == list(lower((impl, impl), jobs=2))[:1]
+
+
 def test_can_access_attributes_of_vhdl_node():
     n = VhdlNode({"name": "a", "type": "b", "implementation": "c", "stride": 2})
     n.input_shape = Shape(1)
@@ -182,3 +234,160 @@ class TestPortMap:
                 "clk": "signal clk : std_logic := '0';",
             }
         )
+
+
+class TestSignalTypes:
+    @fixture
+    def integer_signal(self, monkeypatch) -> type[Signal]:
+        monkeypatch.setattr(Signal, "types", Signal.types.copy())
+        monkeypatch.setattr(ir2vhdl, "_parser", None)
+
+        class IntegerSignal(LogicSignal):
+            pattern = r"signal ([a-zA-Z_][a-zA-Z0-9_]*)\s*:\s*integer"
+
+            def define(self):
+                yield f"signal {self.name} : integer := 0;"
+
+        Signal.register_type(IntegerSignal)
+        return IntegerSignal
+
+    def test_types_are_tried_in_registration_order(self):
+        assert [LogicSignal, LogicVectorSignal, NullDefinedLogicSignal] == list(
+            Signal.types
+        )[:3]
+
+    def test_registered_pattern_is_recognized(self, integer_signal):
+        signal = Signal.from_code("signal count : integer := 0;")
+        assert isinstance(signal, integer_signal)
+        assert "count" == signal.name
+        assert isinstance(Signal.from_code("signal clk : std_logic;"), LogicSignal)
+
+    def test_types_can_be_modified_like_a_set(self, integer_signal):
+        Signal.types.discard(integer_signal)
+        assert not isinstance(
+            Signal.from_code("signal count : integer := 0;"), integer_signal
+        )
+        Signal.types.add(integer_signal)
+        assert integer_signal in Signal.types
+        assert isinstance(
+            Signal.from_code("signal count : integer := 0;"), integer_signal
+        )
+
+    def test_parsing_twice_yields_distinct_signals(self):
+        code = "signal clk : std_logic := '0';"
+        assert Signal.from_code(code) is not Signal.from_code(code)
+
+    def test_pattern_without_from_groups_is_rejected(self, monkeypatch):
+        monkeypatch.setattr(Signal, "types", Signal.types.copy())
+
+        class IncompleteSignal(NullDefinedLogicSignal):
+            pattern = r"signal ([a-zA-Z_][a-zA-Z0-9_]*)\s*:\s*natural"
+
+        with raises(TypeError):
+            Signal.register_type(IncompleteSignal)
+        assert IncompleteSignal not in Signal.types
+
+    def test_unknown_code_yields_null_signal(self):
+        assert isinstance(
+            Signal.from_code("constant x : integer := 1;"), NullDefinedLogicSignal
+        )
+
+
+class TestBuild:
+    @fixture
+    def calls(self) -> list[str]:
+        return []
+
+    @fixture
+    def lower(self, calls) -> Ir2Vhdl:
+        lower = Ir2Vhdl()
+
+        def conv(impl: Implementation) -> Code:
+            calls.append(impl.name)
+            return impl.name, [f"-- {impl.attributes['a']}"]
+
+        lower.register("conv", conv)
+        lower.register_static("pkg.vhd", lambda: "-- pkg\n")
+        return lower
+
+    def impls(self, *values: int) -> list[Implementation]:
+        return [
+            Implementation(name=f"conv{i}", type="conv", attributes={"a": a})
+            for i, a in enumerate(values)
+        ]
+
+    def test_first_build_writes_all_files(self, tmp_path, lower):
+        report = lower.build(self.impls(1, 2), tmp_path)
+        assert {"conv0.vhd", "conv1.vhd", "pkg.vhd"} == {p.name for p in report.changed}
+        assert "-- 2\n" == (tmp_path / "conv1.vhd").read_text()
+
+    def test_unchanged_implementations_are_not_lowered_again(
+        self, tmp_path, lower, calls
+    ):
+        lower.build(self.impls(1, 2), tmp_path)
+        mtime = (tmp_path / "conv0.vhd").stat().st_mtime_ns
+        calls.clear()
+        report = lower.build(self.impls(1, 3), tmp_path)
+        assert ["conv1"] == calls
+        assert [tmp_path / "conv1.vhd"] == report.changed
+        assert mtime == (tmp_path / "conv0.vhd").stat().st_mtime_ns
+
+    def test_equal_output_keeps_file_untouched(self, tmp_path, calls):
+        lower = Ir2Vhdl()
+        lower.register("conv", lambda impl: (impl.name, ["-- same"]))
+        lower.build(self.impls(1), tmp_path)
+        report = lower.build(self.impls(2), tmp_path)
+        assert [tmp_path / "conv0.vhd"] == report.unchanged
+        assert [] == report.changed
+
+    def test_modified_outputs_are_written_again(self, tmp_path, lower, calls):
+        lower.build(self.impls(1), tmp_path)
+        (tmp_path / "conv0.vhd").write_text("-- edited by hand\n")
+        calls.clear()
+        report = lower.build(self.impls(1), tmp_path)
+        assert ["conv0"] == calls
+        assert [tmp_path / "conv0.vhd"] == report.changed
+        assert "-- 1\n" == (tmp_path / "conv0.vhd").read_text()
+
+    def test_changed_handler_version_rebuilds(self, tmp_path, lower, calls):
+        lower.build(self.impls(1), tmp_path)
+        other = Ir2Vhdl()
+
+        def conv(impl: Implementation) -> Code:
+            calls.append(impl.name)
+            return impl.name, [f"-- {impl.attributes['a']}"]
+
+        conv.version = 2  # type: ignore[attr-defined]
+        other.register("conv", conv)
+        calls.clear()
+        other.build(self.impls(1), tmp_path)
+        assert ["conv0"] == calls
+
+    def test_files_of_removed_implementations_are_reported_as_stale(
+        self, tmp_path, lower
+    ):
+        lower.build(self.impls(1, 2), tmp_path)
+        report = lower.build(self.impls(1), tmp_path)
+        assert [tmp_path / "conv1.vhd"] == report.stale
+
+    def test_attributes_with_numpy_scalars_can_be_built(self, tmp_path, lower, calls):
+        impls = [
+            Implementation(name="conv0", type="conv", attributes={"a": np.int64(1)})
+        ]
+        lower.build(impls, tmp_path)
+        calls.clear()
+        lower.build(impls, tmp_path)
+        assert [] == calls
+        assert "-- 1\n" == (tmp_path / "conv0.vhd").read_text()
+
+    def test_failing_handler_leaves_no_temporary_file(self, tmp_path):
+        lower = Ir2Vhdl()
+
+        def fail(impl: Implementation, out: CodeWriter) -> None:
+            out.write_line("-- partial")
+            raise RuntimeError("handler failed")
+
+        lower.register_streaming("conv", fail)
+        with raises(RuntimeError):
+            lower.build(self.impls(1), tmp_path)
+        assert [] == list(tmp_path.glob("*.tmp"))
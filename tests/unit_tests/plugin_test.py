@@ -1,7 +1,6 @@
-from abc import abstractmethod
 from collections.abc import Iterable, Iterator
-from importlib import import_module
-from typing import Generic, NamedTuple, Protocol, TypeVar, cast
+from dataclasses import dataclass, field
+from importlib.metadata import EntryPoint
 
 import pytest
 
@@ -25,6 +24,42 @@ def test_importing_plugin_with_unkown_fields_raises_meaningful_error():
         p.build_plugin_spec(config_from_file, p.PluginSpec)
 
 
+@dataclass
+class SpecWithOptionalFields(p.PluginSpec):
+    generated: tuple[str, ...]
+    types: dict[str, str] = field(default_factory=dict)
+
+
+SPEC_FIELDS: p.PluginDict = {
+    "name": "my_plugin",
+    "api_version": "0.1",
+    "version": "0.2",
+    "package": "mypackage",
+    "target_platform": "env5",
+    "target_runtime": "vhdl",
+}
+
+
+def test_fields_with_defaults_are_optional():
+    spec = p.build_plugin_spec(
+        SPEC_FIELDS | {"generated": ["a"]}, SpecWithOptionalFields
+    )
+    assert (("a",), {}) == (spec.generated, spec.types)
+
+
+def test_tables_are_passed_as_dicts():
+    spec = p.build_plugin_spec(
+        SPEC_FIELDS | {"generated": ["a"], "types": {"a": "conv"}},
+        SpecWithOptionalFields,
+    )
+    assert {"a": "conv"} == spec.types
+
+
+def test_missing_required_field_raises_error():
+    with pytest.raises(p.MissingFieldError):
+        p.build_plugin_spec(SPEC_FIELDS | {"types": {}}, SpecWithOptionalFields)
+
+
 class MinimalPluginLoader(p.PluginLoader):
     def __init__(self, extract_fn: p.SymbolFetcher):
         super().__init__(extract_fn, self)
@@ -50,3 +85,140 @@ def test_plugin_loader_loads_plugins():
     loader = MinimalPluginLoader(extract_fn)
     loader.load_from_package("")
     assert DummyLoadable.loaded
+
+
+class TestPluginIndex:
+    @pytest.fixture
+    def package(self, tmp_path, monkeypatch) -> str:
+        root = tmp_path / "src"
+        (root / "indexed_plugin").mkdir(parents=True)
+        (root / "indexed_plugin" / "__init__.py").touch()
+        self.write_meta(root, "first")
+        monkeypatch.syspath_prepend(str(root))
+        self.root = root
+        return "indexed_plugin"
+
+    @pytest.fixture
+    def parsed(self, monkeypatch) -> list[str]:
+        parsed: list[str] = []
+        load = p.tomllib.load
+
+        def counting_load(f):
+            parsed.append(f.name)
+            return load(f)
+
+        monkeypatch.setattr(p.tomllib, "load", counting_load)
+        return parsed
+
+    @staticmethod
+    def write_meta(root, name: str) -> None:
+        (root / "indexed_plugin" / "meta.toml").write_text(
+            f'[[plugins]]\nname = "{name}"\ngenerated = ["a", "b"]\n'
+        )
+
+    def test_reads_plugins_with_package(self, package) -> None:
+        assert [
+            {"name": "first", "generated": ["a", "b"], "package": package}
+        ] == p.PluginIndex().read(package)
+
+    def test_unchanged_files_are_parsed_once(self, package, parsed) -> None:
+        index = p.PluginIndex()
+        index.read(package)
+        index.read(package)
+        assert 1 == len(parsed)
+
+    def test_modified_files_are_parsed_again(self, package, parsed) -> None:
+        index = p.PluginIndex()
+        index.read(package)
+        self.write_meta(self.root, "second_version")
+        assert "second_version" == index.read(package)[0]["name"]
+
+    def test_saved_index_is_reused_by_new_index(
+        self, package, parsed, tmp_path
+    ) -> None:
+        cache_file = tmp_path / "cache" / "plugins.json"
+        first = p.PluginIndex(cache_file)
+        first.read(package)
+        first.save()
+        assert first.read(package) == p.PluginIndex(cache_file).read(package)
+        assert 1 == len(parsed)
+
+    def test_packages_without_meta_toml_have_no_plugins(self) -> None:
+        assert [] == p.PluginIndex().read("elasticai.creator.ir")
+
+    def test_default_cache_file_is_in_user_cache_dir(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        monkeypatch.delenv(p.CACHE_FILE_VARIABLE, raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert (
+            tmp_path / "elasticai.creator" / "plugin_index.json"
+            == p.default_cache_file()
+        )
+
+    def test_default_cache_file_can_be_overridden(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv(p.CACHE_FILE_VARIABLE, str(tmp_path / "index.json"))
+        assert tmp_path / "index.json" == p.default_cache_file()
+        monkeypatch.setenv(p.CACHE_FILE_VARIABLE, "")
+        assert p.default_cache_file() is None
+
+
+class TestPluginRegistry:
+    PACKAGES = (
+        "tests.integration_tests.minimal_plugin",
+        "tests.integration_tests.ir2vhdl_plugin",
+    )
+
+    @pytest.fixture
+    def lookups(self, monkeypatch) -> list[str]:
+        lookups: list[str] = []
+
+        def entry_points(group: str) -> list[EntryPoint]:
+            lookups.append(group)
+            return [
+                EntryPoint(name=f"plugin_{i}", value=package, group=group)
+                for i, package in enumerate(self.PACKAGES + self.PACKAGES)
+            ]
+
+        monkeypatch.setattr(p, "_entry_points", entry_points)
+        return lookups
+
+    def test_packages_are_sorted_without_duplicates(self, lookups) -> None:
+        assert tuple(sorted(self.PACKAGES)) == p.PluginRegistry().packages()
+
+    def test_entry_points_are_looked_up_once(self, lookups) -> None:
+        registry = p.PluginRegistry()
+        registry.packages()
+        registry.plugin_dicts()
+        assert [p.ENTRY_POINT_GROUP] == lookups
+
+    def test_refresh_looks_up_entry_points_again(self, lookups) -> None:
+        registry = p.PluginRegistry()
+        registry.packages()
+        registry.refresh()
+        registry.packages()
+        assert 2 == len(lookups)
+
+    def test_plugin_dicts_are_read_for_each_package(self, lookups) -> None:
+        dicts = p.PluginRegistry(max_workers=2).plugin_dicts()
+        assert {
+            package: [d["name"] for d in dicts[package]] for package in self.PACKAGES
+        } == {
+            "tests.integration_tests.minimal_plugin": [
+                "minimal_plugin",
+                "lowering_pass_plugin",
+            ],
+            "tests.integration_tests.ir2vhdl_plugin": ["ir2vhdl_plugin"],
+        }
+
+    def test_loader_loads_all_discovered_packages(self, lookups) -> None:
+        loaded: list[str] = []
+
+        class RecordingLoader(p.PluginLoader):
+            def load_from_package(self, package: str) -> None:
+                loaded.append(package)
+
+        RecordingLoader(lambda data: iter(()), None).load_from_entry_points(
+            p.PluginRegistry()
+        )
+        assert sorted(self.PACKAGES) == loaded